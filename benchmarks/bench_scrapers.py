@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing and extraction over the saved project pages.
+
+usage: bench_scrapers.py [-n REPEAT] [-p PARSER] [DIR]
+
+Nothing is fetched: every page in DIR (tests/fixtures by default) is parsed,
+indexed, extracted into a project model and run through the scrapers
+`hippodir` and `hippodoc` would use for it, and the time spent in each stage
+is reported along with the overall throughput in projects per second.
+"""
+import argparse
+import collections
+import contextlib
+import io
+import pathlib
+import sys
+import time
+
+HERE = pathlib.Path(__file__).parent.resolve()
+
+sys.path.insert(0, str(HERE.parent))
+
+from hipposcraper import scrapers  # noqa: E402
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('dirname', metavar='DIR', nargs='?',
+                        default=str(HERE.parent / 'tests' / 'fixtures'),
+                        help='directory of saved project pages')
+    parser.add_argument('-n', '--repeat', metavar='N', type=int, default=20,
+                        help='number of passes over the pages')
+    parser.add_argument('-p', '--parser', metavar='PARSER', default=None,
+                        help='HTML parser backend (default: fastest)')
+    return parser.parse_args()
+
+
+def load_pages(dirname):
+    """Read every saved project page in a directory."""
+    return {
+        path.stem: path.read_bytes()
+        for path in sorted(pathlib.Path(dirname).glob('*.html'))
+    }
+
+
+def bench(pages, repeat, parser=None):
+    """Time each stage of scraping.
+
+    Returns:
+        timings (dict): seconds spent and number of calls, per stage
+    """
+    timings = collections.OrderedDict()
+
+    def timed(stage, func, *args, **kwgs):
+        """Call a function, adding the time it takes to a stage."""
+        start = time.perf_counter()
+        result = func(*args, **kwgs)
+        seconds, calls = timings.get(stage, (0.0, 0))
+        timings[stage] = (seconds + time.perf_counter() - start, calls + 1)
+        return result
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            for markup in pages.values():
+                soup = timed('parse', scrapers.make_soup, markup, parser)
+                index = timed('index', scrapers.PageIndex, soup)
+                project = timed('extract', scrapers.extract_project, soup,
+                                index)
+                scraper_class = scrapers.find_scraper(project.project_type)
+                timed(scraper_class.__name__, scraper_class, project)
+                timed('TestFileScraper', scrapers.TestFileScraper, project)
+                timed('ReadScraper', scrapers.ReadScraper, project)
+    return timings
+
+
+def main():
+    """Benchmark parsing and extraction."""
+    args = parse_args()
+    pages = load_pages(args.dirname)
+    if not pages:
+        print('No pages found in {}'.format(args.dirname), file=sys.stderr)
+        return 1
+    parser = scrapers.find_parser(args.parser)
+    timings = bench(pages, args.repeat, parser)
+    count = len(pages) * args.repeat
+    total = sum(seconds for seconds, _ in timings.values())
+    print('{} pages x {} passes, parser: {}'.format(
+        len(pages), args.repeat, parser
+    ))
+    print('{:<16} {:>8} {:>10} {:>14}'.format(
+        'stage', 'calls', 'total (s)', 'per call (ms)'
+    ))
+    for stage, (seconds, calls) in timings.items():
+        print('{:<16} {:>8} {:>10.3f} {:>14.3f}'.format(
+            stage, calls, seconds, 1000 * seconds / calls
+        ))
+    print('{:<16} {:>8} {:>10.3f} {:>14.3f}'.format(
+        'total', count, total, 1000 * total / count
+    ))
+    print('throughput: {:.1f} projects/sec'.format(count / total))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark how long the command line tools take to start.
+
+usage: bench_startup.py [-n REPEAT] [--budget MS]
+
+Each command is run REPEAT times in a fresh interpreter, the way a console
+script would run it, and the best and median wall times are reported next
+to those of an interpreter that does nothing. With --budget, the exit
+status is 1 if any command takes longer than MS milliseconds more than the
+bare interpreter (best of REPEAT runs).
+"""
+import argparse
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = pathlib.Path(__file__).parent.resolve()
+
+COMMANDS = (
+    ('python', 'pass'),
+    ('import', 'import hipposcraper'),
+    ('hippoconfig --help', 'import sys, hipposcraper; '
+                           'sys.argv[1:] = ["--help"]; '
+                           'hipposcraper.hippoconfig()'),
+    ('hippodir --help', 'import sys, hipposcraper; '
+                        'sys.argv[1:] = ["--help"]; '
+                        'hipposcraper.hippodir()'),
+    ('hipposcraper --help', 'import sys, hipposcraper; '
+                            'sys.argv[1:] = ["--help"]; '
+                            'hipposcraper.hipposcraper()'),
+    ('hippotest --help', 'import sys, hipposcraper; '
+                         'sys.argv[1:] = ["--help"]; '
+                         'hipposcraper.hippotest()'),
+    ('hippocheck --help', 'import sys, hipposcraper; '
+                          'sys.argv[1:] = ["--help"]; '
+                          'hipposcraper.hippocheck()'),
+)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--repeat', metavar='N', type=int, default=20,
+                        help='number of runs of each command')
+    parser.add_argument('--budget', metavar='MS', type=float, default=None,
+                        help='fail if a command adds more than MS ms')
+    return parser.parse_args()
+
+
+def bench(code, repeat):
+    """Time runs of a fresh interpreter.
+
+    Returns:
+        seconds (list): wall time of each run
+    """
+    env = dict(os.environ, PYTHONPATH=str(HERE.parent))
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def main():
+    """Benchmark startup time."""
+    args = parse_args()
+    print('{} runs each, {}'.format(args.repeat, sys.executable))
+    print('{:<22} {:>10} {:>12} {:>12}'.format(
+        'command', 'best (ms)', 'median (ms)', 'added (ms)'
+    ))
+    status = 0
+    base = None
+    for name, code in COMMANDS:
+        seconds = bench(code, args.repeat)
+        best = 1000 * min(seconds)
+        if base is None:
+            base = best
+        print('{:<22} {:>10.1f} {:>12.1f} {:>12.1f}'.format(
+            name, best, 1000 * statistics.median(seconds), best - base
+        ))
+        if args.budget is not None and best - base > args.budget:
+            status = 1
+    if status:
+        print('over budget: {:.0f} ms'.format(args.budget), file=sys.stderr)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark cutting test files out of the examples of project pages.
+
+usage: bench_test_files.py [-n REPEAT] [-e EXAMPLES] [DIR]
+
+The examples of every page in DIR (tests/fixtures by default) are padded
+with generated examples in each language of `test_file_scraper.LANGUAGES`
+(and HTML) up to EXAMPLES per page, as on projects with many tasks. Each
+page is then run through `find_test_file` REPEAT times, and the time per
+example and the throughput are reported.
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import pathlib
+import sys
+import time
+
+HERE = pathlib.Path(__file__).parent.resolve()
+
+sys.path.insert(0, str(HERE.parent))
+
+from hipposcraper import scrapers  # noqa: E402
+from hipposcraper.scrapers.test_file_scraper import (  # noqa: E402
+    HTML, LANGUAGES, find_test_file
+)
+
+PROMPT = 'user@ubuntu:~/0x00-project$ '
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('dirname', metavar='DIR', nargs='?',
+                        default=str(HERE.parent / 'tests' / 'fixtures'),
+                        help='directory of saved project pages')
+    parser.add_argument('-n', '--repeat', metavar='N', type=int, default=20,
+                        help='number of passes over the pages')
+    parser.add_argument('-e', '--examples', metavar='N', type=int,
+                        default=200, help='number of examples per page')
+    return parser.parse_args()
+
+
+def make_example(number, language):
+    """Generate an example showing a test file, then running it."""
+    if language is HTML:
+        name = '{}-index.html'.format(number)
+    else:
+        name = '{}-main{}'.format(number, language.extension)
+    body = ''.join('line {} of the test file\n'.format(line)
+                   for line in range(20))
+    output = ''.join('line {} of the output\n'.format(line)
+                     for line in range(10))
+    return '{0}cat {1}\n{2}{0}./{1}\n{3}{0}\n'.format(
+        PROMPT, name, body, output
+    )
+
+
+def load_examples(dirname, count):
+    """Get the examples of every saved project page in a directory."""
+    pages = []
+    languages = itertools.cycle(LANGUAGES + (HTML,))
+    for path in sorted(pathlib.Path(dirname).glob('*.html')):
+        project = scrapers.extract_project(
+            scrapers.make_soup(path.read_bytes())
+        )
+        examples = list(project.examples)
+        while len(examples) < count:
+            examples.append(make_example(len(examples), next(languages)))
+        pages.append(examples)
+    return pages
+
+
+def main():
+    """Benchmark cutting out test files."""
+    args = parse_args()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pages = load_examples(args.dirname, args.examples)
+    if not pages:
+        print('No pages found in {}'.format(args.dirname), file=sys.stderr)
+        return 1
+    count = sum(len(examples) for examples in pages) * args.repeat
+    size = sum(len(example) for examples in pages for example in examples)
+    size *= args.repeat
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for examples in pages:
+            for example in examples:
+                try:
+                    find_test_file(example)
+                except ValueError:
+                    pass
+    seconds = time.perf_counter() - start
+    print('{} pages x {} examples x {} passes'.format(
+        len(pages), args.examples, args.repeat
+    ))
+    print('per example: {:.2f} us'.format(1e6 * seconds / count))
+    print('throughput: {:.0f} examples/sec, {:.1f} MB/s'.format(
+        count / seconds, size / seconds / 1e6
+    ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Load-test the hipposcraper entry point against the stand-in intranet.
+
+usage: loadtest.py [-n PROJECTS] [-j JOBS] [--latency S] [--error-rate F]
+                   [--rate-limit RPS] [DIR]
+
+The stand-in (hipposcraper.standin) serves every page in DIR (tests/fixtures
+by default) as PROJECTS distinct projects. The hipposcraper entry point is
+then run once over all of them, with throwaway config, cache and output
+directories, and the wall time, throughput and requests seen by the
+stand-in are reported.
+"""
+import argparse
+import itertools
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = pathlib.Path(__file__).parent.resolve()
+
+sys.path.insert(0, str(HERE.parent))
+
+from hipposcraper.standin import StandIn  # noqa: E402
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('dirname', metavar='DIR', nargs='?',
+                        default=str(HERE.parent / 'tests' / 'fixtures'),
+                        help='directory of saved project pages')
+    parser.add_argument('-n', '--projects', metavar='N', type=int,
+                        default=50, help='number of projects to scrape')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=4,
+                        help='number of projects to scrape at once')
+    parser.add_argument('--latency', metavar='SECONDS', type=float,
+                        default=0.05, help='average latency to inject')
+    parser.add_argument('--error-rate', metavar='FRACTION', type=float,
+                        default=0.0,
+                        help='fraction of requests to fail with a 5xx error')
+    parser.add_argument('--rate-limit', metavar='RPS', type=float,
+                        default=None,
+                        help='requests per second before answering 429')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='show the output of the hipposcraper')
+    return parser.parse_args()
+
+
+def project_urls(server, names, count):
+    """Get the URLs of `count` distinct copies of the saved pages."""
+    names = itertools.cycle(names)
+    return [server.url(next(names), copy) for copy in range(count)]
+
+
+def write_credentials(dirname):
+    """Write credentials the stand-in accepts to a config directory."""
+    config = pathlib.Path(dirname, 'hipposcraper')
+    config.mkdir(parents=True)
+    (config / 'credentials.json').write_text(json.dumps({
+        'author': 'Betty Holberton',
+        'github_username': 'bettyholberton',
+        'holberton_username': 'betty',
+        'holberton_password': 'hunter2',
+    }))
+
+
+def main():
+    """Run the hipposcraper against the stand-in and report the results."""
+    args = parse_args()
+    names = sorted(path.stem for path in pathlib.Path(args.dirname).glob(
+        '*.html'
+    ))
+    if not names:
+        print('No pages found in {}'.format(args.dirname), file=sys.stderr)
+        return 1
+    server = StandIn(args.dirname, latency=args.latency,
+                     error_rate=args.error_rate, rate_limit=args.rate_limit)
+    with server, tempfile.TemporaryDirectory() as tmp:
+        urls = project_urls(server, names, args.projects)
+        write_credentials(os.path.join(tmp, 'config'))
+        output = os.path.join(tmp, 'output')
+        os.mkdir(output)
+        env = dict(
+            os.environ,
+            HIPPOSCRAPER_BASE_URL=server.base_url,
+            XDG_CONFIG_HOME=os.path.join(tmp, 'config'),
+            XDG_CACHE_HOME=os.path.join(tmp, 'cache'),
+            PYTHONPATH=os.pathsep.join(
+                filter(None, (str(HERE.parent), os.getenv('PYTHONPATH')))
+            ),
+        )
+        command = [sys.executable, '-m', 'hipposcraper.hipposcraper',
+                   '--jobs', str(args.jobs), '--from-file', '-']
+        start = time.perf_counter()
+        proc = subprocess.run(
+            command, cwd=output, env=env, input=''.join(
+                url + '\n' for url in urls
+            ), universal_newlines=True,
+            stdout=None if args.verbose else subprocess.DEVNULL,
+            stderr=None if args.verbose else subprocess.DEVNULL,
+        )
+        seconds = time.perf_counter() - start
+        # Every project directory created gets a manifest
+        created = sum(1 for _, _, names in os.walk(output)
+                      if '.hipposcraper.json' in names)
+        stats = server.stats()
+    print('{} projects, {} jobs, latency {:.3f}s'.format(
+        len(urls), args.jobs, args.latency
+    ))
+    print('exit status: {}'.format(proc.returncode))
+    print('projects created: {}'.format(created))
+    print('wall time: {:.3f}s'.format(seconds))
+    print('throughput: {:.1f} projects/sec'.format(len(urls) / seconds))
+    print('logins: {}'.format(stats['logins']))
+    for request, count in sorted(stats['requests'].items()):
+        print('{:<32} {:>8}'.format(request, count))
+    return proc.returncode
+
+
+if __name__ == '__main__':
+    sys.exit(main())
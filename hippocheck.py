@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Check it.
+
+usage: hippocheck.py [DIR ...]
+"""
+import sys
+
+import hipposcraper
+
+
+if __name__ == '__main__':
+    sys.exit(hipposcraper.hippocheck())
@@ -5,17 +5,28 @@ Create Holberton School project skeletons and documentation.
 import os
 import logging
 
-from . hipposcraper import hipposcraper
-from . hippodir import hippodir
-from . hippodoc import hippodoc
-from . hippoconfig import hippoconfig
+# Defined before the entry points are imported, which log through it
+LOGGER = logging.getLogger(__name__)
+
+from . hipposcraper import hipposcraper  # noqa: E402
+from . hippodir import hippodir  # noqa: E402
+from . hippodoc import hippodoc  # noqa: E402
+from . hippotest import hippotest  # noqa: E402
+from . hippocheck import hippocheck  # noqa: E402
+from . hippoconfig import hippoconfig  # noqa: E402
 
 __license__ = 'GPL3'
 __version__ =  '2.1.1'
 
-LOGGER = logging.getLogger(__name__)
+BASE_URL = os.getenv('HIPPOSCRAPER_BASE_URL',
+                     'https://intranet.hbtn.io').rstrip('/')
 
 CONFIG_HOME = os.path.join(os.path.abspath(os.getenv(
     'XDG_CONFIG_HOME',
     os.path.join(os.path.expanduser('~'), '.config')
 )), __package__)
+
+CACHE_HOME = os.path.join(os.path.abspath(os.getenv(
+    'XDG_CACHE_HOME',
+    os.path.join(os.path.expanduser('~'), '.cache')
+)), __package__)
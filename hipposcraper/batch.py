@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Read the projects to scrape from a file or standard input, and run the
+tools that scrape them.
+
+A project list is either plain text, with one URL per line optionally
+followed by an output directory, or a manifest:
+
+    text:  URL [DIR]    (blank lines and lines starting with # are skipped)
+    csv:   url,dir      (a header row naming the columns is required)
+    json:  [{"url": URL, "dir": DIR}, ...], or one such object per line
+
+In a manifest, a project may also be given by its URL alone. Output
+directories are relative to the current directory (default: itself).
+Projects are read one at a time, so work on the first ones can start
+before the whole list has been read (except for a JSON array, which is
+read at once).
+"""
+import collections
+import contextlib
+import csv
+import json
+import os
+import sys
+
+import hipposcraper
+from . config import Cookies, Credentials
+from . hippoconfig import create_config
+from . import LOGGER
+from . import console
+from . import metrics
+from . import runner
+from . import scrapers
+
+Project = collections.namedtuple('Project', ['url', 'root'])
+Project.__doc__ = """Project to scrape, and the directory to write it in."""
+
+FORMATS = ('text', 'csv', 'json')
+
+
+def guess_format(path):
+    """Guess the format of a project list from its file name."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext in ('.json', '.jsonl', '.ndjson'):
+        return 'json'
+    return 'text'
+
+
+def make_project(entry):
+    """Make a Project from a manifest entry (a URL or a mapping).
+
+    Raises:
+        ValueError: if the entry has no URL
+    """
+    if isinstance(entry, str):
+        entry = {'url': entry}
+    if not isinstance(entry, dict) or not entry.get('url'):
+        raise ValueError('Bad project entry: {!r}'.format(entry))
+    return Project(entry['url'].strip(), entry.get('dir') or '.')
+
+
+def read_text(stream):
+    """Read projects from lines of URLs, each optionally followed by a DIR."""
+    for line in stream:
+        fields = line.split(None, 1)
+        if not fields or fields[0].startswith('#'):
+            continue
+        root = fields[1].strip() if len(fields) > 1 else '.'
+        yield Project(fields[0], root)
+
+
+def read_csv(stream):
+    """Read projects from CSV rows with `url` and (optional) `dir` columns."""
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None:
+        return
+    if 'url' not in reader.fieldnames:
+        raise ValueError('CSV project list has no url column.')
+    for row in reader:
+        if row.get('url') and row['url'].strip():
+            yield make_project(row)
+
+
+def read_json(stream):
+    """Read projects from a JSON array or from one JSON value per line."""
+    for line in stream:
+        if not line.strip():
+            continue
+        if line.lstrip().startswith('['):
+            # A JSON array has to be read whole
+            for entry in json.loads(line + stream.read()):
+                yield make_project(entry)
+            return
+        yield make_project(json.loads(line))
+
+
+READERS = {'text': read_text, 'csv': read_csv, 'json': read_json}
+
+
+def read_projects(stream, fmt='text'):
+    """Read projects from a stream, one at a time.
+
+    Args:
+        stream (obj): text stream to read
+        fmt (str): format of the project list (see `FORMATS`)
+
+    Raises:
+        ValueError: if the project list is malformed
+    """
+    return READERS[fmt](stream)
+
+
+def projects(urls=(), path=None, fmt=None, errors=None):
+    """Get the projects given as arguments, then those listed in a file.
+
+    If the file cannot be read, or is malformed, the error is reported (and
+    added to `errors`, if given) and no more projects are read from it.
+
+    Args:
+        urls (list): project URLs, written in the current directory
+        path (str): file listing more projects ('-' for standard input)
+        fmt (str): format of the file (default: guessed from its name)
+        errors (list): list to add an error reading the file to
+    """
+    for url in urls:
+        yield Project(url, '.')
+    if path is None:
+        return
+    try:
+        if path == '-':
+            yield from read_projects(sys.stdin, fmt or 'text')
+            return
+        with open(path, 'r', newline='') as istream:
+            yield from read_projects(istream, fmt or guess_format(path))
+    except (OSError, ValueError, csv.Error) as err:
+        LOGGER.error('[ERROR]: {}: {}'.format(path, err))
+        if errors is not None:
+            errors.append(err)
+
+
+def error_kind(err):
+    """Get the stage an error belongs to: auth, fetch, parse or write.
+
+    Errors raised by the scrapers name their own stage (see
+    `scrapers.ScraperError`); other OS errors are taken to be write errors.
+    Anything else is an unexpected "error".
+    """
+    kind = getattr(err, 'kind', None)
+    if kind is not None:
+        return kind
+    if isinstance(err, OSError):
+        return 'write'
+    return 'error'
+
+
+class Result:
+    """Result class
+
+    Outcome of scraping one project.
+
+    Args:
+        project (obj): Project scraped
+
+    Attributes:
+        project (obj): Project scraped
+        errors (list): exceptions raised by the steps that failed
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.errors = []
+
+    @property
+    def ok(self):
+        """Check whether every step succeeded."""
+        return not self.errors
+
+    @property
+    def kinds(self):
+        """Get the stages that failed (see `error_kind`)."""
+        return [error_kind(err) for err in self.errors]
+
+    @property
+    def message(self):
+        """Describe what went wrong."""
+        return '; '.join(
+            '{}: {}'.format(error_kind(err), err) for err in self.errors
+        )
+
+    @contextlib.contextmanager
+    def step(self):
+        """Run a step of the project, reporting and recording any error.
+
+        Errors do not escape, so one project failing never stops the
+        others. A traceback is logged for unexpected errors.
+        """
+        try:
+            yield
+        except Exception as err:
+            self.errors.append(err)
+            if error_kind(err) == 'error':
+                LOGGER.error('[ERROR]: {}'.format(self.project.url),
+                             exc_info=True)
+            elif getattr(err, 'args', False):
+                LOGGER.error('[ERROR]: {}'.format(err))
+
+
+def summarize(results, file=None):
+    """Print a count of projects done and failed, then the status of each.
+
+    Args:
+        results (list): Result of each project
+        file (obj): stream to print to (default: standard output)
+    """
+    file = file or sys.stdout
+    failed = sum(1 for result in results if not result.ok)
+    print('Summary: {} projects, {} done, {} failed'.format(
+        len(results), len(results) - failed, failed
+    ), file=file)
+    for result in results:
+        if result.ok:
+            print('  [DONE]   {} -> {}'.format(
+                result.project.url, result.project.root
+            ), file=file)
+        else:
+            print('  [FAILED] {} ({})'.format(
+                result.project.url, result.message
+            ), file=file)
+
+
+def write_failed(results, path):
+    """Write the projects that failed to a file, to retry with --from-file.
+
+    Returns:
+        count (int): number of projects written
+    """
+    failed = [result.project for result in results if not result.ok]
+    with open(path, 'w') as ostream:
+        for project in failed:
+            print(project.url, project.root, file=ostream)
+    return len(failed)
+
+
+def report(results, errors=(), failed=None, file=None):
+    """Finish a run: summarize it and get its exit status.
+
+    A summary is printed if more than one project was scraped. Projects
+    that failed are written to the file `failed`, if given.
+
+    Args:
+        results (list): Result of each project
+        errors (list): errors reading the project list
+        failed (str): path of a file to write the failed projects to
+        file (obj): stream to print the summary to (default: standard
+            output)
+
+    Returns:
+        status (int): 0 if every project succeeded, else 1
+    """
+    if len(results) > 1:
+        summarize(results, file)
+    if failed is not None:
+        try:
+            write_failed(results, failed)
+        except OSError as err:
+            LOGGER.error('[ERROR]: {}: {}'.format(failed, err))
+            return 1
+    if errors or not all(result.ok for result in results):
+        return 1
+    return 0
+
+
+def add_project_arguments(parser):
+    """Add the arguments naming the projects of a run to a parser."""
+    parser.add_argument(metavar='URL', nargs='*', dest='urls',
+                        help='URLs of projects on intranet.hbtn.io')
+    parser.add_argument('-f', '--from-file', metavar='FILE', default=None,
+                        help='read more projects from FILE (- for stdin)')
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help='format of FILE (default: guessed from its name)')
+    parser.add_argument('--failed', metavar='FILE', default=None,
+                        help='write projects that failed to FILE, to retry')
+
+
+def add_arguments(parser):
+    """Add the arguments shared by the tools that scrape projects."""
+    add_project_arguments(parser)
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=1,
+                        help='number of projects to scrape at once')
+    parser.add_argument('--offline', action='store_true',
+                        help='only use project pages cached by earlier runs')
+    parser.add_argument('--force', action='store_true',
+                        help='overwrite generated files you have edited')
+    parser.add_argument('--connect-timeout', metavar='SECONDS', type=float,
+                        default=5.0, help='time to wait for a connection')
+    parser.add_argument('--timeout', metavar='SECONDS', type=float,
+                        default=30.0, help='time to wait for a response')
+    parser.add_argument('--retries', metavar='N', type=int, default=3,
+                        help='number of times to retry a failed request')
+    parser.add_argument('--metrics-json', metavar='FILE', default=None,
+                        help='write time and bytes per stage to FILE '
+                        '(- for stdout)')
+    parser.add_argument('--profile', metavar='FILE', default=None,
+                        help='dump cProfile statistics to FILE '
+                        '(implies --jobs 1)')
+    parser.add_argument('-q', '--quiet', action='count', default=0,
+                        help='report less (errors and warnings only)')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='report more (repeat to report every action)')
+
+
+def parse_args(parser):
+    """Parse command line arguments added by `add_arguments`."""
+    args = parser.parse_args()
+    if not args.urls and args.from_file is None:
+        parser.error('no projects given (pass URLs or use --from-file)')
+    if getattr(args, 'profile', None) is not None:
+        # cProfile only sees the thread it runs in
+        args.jobs = 1
+    return args
+
+
+def load_credentials():
+    """Load the user credentials, asking for them if there are none."""
+    try:
+        return Credentials(load=True)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return create_config()
+
+
+def main(args, scrape, title=None):
+    """Run a tool over every project given on the command line.
+
+    Projects share one signed-in session (see `scrapers.IntranetSession`)
+    and one cache of project models, and are scraped `args.jobs` at a time
+    (see `runner.run`).
+
+    Args:
+        args (obj): arguments parsed by `parse_args`
+        scrape (obj): function called with the Result of each project, the
+            session and the ModelCache, that runs the steps of the project
+            (see `Result.step`)
+        title (str): name of the tool to report with its version
+
+    Returns:
+        status (int): exit status of the run (see `report`)
+    """
+    # A run of several projects reports one level less, keeping a progress
+    # line and a summary instead
+    several = args.from_file is not None or len(args.urls) > 1
+    console.configure(args.verbose - args.quiet - several)
+    if title is not None:
+        LOGGER.info("{} (v{})".format(title, hipposcraper.__version__))
+    user_data = load_credentials()
+    models = scrapers.ModelCache()
+    errors = []
+    with metrics.collect(args.metrics_json, args.profile), \
+         console.progress(several and not args.quiet) as progress, \
+         scrapers.IntranetSession(credentials=user_data,
+                                  pool_size=args.jobs,
+                                  cache=scrapers.PageCache(),
+                                  offline=args.offline,
+                                  cookie_store=Cookies(),
+                                  timeout=(args.connect_timeout,
+                                           args.timeout),
+                                  retries=args.retries) as session:
+        def work(project):
+            """Scrape one project and return its Result."""
+            result = Result(project)
+            with metrics.project(project.url):
+                scrape(result, session, models)
+            return result
+        results = runner.run(work,
+                             projects(args.urls, args.from_file,
+                                      args.format, errors),
+                             jobs=args.jobs, progress=progress)
+    # Keep standard output for the metrics alone when they are written there
+    summary = sys.stderr if args.metrics_json == '-' else None
+    return report([result for _, result in results], errors, args.failed,
+                  summary)
@@ -2,4 +2,5 @@
 """
 Configure hipposcraper user settings.
 """
+from . cookies import Cookies
 from . credentials import Credentials
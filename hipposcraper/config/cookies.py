@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Configure saved intranet session cookies.
+"""
+import json
+import os
+
+import hipposcraper
+
+
+class Cookies:
+    """
+    Save and load the cookies of a signed-in intranet session.
+
+    Cookies are saved next to the credentials file, readable only by the
+    owner, so later runs can skip the sign-in flow.
+    """
+    __basename = 'cookies.json'
+
+    @property
+    def basename(self):
+        """Get the name of the cookies file."""
+        return self.__basename
+
+    @property
+    def dirname(self):
+        """Get a path to the config directory."""
+        return hipposcraper.CONFIG_HOME
+
+    @property
+    def path(self):
+        """Get a path to the cookies file."""
+        return os.path.join(self.dirname, self.basename)
+
+    def save(self, jar, ignore_errors=()):
+        """Save the cookies in a jar and return the path."""
+        ignore_errors = tuple(ignore_errors)
+        cookies = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'secure': cookie.secure,
+                'expires': cookie.expires,
+            }
+            for cookie in jar
+        ]
+        try:
+            os.makedirs(self.dirname, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                         0o600)
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, 'w') as ostream:
+                print(json.dumps(cookies), file=ostream)
+        except ignore_errors:
+            pass
+        return self.path
+
+    def load(self, jar, ignore_errors=()):
+        """Load cookies into a jar and return the path."""
+        ignore_errors = tuple(ignore_errors)
+        try:
+            with open(self.path, 'r') as istream:
+                for cookie in json.load(istream):
+                    jar.set(**cookie)
+        except ignore_errors:
+            pass
+        return self.path
+
+    def clear(self, ignore_errors=()):
+        """Remove saved cookies and return the path."""
+        ignore_errors = tuple(ignore_errors)
+        try:
+            os.remove(self.path)
+        except ignore_errors:
+            pass
+        return self.path
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Show the progress of a run on the console.
+
+Everything the Hipposcraper reports goes through `LOGGER`. Its level is set
+by -q and -v: errors and warnings only, then the steps of each project,
+then every action within a step. On a terminal, a run of several projects
+also keeps a single line at the bottom counting the projects done so far.
+"""
+import contextlib
+import logging
+import shutil
+import sys
+import threading
+
+from . import LOGGER
+
+LEVELS = (logging.WARNING, logging.INFO, logging.DEBUG)
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """
+    Log to whatever standard error is at the time of each record.
+
+    Following `sys.stderr` keeps records in the per-project buffers of
+    `runner.run`, and keeps them in step with any progress line.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        """Get the current standard error."""
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        """Ignore attempts to replace the stream."""
+
+
+class Progress:
+    """
+    Stand in for a console stream, keeping a progress line below the output.
+
+    The line is erased before anything else is written and drawn again
+    after each complete line of output.
+
+    Args:
+        stream (obj): terminal stream to draw on
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.done = 0
+        self.failed = 0
+        self.__line = ''
+        self.__shown = False
+        self.__lock = threading.RLock()
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped stream."""
+        return getattr(self.stream, name)
+
+    def write(self, text):
+        """Write text above the progress line."""
+        with self.__lock:
+            self.__erase()
+            count = self.stream.write(text)
+            if text.endswith('\n'):
+                self.__draw()
+            return count
+
+    def flush(self):
+        """Flush the wrapped stream."""
+        self.stream.flush()
+
+    def update(self, project, result):
+        """Count a finished project and redraw the line."""
+        with self.__lock:
+            if result is not None and result.ok:
+                self.done += 1
+            else:
+                self.failed += 1
+            self.__line = '[{} done, {} failed] {}'.format(
+                self.done, self.failed, project.url
+            )
+            self.__erase()
+            self.__draw()
+
+    def close(self):
+        """Erase the progress line for good."""
+        with self.__lock:
+            self.__erase()
+            self.__line = ''
+
+    def __erase(self):
+        """Erase the progress line if it is shown."""
+        if self.__shown:
+            self.stream.write('\r\033[K')
+            self.__shown = False
+
+    def __draw(self):
+        """Draw the progress line, cut to the width of the terminal."""
+        if self.__line:
+            width = shutil.get_terminal_size().columns - 1
+            self.stream.write(self.__line[:width])
+            self.stream.flush()
+            self.__shown = True
+
+
+def configure(verbosity=0):
+    """Send log records to standard error at the level set by -q and -v.
+
+    Args:
+        verbosity (int): -1 for errors and warnings only, 0 for the steps
+            of each project, 1 or more for every action
+    """
+    level = LEVELS[max(0, min(verbosity + 1, len(LEVELS) - 1))]
+    handler = ConsoleHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    for old in list(LOGGER.handlers):
+        if isinstance(old, ConsoleHandler):
+            LOGGER.removeHandler(old)
+    LOGGER.addHandler(handler)
+    LOGGER.setLevel(level)
+    LOGGER.propagate = False
+    return level
+
+
+@contextlib.contextmanager
+def progress(enabled=True):
+    """Keep a progress line on standard error, if it is a terminal.
+
+    Standard error is replaced by the Progress until the block ends.
+
+    Yields:
+        progress (obj): Progress, or None if it is disabled or there is no
+            terminal
+    """
+    if not enabled or not sys.stderr.isatty():
+        yield None
+        return
+    bar = Progress(sys.stderr)
+    sys.stderr = bar
+    try:
+        yield bar
+    finally:
+        bar.close()
+        sys.stderr = bar.stream
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+hippocheck entry point
+usage: hippocheck.py [DIR ...]
+
+Check the style of the task files in project directories with the linter
+of each language (betty for C, pep8 for Python, semistandard for
+JavaScript), as listed in `scrapers.LINTERS` for check.sh too, several
+files at a time.
+"""
+import argparse
+import collections
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import hipposcraper
+from . scrapers.linters import LINTERS, find_linter
+from . scrapers.manifest import Manifest, digest
+from . scrapers.output_dir import write_cache
+from . import LOGGER
+from . import console
+
+Check = collections.namedtuple('Check', [
+    'path', 'linter', 'status', 'output', 'cached'
+])
+Check.__doc__ = """Outcome of checking one file.
+
+Attributes:
+    path (str): path of the file
+    linter (str): name of the linter that checked it
+    status (str): 'ok', 'fail', 'timeout' or 'error'
+    output (str): what the linter printed
+    cached (bool): whether the outcome was taken from the cache
+"""
+
+
+class CheckCache:
+    """CheckCache class
+
+    On-disk cache of the outcome of checking files, keyed by the hash of
+    the linter command, the file name and the file content. A file is only
+    linted again once it (or the linter command) changes.
+
+    Args:
+        dirname (str): directory to keep cached outcomes in
+
+    Attributes:
+        dirname (str): directory to keep cached outcomes in
+    """
+
+    def __init__(self, dirname=None):
+        if dirname is None:
+            dirname = os.path.join(hipposcraper.CACHE_HOME, 'checks')
+        self.dirname = dirname
+
+    @staticmethod
+    def key(command, path, data):
+        """Get the key of checking a file with a linter command."""
+        return digest(json.dumps([
+            list(command), os.path.basename(path), digest(data)
+        ]))
+
+    def path(self, key):
+        """Get the path of the cache file for a key."""
+        return os.path.join(self.dirname, key + '.json')
+
+    def load(self, key):
+        """Load a cached outcome.
+
+        Returns:
+            outcome (tuple): status and output, or None if not cached
+        """
+        try:
+            with open(self.path(key), 'r') as istream:
+                data = json.load(istream)
+            return data['status'], data['output']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, key, status, output):
+        """Cache an outcome (see `scrapers.output_dir.write_cache`)."""
+        write_cache(self.path(key),
+                    json.dumps({'status': status, 'output': output}))
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(metavar='DIR', nargs='*', dest='dirs',
+                        default=['.'],
+                        help='project directories (default: .)')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int,
+                        default=os.cpu_count() or 1,
+                        help='number of files to check at once '
+                        '(default: number of CPUs)')
+    parser.add_argument('--timeout', metavar='SECONDS', type=float,
+                        default=60.0, help='time to let each linter run')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='check every file, even if unchanged')
+    parser.add_argument('-q', '--quiet', action='count', default=0,
+                        help='report less (errors and warnings only)')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='report more (repeat to report every action)')
+    return parser.parse_args()
+
+
+def find_command(linter):
+    """Get the first installed command of a linter, or None."""
+    for command in linter.commands:
+        if shutil.which(command[0]) is not None:
+            return command
+    return None
+
+
+def find_files(directory, linters=LINTERS):
+    """Find the files to check in a project directory.
+
+    These are the task files the Hipposcraper generated there, leaving out
+    the test files of examples (see `scrapers.Manifest`), or else every file
+    under the directory, that a linter checks.
+
+    Returns:
+        paths (list): path of each file, in order
+    """
+    names = Manifest(directory).tasks
+    if not names:
+        names = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [name for name in dirnames
+                           if not name.startswith('.')]
+            names.extend(os.path.relpath(os.path.join(dirpath, name),
+                                         directory)
+                         for name in filenames)
+    return sorted(
+        os.path.join(directory, name) for name in names
+        if find_linter(name, linters) is not None and
+        os.path.isfile(os.path.join(directory, name))
+    )
+
+
+def lint(command, path, timeout):
+    """Run a linter command on a file, from the directory of the file.
+
+    Returns:
+        outcome (tuple): status and output of the linter
+    """
+    try:
+        proc = subprocess.run(
+            list(command) + [os.path.basename(path)],
+            cwd=os.path.dirname(path) or os.curdir,
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return 'timeout', 'timed out after {:g} s'.format(timeout)
+    except OSError as err:
+        return 'error', str(err)
+    status = 'ok' if proc.returncode == 0 else 'fail'
+    return status, proc.stdout.decode(errors='replace')
+
+
+def lint_task(task):
+    """Run `lint` with a (command, path, timeout) tuple, in a worker."""
+    return lint(*task)
+
+
+def check(paths, linters=LINTERS, cache=None, jobs=1, timeout=60.0):
+    """Check files with the linter of each one's language.
+
+    Files whose outcome is in `cache` are not linted again. The others are
+    sharded across a pool of `jobs` processes.
+
+    Args:
+        paths (list): paths of the files to check
+        linters (tuple): Linter of each language
+        cache (obj): CheckCache to reuse and keep outcomes in
+        jobs (int): number of files to check at once
+        timeout (float): seconds to let each linter run
+
+    Returns:
+        checks (list): Check of each file a linter is installed for, in
+            the order of `paths`
+    """
+    checks = [None] * len(paths)
+    commands = {}
+    missing = collections.Counter()
+    pending = []
+    for number, path in enumerate(paths):
+        linter = find_linter(path, linters)
+        if linter is None:
+            continue
+        if linter.name not in commands:
+            commands[linter.name] = find_command(linter)
+        command = commands[linter.name]
+        if command is None:
+            missing[linter.name] += 1
+            continue
+        key = None
+        if cache is not None:
+            try:
+                with open(path, 'rb') as istream:
+                    key = cache.key(command, path, istream.read())
+            except OSError as err:
+                checks[number] = Check(path, linter.name, 'error', str(err),
+                                       False)
+                continue
+            outcome = cache.load(key)
+            if outcome is not None:
+                checks[number] = Check(path, linter.name, *outcome, True)
+                continue
+        pending.append((number, linter.name, key, (command, path, timeout)))
+    for name, count in sorted(missing.items()):
+        LOGGER.warning('[SKIP] {} is not installed; {} files not checked'
+                       .format(name, count))
+
+    tasks = [task for _, _, _, task in pending]
+    if jobs <= 1 or len(tasks) <= 1:
+        outcomes = [lint_task(task) for task in tasks]
+    else:
+        import concurrent.futures
+
+        chunksize = max(1, len(tasks) // (4 * jobs))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(lint_task, tasks, chunksize=chunksize))
+    for (number, name, key, task), (status, output) in zip(
+            pending, outcomes):
+        # A timeout may not happen again
+        if cache is not None and status in ('ok', 'fail'):
+            cache.save(key, status, output)
+        checks[number] = Check(task[1], name, status, output, False)
+    return [item for item in checks if item is not None]
+
+
+def report(checks, file=None):
+    """Print the problems found in each file, then a summary.
+
+    Lines of linter output that start with the name of the file checked
+    are given its full path, so they point to the file from here.
+
+    Returns:
+        failed (int): number of files with problems
+    """
+    file = file or sys.stdout
+    failed = 0
+    for item in checks:
+        if item.status == 'ok':
+            LOGGER.info('  [OK] {}'.format(item.path))
+            continue
+        failed += 1
+        head, name = os.path.split(item.path)
+        print('{}: {} ({})'.format(item.path, item.linter, item.status),
+              file=file)
+        for line in item.output.splitlines():
+            if head and line.startswith(name + ':'):
+                line = os.path.join(head, line)
+            print('    {}'.format(line), file=file)
+    cached = sum(1 for item in checks if item.cached)
+    print('Summary: {} files checked ({} unchanged), {} with problems'.format(
+        len(checks), cached, failed
+    ), file=file)
+    return failed
+
+
+def hippocheck():
+    """
+    Entry point for hippocheck
+
+    Checks the style of the task files in each project directory.
+    """
+    args = parse_args()
+    console.configure(args.verbose - args.quiet)
+    LOGGER.info("Hippocheck (v{})".format(hipposcraper.__version__))
+    paths = []
+    for directory in args.dirs:
+        if not os.path.isdir(directory):
+            LOGGER.error('[ERROR]: {}: not a directory'.format(directory))
+            return 1
+        paths.extend(find_files(directory))
+    cache = None if args.no_cache else CheckCache()
+    checks = check(paths, cache=cache, jobs=args.jobs, timeout=args.timeout)
+    if report(checks):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(hippocheck())
@@ -20,11 +20,10 @@ Options:
 import argparse
 import json
 import os
-import pprint
 import sys
 
 import hipposcraper
-from . config import Credentials
+from . config import Cookies, Credentials
 
 
 def parse_kwargs():
@@ -44,6 +43,8 @@ def parse_kwargs():
 
 def create_config(**kwgs):
     """Create and update hipposcraper config."""
+    import pprint
+
     user_data = Credentials(load=False)
     try:
         config_path = user_data.load()
@@ -70,6 +71,8 @@ def create_config(**kwgs):
     print("Saved configuration to {}".format(
         user_data.save().replace(os.path.expanduser('~'), '~', 1)
     ))
+    # Cookies saved for the old credentials no longer apply
+    Cookies().clear(ignore_errors=(FileNotFoundError,))
     return user_data
 
 
@@ -2,74 +2,97 @@
 """
 hippodir entry point
 usage: hippodir.py URL ...
+       hippodir.py --from-file FILE
 """
 import argparse
-import json
+import functools
 import pathlib
 import sys
 
-import hipposcraper
-from . hippoconfig import Credentials, create_config
+from . import LOGGER
+from . import batch
+from . import metrics
 from . import scrapers
 
 
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser()
-    parser.add_argument(metavar='URL', nargs='+', dest='urls',
-                        help='URLs of projects on intranet.hbtn.io')
-    return parser.parse_args()
+    batch.add_arguments(parser)
+    return batch.parse_args(parser)
 
 
-def set_permissions():
+def set_permissions(root='.'):
     """Set file permissions."""
-    print("  -> Setting permissions...")
-    for path in pathlib.Path('.').glob('*'):
+    LOGGER.debug("  -> Setting permissions...")
+    for path in pathlib.Path(root).glob('*'):
         path.chmod(path.stat().st_mode & 0o7777 | 0o100)
-    print("     Done.")
+    LOGGER.debug("     Done.")
 
 
-def create_dir(url, credentials=None):
-    """Create a directory for a project given its URL."""
+@metrics.timed('skeleton')
+def create_dir(url, credentials=None, session=None, project_data=None,
+               root='.', models=None, force=False):
+    """Create a directory for a project given its URL.
 
-    print("Creating project skeleton:")
+    The project page is fetched and parsed unless `project_data` already
+    holds the parsed page (see `scrapers.BaseParse`), reusing the model of
+    an unchanged page from `models` (see `scrapers.ModelCache`). The project
+    directory is created under `root`. If it already exists, only files
+    whose content changed are rewritten and files the user has edited are
+    left alone (see `scrapers.Manifest`); nothing is done if the page has
+    not changed. With `force`, every file is written again, edited or not.
+    """
+
+    LOGGER.info("Creating project skeleton:")
     # Acquiring and parsing project data
-    project_data = scrapers.BaseParse(url, credentials=credentials)
-    project_type = project_data.project_type_check()
-
-    # Creating scraping objects
-    if project_type.endswith("low_level_programming"):
-        scraper = scrapers.LowScraper(project_data.soup)
-    elif project_type.endswith("higher_level_programming"):
-        scraper = scrapers.HighScraper(project_data.soup)
-    elif project_type.endswith("system_engineering-devops"):
-        scraper = scrapers.SysScraper(project_data.soup)
-    elif project_type.endswith("system_linux"):
-        scraper = scrapers.LowScraper(project_data.soup)
-    elif project_type.endswith("system_algorithms"):
-        scraper = scrapers.LowScraper(project_data.soup)
-    elif project_type.endswith("machine_learning"):
-        scraper = scrapers.HighScraper(project_data.soup)
-    elif project_type.endswith("web_front_end"):
-        scraper = scrapers.HighScraper(project_data.soup)
-    elif project_type.endswith("webstack"):
-        scraper = scrapers.HighScraper(project_data.soup)
-    elif project_type.endswith("interview"):
-        scraper = scrapers.HighScraper(project_data.soup)
-    else:
-        raise ValueError('Failed to determine project type.')
+    if project_data is None:
+        project_data = scrapers.BaseParse(url, credentials=credentials,
+                                          session=session, models=models)
+    scraper_class = scrapers.find_scraper(project_data.project_type_check())
 
     # Creating project directory
-    project_data.create_directory()
+    project_dir = project_data.create_directory(root)
+    manifest = scrapers.Manifest(project_dir, force=force)
+    if manifest.is_current('skeleton', project_data.page_hash):
+        LOGGER.info('Project skeleton is up to date.')
+        return project_data.dir_name
+    project_dir = scrapers.OutputDir(project_dir, manifest)
     # Writing to files with scraped data
-    scraper.write_files()
+    scraper_class(
+        project_data.project, root=project_dir
+    ).write_files()
     # Creating test (main) files
-    scrapers.TestFileScraper(project_data.soup).write_test_files()
-
-    print('Created project skeleton.')
+    scrapers.TestFileScraper(
+        project_data.project, root=project_dir
+    ).write_test_files()
+    manifest.update('skeleton', project_data.page_hash)
+    manifest.save()
+
+    if manifest.skipped:
+        LOGGER.info('Created project skeleton; left %d edited files alone '
+                    '(use --force to overwrite them).', len(manifest.skipped))
+    else:
+        LOGGER.info('Created project skeleton.')
     return project_data.dir_name
 
 
+def scrape(result, session, models, force=False):
+    """Create the skeleton of one project.
+
+    Args:
+        result (obj): batch.Result of the project
+        session (obj): IntranetSession to fetch the project page with
+        models (obj): ModelCache of the project models
+        force (bool): overwrite files the user has edited
+    """
+    project = result.project
+    with result.step():
+        scrapers.OutputDir(project.root).mkdir()
+        create_dir(project.url, session=session, root=project.root,
+                   models=models, force=force)
+
+
 def hippodir():
     """
     Entry point for hippodir
@@ -78,17 +101,8 @@ def hippodir():
     then it checks project type to execute appropriate scrapes.
     """
     args = parse_args()
-    print("Hippodir (v{})".format(hipposcraper.__version__))
-    try:
-        user_data = Credentials(load=True)
-    except (FileNotFoundError, json.JSONDecodeError):
-        user_data = create_config()
-    for url in args.urls:
-        try:
-            create_dir(url, credentials=user_data)
-        except ValueError as err:
-            if getattr(err, 'args', False):
-                print('[ERROR]', *err.args, sep=': ', file=sys.stderr)
+    return batch.main(args, functools.partial(scrape, force=args.force),
+                      'Hippodir')
 
 
 if __name__ == "__main__":
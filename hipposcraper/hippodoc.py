@@ -2,34 +2,65 @@
 """
 hippodoc entry point
 usage: hippodoc.py URL ...
+       hippodoc.py --from-file FILE
 """
 import argparse
-import json
+import functools
 import sys
 
-import hipposcraper
-from . hippoconfig import Credentials, create_config
+from . import LOGGER
+from . import batch
+from . import metrics
 from . import scrapers
 
 
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser()
-    parser.add_argument(metavar='URL', nargs='+', dest='urls',
-                        help='URLs of projects on intranet.hbtn.io')
-    return parser.parse_args()
-
-
-def create_doc(url, credentials=None):
-    """Create a README for a project given its URL."""
-    print("Creating README:")
-    parse_data = scrapers.BaseParse(url, credentials=credentials)
-
-    print("  -> Scraping project information... ")
+    batch.add_arguments(parser)
+    return batch.parse_args(parser)
+
+
+@metrics.timed('readme')
+def create_doc(url, credentials=None, session=None, project_data=None,
+               root='.', models=None, force=False):
+    """Create a README for a project given its URL.
+
+    The project page is fetched and parsed unless `project_data` already
+    holds the parsed page (see `scrapers.BaseParse`), reusing the model of
+    an unchanged page from `models` (see `scrapers.ModelCache`). The README
+    is created in the project directory under `root` if there is one, else
+    in `root`. It is built in memory and written all at once, so nothing is
+    written if a step fails. In a project directory, a README the user has
+    edited is left alone, and nothing is done if the page has not changed
+    (see `scrapers.Manifest`). With `force`, the README is written again,
+    edited or not.
+
+    Returns:
+        path (str): path of the README
+    """
+    LOGGER.info("Creating README:")
+    parse_data = project_data
+    if parse_data is None:
+        parse_data = scrapers.BaseParse(url, credentials=credentials,
+                                        session=session, models=models)
+
+    root = scrapers.OutputDir(root)
+    manifest = None
+    if parse_data.dir_name and root.exists(parse_data.dir_name):
+        manifest = scrapers.Manifest(root.join(parse_data.dir_name),
+                                     force=force)
+        if manifest.is_current('readme', parse_data.page_hash):
+            LOGGER.info("README is up to date.")
+            return root.join(parse_data.dir_name, "README.md")
+        root.manifest = manifest
+
+    LOGGER.debug("  -> Scraping project information... ")
     # Creating scraping object
-    r_scraper = scrapers.ReadScraper(parse_data.soup)
+    r_scraper = scrapers.ReadScraper(parse_data.project, root=root,
+                                     base_url=parse_data.base_url)
 
-    print("     Done.")
+    LOGGER.debug("     Done.")
 
     # Writing to README.md with scraped data
     r_scraper.open_readme()
@@ -41,10 +72,34 @@ def create_doc(url, credentials=None):
     author = parse_data.user_data['author']
     user = parse_data.user_data['github_username']
     r_scraper.write_footer(author, user, 'github.com/{}'.format(user))
+    path = r_scraper.save_readme()
+    if manifest is not None:
+        manifest.update('readme', parse_data.page_hash)
+        manifest.save()
 
-    print("Created README.")
+    if manifest is not None and manifest.skipped:
+        LOGGER.info("Left the edited README alone (use --force to "
+                    "overwrite it).")
+    else:
+        LOGGER.info("Created README.")
 
-    return r_scraper.readme
+    return path
+
+
+def scrape(result, session, models, force=False):
+    """Create the README of one project.
+
+    Args:
+        result (obj): batch.Result of the project
+        session (obj): IntranetSession to fetch the project page with
+        models (obj): ModelCache of the project models
+        force (bool): overwrite a README the user has edited
+    """
+    project = result.project
+    with result.step():
+        scrapers.OutputDir(project.root).mkdir()
+        create_doc(project.url, session=session, root=project.root,
+                   models=models, force=force)
 
 
 def hippodoc():
@@ -54,17 +109,8 @@ def hippodoc():
     Scrapes for specific text to create a README automatically.
     """
     args = parse_args()
-    print("Hippodoc (v{})".format(hipposcraper.__version__))
-    try:
-        user_data = Credentials(load=True)
-    except (FileNotFoundError, json.JSONDecodeError):
-        user_data = create_config()
-    for url in args.urls:
-        try:
-            create_doc(url, credentials=user_data)
-        except ValueError as err:
-            if getattr(err, 'args', False):
-                print('[ERROR]', *err.args, sep=': ', file=sys.stderr)
+    return batch.main(args, functools.partial(scrape, force=args.force),
+                      'Hippodoc')
 
 
 if __name__ == "__main__":
@@ -2,42 +2,52 @@
 """
 hipposcraper entry point
 usage: hipposcraper.py URL ...
+       hipposcraper.py --from-file FILE
 """
 import argparse
-import json
+import functools
 import sys
 
-from . hippoconfig import Credentials, create_config
 from . hippodir import create_dir
 from . hippodoc import create_doc
+from . import batch
+from . import scrapers
 
 
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser()
-    parser.add_argument(metavar='URL', nargs='+', dest='urls',
-                        help='URLs of projects on intranet.hbtn.io')
-    return parser.parse_args()
+    batch.add_arguments(parser)
+    return batch.parse_args(parser)
+
+
+def scrape(result, session, models, force=False):
+    """Create the skeleton and README of one project.
+
+    Args:
+        result (obj): batch.Result of the project
+        session (obj): IntranetSession to fetch the project page with
+        models (obj): ModelCache of the project models
+        force (bool): overwrite files the user has edited
+    """
+    project = result.project
+    # Fetch and parse the page once for the skeleton and README
+    with result.step():
+        scrapers.OutputDir(project.root).mkdir()
+        project_data = scrapers.BaseParse(project.url, session=session,
+                                          models=models)
+    if not result.ok:
+        return
+    for create in (create_dir, create_doc):
+        with result.step():
+            create(project.url, project_data=project_data, root=project.root,
+                   force=force)
 
 
 def hipposcraper():
     """Create task files and generate a README for each project URL."""
     args = parse_args()
-    try:
-        user_data = Credentials(load=True)
-    except (FileNotFoundError, json.JSONDecodeError):
-        user_data = create_config()
-    for url in args.urls:
-        try:
-            create_dir(url, credentials=user_data)
-        except ValueError as err:
-            if getattr(err, 'args', False):
-                print('[ERROR]', *err.args, sep=': ', file=sys.stderr)
-        try:
-            create_doc(url, credentials=user_data)
-        except ValueError as err:
-            if getattr(err, 'args', False):
-                print('[ERROR]', *err.args, sep=': ', file=sys.stderr)
+    return batch.main(args, functools.partial(scrape, force=args.force))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+hippotest entry point
+usage: hippotest.py URL ...
+       hippotest.py --from-file FILE
+
+Run the examples of each project page against the project directory
+created by hippodir, and report where the output differs from the page.
+"""
+import argparse
+import collections
+import difflib
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import hipposcraper
+from . config import Cookies
+from . import LOGGER
+from . import batch
+from . import console
+from . import scrapers
+
+Outcome = collections.namedtuple('Outcome', [
+    'name', 'status', 'command', 'diff', 'seconds'
+])
+Outcome.__doc__ = """Outcome of running one example.
+
+Attributes:
+    name (str): name of the test file of the example
+    status (str): 'pass', 'fail', 'timeout' or 'error'
+    command (str): command that failed, if any
+    diff (str): unified diff of the output expected and the output got
+    seconds (float): wall time of the run
+"""
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser()
+    batch.add_project_arguments(parser)
+    parser.add_argument('-j', '--jobs', metavar='N', type=int,
+                        default=os.cpu_count() or 1,
+                        help='number of examples to run at once '
+                        '(default: number of CPUs)')
+    parser.add_argument('--timeout', metavar='SECONDS', type=float,
+                        default=10.0,
+                        help='time to let each command of an example run')
+    parser.add_argument('--offline', action='store_true',
+                        help='only use project pages cached by earlier runs')
+    parser.add_argument('-q', '--quiet', action='count', default=0,
+                        help='report less (failures only)')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='report more (repeat to report every action)')
+    return batch.parse_args(parser)
+
+
+def normalize(text):
+    """Split output into lines, ignoring whitespace at the end of each.
+
+    Project pages do not keep trailing whitespace, so it is not compared.
+    """
+    return [line.rstrip() for line in text.rstrip('\n').split('\n')]
+
+
+def run_command(command, cwd, timeout):
+    """Run a shell command, getting what it writes to stdout and stderr.
+
+    The command runs in a session of its own, so everything it started is
+    killed if it times out.
+
+    Raises:
+        subprocess.TimeoutExpired: if the command runs for too long
+    """
+    with subprocess.Popen(command, shell=True, cwd=cwd,
+                          stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT,
+                          start_new_session=True) as proc:
+        try:
+            output, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.communicate()
+            raise
+    return output.decode(errors='replace')
+
+
+def run_example(directory, example, timeout):
+    """Run an example in a copy of a project directory.
+
+    The project directory is copied to a temporary directory and the test
+    file of the example is written there, so runs never touch the project
+    or each other. The commands of the example are run in order until one
+    does not print what the page shows.
+
+    Args:
+        directory (str): path of the project directory
+        example (obj): scrapers.test_file_scraper.Example to run
+        timeout (float): seconds to let each command run
+
+    Returns:
+        outcome (obj): Outcome of the run
+    """
+    start = time.perf_counter()
+
+    def outcome(status, command=None, diff=''):
+        return Outcome(example.name, status, command, diff,
+                       time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory(prefix='hippotest-') as tmp:
+        work = os.path.join(tmp, os.path.basename(os.path.abspath(directory)))
+        try:
+            shutil.copytree(directory, work, ignore=shutil.ignore_patterns(
+                scrapers.Manifest.basename
+            ))
+            path = os.path.join(work, example.name)
+            with open(path, 'w') as ostream:
+                ostream.write(example.text)
+            os.chmod(path, 0o755)
+        except OSError as err:
+            return outcome('error', diff=str(err))
+        for step in example.steps:
+            try:
+                output = run_command(step.command, work, timeout)
+            except subprocess.TimeoutExpired:
+                return outcome('timeout', step.command,
+                               'timed out after {:g} s'.format(timeout))
+            except OSError as err:
+                return outcome('error', step.command, str(err))
+            expected, got = normalize(step.output), normalize(output)
+            if expected != got:
+                return outcome('fail', step.command, '\n'.join(
+                    difflib.unified_diff(expected, got, 'expected', 'got',
+                                         lineterm='')
+                ))
+    return outcome('pass')
+
+
+def run_examples(tasks, jobs=1, timeout=10.0):
+    """Run examples, in a pool of `jobs` processes if more than one.
+
+    Args:
+        tasks (list): (directory, example) pairs to pass to `run_example`
+        jobs (int): number of examples to run at once
+        timeout (float): seconds to let each command run
+
+    Returns:
+        outcomes (list): Outcome of each task, in the order of `tasks`
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        return [run_example(directory, example, timeout)
+                for directory, example in tasks]
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_example, directory, example, timeout)
+                   for directory, example in tasks]
+    return [future.result() for future in futures]
+
+
+def find_examples(project, session=None, models=None):
+    """Find the project directory of a project and its examples to run.
+
+    Returns:
+        tasks (list): (directory, example) pairs (see `run_example`)
+
+    Raises:
+        ParseError: if the page names no project directory
+        TestError: if the project directory does not exist
+    """
+    project_data = scrapers.BaseParse(project.url, session=session,
+                                      models=models)
+    if not project_data.dir_name:
+        raise scrapers.ParseError('Failed to find project directory.')
+    directory = os.path.join(project.root, project_data.dir_name)
+    if not os.path.isdir(directory):
+        raise scrapers.TestError(
+            'No project directory {} (run hippodir first)'.format(directory)
+        )
+    examples = scrapers.TestFileScraper(project_data.project).find_examples()
+    if not examples:
+        LOGGER.warning('[SKIP] {}: no examples to run'.format(directory))
+    return [(directory, example) for example in examples]
+
+
+def report(directory, outcomes):
+    """Log the outcome of each example of a project.
+
+    Returns:
+        failed (int): number of examples that failed
+    """
+    LOGGER.info('Testing {}:'.format(directory))
+    failed = 0
+    for outcome in outcomes:
+        if outcome.status == 'pass':
+            LOGGER.info('  [PASS] {} ({:.2f} s)'.format(outcome.name,
+                                                        outcome.seconds))
+            continue
+        failed += 1
+        LOGGER.error('  [{}] {}: {}'.format(
+            outcome.status.upper(), os.path.join(directory, outcome.name),
+            outcome.command or 'setup'
+        ))
+        for line in outcome.diff.splitlines():
+            LOGGER.error('    {}'.format(line))
+    return failed
+
+
+def hippotest():
+    """
+    Entry point for hippotest
+
+    Runs the examples of each project page against its project directory.
+    """
+    args = parse_args()
+    console.configure(args.verbose - args.quiet)
+    LOGGER.info("Hippotest (v{})".format(hipposcraper.__version__))
+    user_data = batch.load_credentials()
+    models = scrapers.ModelCache()
+    errors = []
+    projects = []
+    with scrapers.IntranetSession(credentials=user_data,
+                                  cache=scrapers.PageCache(),
+                                  offline=args.offline,
+                                  cookie_store=Cookies()) as session:
+        for project in batch.projects(args.urls, args.from_file, args.format,
+                                      errors):
+            result = batch.Result(project)
+            tasks = []
+            with result.step():
+                tasks = find_examples(project, session, models)
+            projects.append((result, tasks))
+    # Run the examples of every project in one pool
+    outcomes = iter(run_examples(
+        [task for _, tasks in projects for task in tasks],
+        args.jobs, args.timeout
+    ))
+    passed = failed = 0
+    for result, tasks in projects:
+        if not tasks:
+            continue
+        count = report(tasks[0][0], [next(outcomes) for _ in tasks])
+        passed += len(tasks) - count
+        failed += count
+        if count:
+            result.errors.append(scrapers.TestError(
+                '{} of {} examples failed'.format(count, len(tasks))
+            ))
+    print('Examples: {} run, {} passed, {} failed'.format(
+        passed + failed, passed, failed
+    ))
+    return batch.report([result for result, _ in projects], errors,
+                        args.failed)
+
+
+if __name__ == "__main__":
+    sys.exit(hippotest())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Record where the time of a run goes, per project and per stage.
+
+Stages are timed only while metrics are enabled (see `collect`); otherwise
+timing a stage costs a single check. Stages may nest (fetching a page
+includes signing in, creating a skeleton includes writing its files), so
+the stages of a project do not add up to its total time.
+"""
+import contextlib
+import functools
+import json
+import threading
+import time
+
+import hipposcraper
+from . import LOGGER
+
+_metrics = None
+
+
+class Stage:
+    """Stage class
+
+    Context manager timing one stage of a project. Set `bytes` inside the
+    block to record how much data the stage handled.
+
+    Args:
+        metrics (obj): Metrics to record the stage in
+        name (str): name of the stage
+        nbytes (int): bytes handled by the stage, if already known
+    """
+    __slots__ = ('metrics', 'name', 'bytes', 'start')
+
+    def __init__(self, metrics, name, nbytes=0):
+        self.metrics = metrics
+        self.name = name
+        self.bytes = nbytes
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.record(self.name, time.perf_counter() - self.start,
+                            self.bytes)
+
+
+class NullStage:
+    """Stand in for a Stage while metrics are disabled."""
+    __slots__ = ()
+    bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def __setattr__(self, name, value):
+        pass
+
+
+NULL_STAGE = NullStage()
+
+
+class Metrics:
+    """Metrics class
+
+    Wall time and bytes of each stage of each project in a run.
+
+    Stages are recorded against the project the calling thread is working
+    on (see `project`), or against the run as a whole outside any project.
+
+    Attributes:
+        projects (list): record of each finished project
+        run (dict): record of the stages outside any project
+    """
+
+    def __init__(self):
+        self.projects = []
+        self.run = self.new_record(None)
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__start = time.perf_counter()
+
+    @staticmethod
+    def new_record(url):
+        """Make an empty record for a project."""
+        return {'url': url, 'seconds': 0.0, 'stages': {}, 'writes': []}
+
+    def current(self):
+        """Get the record of the project the calling thread is working on."""
+        return getattr(self.__local, 'record', None) or self.run
+
+    @contextlib.contextmanager
+    def project(self, url):
+        """Record the stages run by the calling thread against a project."""
+        record = self.new_record(url)
+        self.__local.record = record
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self.__local.record = None
+            with self.__lock:
+                self.projects.append(record)
+
+    def record(self, name, seconds, nbytes=0):
+        """Add a call of a stage to the current project."""
+        stage = self.current()['stages'].setdefault(
+            name, {'calls': 0, 'seconds': 0.0, 'bytes': 0}
+        )
+        stage['calls'] += 1
+        stage['seconds'] += seconds
+        stage['bytes'] += nbytes
+
+    def write(self, path, seconds, nbytes, written):
+        """Add a file write to the current project."""
+        self.current()['writes'].append({
+            'path': path,
+            'seconds': seconds,
+            'bytes': nbytes,
+            'written': written,
+        })
+        self.record('write', seconds, nbytes if written else 0)
+
+    def totals(self):
+        """Add up each stage over every project."""
+        totals = {}
+        for record in [self.run] + self.projects:
+            for name, stage in record['stages'].items():
+                total = totals.setdefault(
+                    name, {'calls': 0, 'seconds': 0.0, 'bytes': 0}
+                )
+                for key in total:
+                    total[key] += stage[key]
+        return totals
+
+    def as_dict(self):
+        """Get every record as JSON-serializable data."""
+        with self.__lock:
+            projects = list(self.projects)
+        return {
+            'version': hipposcraper.__version__,
+            'seconds': time.perf_counter() - self.__start,
+            'run': self.run,
+            'projects': projects,
+            'totals': self.totals(),
+        }
+
+    def dump(self, path):
+        """Write the records as JSON to a file ('-' for standard output)."""
+        text = json.dumps(self.as_dict(), indent=2, sort_keys=True)
+        if path == '-':
+            print(text)
+            return
+        with open(path, 'w') as ostream:
+            print(text, file=ostream)
+
+
+def active():
+    """Get the Metrics being collected, if any."""
+    return _metrics
+
+
+def stage(name, nbytes=0):
+    """Time a stage of the current project (see `Stage`)."""
+    if _metrics is None:
+        return NULL_STAGE
+    return Stage(_metrics, name, nbytes)
+
+
+def project(url):
+    """Record the stages run by the calling thread against a project."""
+    if _metrics is None:
+        return NULL_STAGE
+    return _metrics.project(url)
+
+
+def timed(name=None):
+    """Decorate a function to time each call as a stage.
+
+    Args:
+        name (str): name of the stage (default: the function's name)
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwgs):
+            if _metrics is None:
+                return func(*args, **kwgs)
+            with Stage(_metrics, label):
+                return func(*args, **kwgs)
+        return wrapper
+    return decorate
+
+
+@contextlib.contextmanager
+def collect(json_path=None, profile_path=None):
+    """Collect metrics over a run and write them out when it ends.
+
+    Args:
+        json_path (str): file to write metrics to as JSON ('-' for stdout)
+        profile_path (str): file to dump cProfile statistics to (see
+            `pstats`); only the calling thread is profiled
+    """
+    global _metrics
+    if json_path is not None:
+        _metrics = Metrics()
+    profiler = None
+    if profile_path is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield _metrics
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            try:
+                profiler.dump_stats(profile_path)
+            except OSError as err:
+                LOGGER.error('[ERROR]: {}: {}'.format(profile_path, err))
+        if _metrics is not None:
+            try:
+                _metrics.dump(json_path)
+            except OSError as err:
+                LOGGER.error('[ERROR]: {}: {}'.format(json_path, err))
+            _metrics = None
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Run per-project work for each URL, optionally in a pool of worker threads.
+"""
+import io
+import sys
+import threading
+
+
+class ProjectStream:
+    """
+    Stand in for a standard stream, buffering writes per worker thread.
+
+    Threads that have started a buffer write into it; every other thread
+    writes straight through to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        """Wrap a stream."""
+        self.stream = stream
+        self.__local = threading.local()
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped stream."""
+        return getattr(self.stream, name)
+
+    def write(self, text):
+        """Write to the buffer of the calling thread."""
+        buffer = getattr(self.__local, 'buffer', None)
+        if buffer is None:
+            return self.stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        """Flush the wrapped stream (buffers are flushed by `release`)."""
+        if getattr(self.__local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def capture(self):
+        """Start buffering writes from the calling thread."""
+        self.__local.buffer = io.StringIO()
+
+    def release(self):
+        """Stop buffering and return what the calling thread wrote."""
+        buffer = self.__local.buffer
+        self.__local.buffer = None
+        return buffer.getvalue()
+
+
+def run(func, items, jobs=1, progress=None):
+    """
+    Call `func` with each item and return what each call returns.
+
+    Items are taken from `items` only as they are needed, so work on the
+    first ones starts before the rest have been read. With more than one
+    job, calls run in a pool of `jobs` threads. Output from each call is
+    held back and written in one piece when it finishes, so output from
+    different projects never interleaves.
+
+    Args:
+        func (obj): function to call with each item
+        items (iter): items to call `func` with
+        jobs (int): number of calls to run at once
+        progress (obj): object whose `update(item, result)` is called as
+            each call finishes (see `console.Progress`), if given
+
+    Returns:
+        results (list): (item, result) pairs, in the order of `items`
+    """
+    if jobs <= 1:
+        results = []
+        for item in items:
+            results.append((item, func(item)))
+            if progress is not None:
+                progress.update(*results[-1])
+        return results
+    import concurrent.futures
+
+    stdout = ProjectStream(sys.stdout)
+    stderr = ProjectStream(sys.stderr)
+    lock = threading.Lock()
+    # Read no further ahead than the pool can use
+    slots = threading.BoundedSemaphore(2 * jobs)
+
+    def work(item):
+        """Call `func` and write its output in one piece."""
+        result = None
+        stdout.capture()
+        stderr.capture()
+        try:
+            result = func(item)
+            return result
+        finally:
+            out, err = stdout.release(), stderr.release()
+            with lock:
+                stdout.stream.write(out)
+                stdout.stream.flush()
+                stderr.stream.write(err)
+                stderr.stream.flush()
+                if progress is not None:
+                    progress.update(item, result)
+            slots.release()
+
+    futures = []
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            for item in items:
+                slots.acquire()
+                futures.append((item, pool.submit(work, item)))
+    finally:
+        sys.stdout, sys.stderr = stdout.stream, stderr.stream
+    return [(item, future.result()) for item, future in futures]
@@ -1,8 +1,63 @@
 #!/usr/bin/env python3
-"""Provide scraping tools for Holberton projects."""
-from . base_parse import BaseParse
-from . high_scraper import HighScraper
-from . low_scraper import LowScraper
-from . read_scraper import ReadScraper
-from . sys_scraper import SysScraper
-from . test_file_scraper import TestFileScraper
+"""Provide scraping tools for Holberton projects.
+
+Each name is imported from its module when it is first used, so importing
+the package does not pull in bs4 or requests.
+"""
+import importlib
+
+_EXPORTS = {
+    'BaseParse': 'base_parse',
+    'AuthError': 'errors',
+    'FetchError': 'errors',
+    'ParseError': 'errors',
+    'ScraperError': 'errors',
+    'TestError': 'errors',
+    'WriteError': 'errors',
+    'HighScraper': 'high_scraper',
+    'Linter': 'linters',
+    'LINTERS': 'linters',
+    'find_linter': 'linters',
+    'linter_for': 'linters',
+    'LowScraper': 'low_scraper',
+    'Manifest': 'manifest',
+    'ProjectModel': 'model',
+    'Resource': 'model',
+    'extract_project': 'model',
+    'ModelCache': 'model_cache',
+    'OutputDir': 'output_dir',
+    'PageCache': 'page_cache',
+    'PageIndex': 'page_index',
+    'find_parser': 'parser',
+    'make_soup': 'parser',
+    'parse_only': 'parser',
+    'ReadScraper': 'read_scraper',
+    'ScraperRegistry': 'registry',
+    'find_scraper': 'registry',
+    'register_scraper': 'registry',
+    'IntranetSession': 'session',
+    'SysScraper': 'sys_scraper',
+    'TestFileScraper': 'test_file_scraper',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import a name (or a submodule) of the package on first use."""
+    if name in _EXPORTS:
+        module = importlib.import_module('.' + _EXPORTS[name], __name__)
+        value = getattr(module, name)
+    elif name in _EXPORTS.values():
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name
+        ))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the names of the package, imported or not."""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Module for BaseParse"""
+import hashlib
 import json
-import os
-import re
-import sys
-
-from bs4 import BeautifulSoup, Tag
-import requests
 
+import hipposcraper
+from .. import LOGGER, metrics
 from .. config import Credentials
+from . errors import FetchError, ParseError, WriteError
+from . model import extract_project
+from . output_dir import OutputDir
+from . page_index import PageIndex
+from . parser import make_soup
+from . session import IntranetSession
 
 
 class BaseParse(object):
@@ -18,17 +21,38 @@ class BaseParse(object):
 
     Args:
         url (str): url to the project page to scrape
+        credentials (dict): user credentials (see `config.Credentials`)
+        session (obj): IntranetSession to reuse across projects
+        parser (str): HTML parser backend (see `parser.find_parser`)
+        base_url (str): intranet URL (default: that of `session`, if given,
+            else `hipposcraper.BASE_URL`)
+        models (obj): ModelCache to reuse the models of unchanged pages from
 
     Attributes:
         user_data (dict): read json data from credentials.json
-        soup (obj): BeautifulSoup obj containing parsed url
+        session (obj): IntranetSession used to fetch the project page
+        parser (str): HTML parser backend (see `parser.find_parser`)
+        base_url (str): intranet URL
+        page_hash (str): SHA-256 hash of the project page
+        models (obj): ModelCache to reuse the models of unchanged pages from
+        project (obj): ProjectModel of the page, shared with the scrapers
         dir_name (str): directory name of the url
     """
 
-    def __init__(self, url, credentials=None):
+    def __init__(self, url, credentials=None, session=None, parser=None,
+                 base_url=None, models=None):
+        if base_url is None:
+            base_url = getattr(session, 'base_url', hipposcraper.BASE_URL)
+        self.base_url = base_url.rstrip('/')
         self.hbtn_link = url
-        self.user_data = credentials or Credentials(load=True)
-        self.soup = self.get_soup()
+        if session is not None:
+            self.user_data = session.user_data
+        else:
+            self.user_data = credentials or Credentials(load=True)
+        self.session = session
+        self.parser = parser
+        self.models = models
+        self.project = self.extract(self.fetch_page())
         self.dir_name = self.find_directory()
 
     @property
@@ -44,72 +68,123 @@ class BaseParse(object):
     def hbtn_link(self, value):
         """Setter for hbtn url
 
-        Must contain holberton's url format for projects.
+        Must contain holberton's url format for projects, on the host of
+        `base_url`.
 
         Args:
             value (str): comes from argv[1] as the project url
+
+        Raises:
+            FetchError: if the url is not on the intranet
         """
-        host = 'intranet.hbtn.io'
+        scheme, _, host = self.base_url.partition('://')
         if value.find('://'):
             *_, value = value.partition('://')
         if not value.startswith('{}/'.format(host)):
-            raise ValueError("[ERROR] Host must be {}".format(host))
-        self.__hbtn_link = 'https://{}'.format(value)
+            raise FetchError("Host must be {}".format(host))
+        self.__hbtn_link = '{}://{}'.format(scheme, value)
+
+    def fetch_page(self):
+        """Method that fetches the page at `hbtn_link`
+
+        The hash of the page is set into `page_hash`.
+        The page is fetched through `session`, which only signs in when the
+        intranet asks for it. A private session is used if none was given.
+
+        Returns:
+            content (bytes): html of the page
 
-    def get_soup(self):
-        """Method that parses the `hbtn_link` with BeautifulSoup
+        Raises:
+            AuthError: if signing in fails
+            FetchError: if the page cannot be fetched
+        """
+        LOGGER.debug("  -> Fetching project page...")
+        if self.session is not None:
+            content = self.session.fetch(self.hbtn_link)
+        else:
+            with IntranetSession(self.user_data) as session:
+                content = session.fetch(self.hbtn_link)
+        self.page_hash = hashlib.sha256(content).hexdigest()
+        LOGGER.debug("     Done.")
+        return content
+
+    def get_soup(self, content=None):
+        """Method that parses the page at `hbtn_link` with BeautifulSoup
 
-        Then requests for the html of the url, and sets it into `soup`.
+        Args:
+            content (bytes): html of the page (fetched if not given)
 
         Returns:
             soup (obj): BeautifulSoup parsed html object
         """
-        with requests.Session() as session:
-            auth_url = 'https://intranet.hbtn.io/auth/sign_in'
-            resp = session.get(auth_url)
-            soup = BeautifulSoup(resp.content, features='html.parser')
-            credentials = {
-                'user[login]': self.user_data.get('holberton_username'),
-                'user[password]': self.user_data.get('holberton_password'),
-                'authenticity_token': soup.find(
-                    'input', {'name': 'authenticity_token'}
-                ).get('value'),
-                'commit': soup.find(
-                    'input', {'name': 'commit'}
-                ).get('value'),
-            }
-            try:
-                print("  -> Logging in...")
-                session.post(auth_url, data=credentials)
-                resp = session.get(self.hbtn_link)
-                soup = BeautifulSoup(resp.content, features='html.parser')
-            except AttributeError:
-                print("     [ERROR] Login failed - check your credentials.")
-                sys.exit()
-        print("     Done.")
-        return soup
+        if content is None:
+            content = self.fetch_page()
+        with metrics.stage('parse', len(content)):
+            return make_soup(content, self.parser)
+
+    def extract(self, content):
+        """Method that extracts the project model of a page
+
+        The model is loaded from `models` if the page was extracted before,
+        in which case the page is not even parsed. Otherwise it is stored
+        there for the next run.
+
+        Args:
+            content (bytes): html of the page, hashed into `page_hash`
 
+        Returns:
+            project (obj): ProjectModel of the page
+        """
+        if self.models is not None:
+            with metrics.stage('load model'):
+                project = self.models.load(self.page_hash)
+            if project is not None:
+                return project
+        soup = self.get_soup(content)
+        with metrics.stage('index'):
+            index = PageIndex(soup)
+        with metrics.stage('extract'):
+            project = extract_project(soup, index)
+        if self.models is not None:
+            with metrics.stage('save model'):
+                self.models.save(self.page_hash, project)
+        return project
+
+    @metrics.timed()
     def find_directory(self):
         """Scrape project directory names."""
-        anchor = self.soup.find(string=re.compile("Directory: "))
-        if anchor is not None and isinstance(anchor.next_element, Tag):
-            return anchor.next_element.text
-        return None
-
-    def create_directory(self):
-        """Create appropriate directory trees."""
-        print("  -> Creating directory {} ...".format(self.dir_name))
-        try:
-            os.makedirs(self.dir_name, mode=0o755, exist_ok=False)
-            os.chdir(self.dir_name)
-            print("     Done.")
-        except OSError:
-            print("     [ERROR] Failed to create directory.")
-            sys.exit()
+        return self.project.directory
 
+    def create_directory(self, root='.'):
+        """Create appropriate directory trees.
+
+        An existing project directory is reused.
+
+        Args:
+            root (obj): OutputDir (or path) to create the directory in
+
+        Returns:
+            project_dir (obj): OutputDir of the project directory
+
+        Raises:
+            ParseError: if the page names no project directory
+            WriteError: if the directory cannot be created
+        """
+        if not isinstance(root, OutputDir):
+            root = OutputDir(root)
+        if not self.dir_name:
+            raise ParseError('Failed to find project directory.')
+        LOGGER.debug("  -> Creating directory {} ...".format(self.dir_name))
+        try:
+            root.mkdir(self.dir_name)
+            LOGGER.debug("     Done.")
+        except OSError as err:
+            raise WriteError('Failed to create directory {}: {}'.format(
+                root.join(self.dir_name), err.strerror or err
+            ))
+        return root.sub(self.dir_name)
+
+    @metrics.timed()
     def project_type_check(self):
         """Scrape project types."""
-        anchor = self.soup.find(string=re.compile("GitHub repository: "))
-        if anchor is not None and isinstance(anchor.next_sibling, Tag):
-            return anchor.next_sibling.text
-        return None
+        return self.project.project_type
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Module for the errors raised while scraping a project
+
+Every error is a ScraperError, which is also a ValueError. The subclass
+names the stage that failed, so a batch can report (and retry) failed
+projects by cause.
+"""
+
+
+class ScraperError(ValueError):
+    """A project could not be scraped."""
+    kind = 'error'
+
+
+class AuthError(ScraperError):
+    """Signing in to the intranet failed."""
+    kind = 'auth'
+
+
+class FetchError(ScraperError):
+    """A project page could not be fetched."""
+    kind = 'fetch'
+
+
+class ParseError(ScraperError):
+    """A project page did not hold what the scrapers need."""
+    kind = 'parse'
+
+
+class WriteError(ScraperError):
+    """Project files could not be written."""
+    kind = 'write'
+
+
+class TestError(ScraperError):
+    """The examples of a project could not be run, or failed."""
+    kind = 'test'
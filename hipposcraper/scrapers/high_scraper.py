@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Module for HighScraper"""
 import json
-import os
 import re
 import sys
 
+from .. import LOGGER, metrics
+from . linters import linter_for
+from . model import as_project
+from . output_dir import OutputDir
+
 
 class HighScraper:
     """HighScraper class
@@ -12,7 +16,9 @@ class HighScraper:
     High-Level_Programming project scraper.
 
     Args:
-        soup (obj): BeautifulSoup obj containing parsed link
+        project (obj): ProjectModel of the project page (or its parse tree)
+        root (obj): OutputDir (or path) to create files in
+        index (obj): PageIndex of a parse tree, built if not given
 
     Attributes:
         py_flag (int): For write_checker()
@@ -21,20 +27,21 @@ class HighScraper:
     py_flag = 0
     js_flag = 0
 
-    def __init__(self, soup):
-        self.soup = soup
+    def __init__(self, project, root='.', index=None):
+        self.project = as_project(project, index)
+        self.root = root if isinstance(root, OutputDir) else OutputDir(root)
         self.file_names = self.find_files()
         self.prototypes_list = self.find_prototypes()
 
+    @metrics.timed()
     def find_prototypes(self):
         """Method to scrape python prototypes
 
         Has a failsafe incase there are non-python files in scraped data.
         """
         res = []
-        find_protos = self.soup.find_all(string=re.compile("Prototype: "))
-        for item in find_protos:
-            py_proto = item.next_sibling.text
+        for item in self.project.prototypes:
+            py_proto = item
             find_py = py_proto.find(":")
             if find_py != 1:
                 res.append(py_proto)
@@ -42,10 +49,12 @@ class HighScraper:
                 pass
         return res
 
+    @metrics.timed()
     def find_files(self):
         """Method to scrape for python file names"""
-        return self.soup.find_all(string=re.compile("File: "))
+        return self.project.files
 
+    @metrics.timed()
     def write_files(self):
         """Method to write/create python files
 
@@ -58,9 +67,9 @@ class HighScraper:
         one_dir_check = 0
         folder_name = None
 
-        print("  -> Creating task files...")
+        LOGGER.debug("  -> Creating task files...")
         for item in self.file_names:
-            text_file = item.next_sibling.text
+            text_file = item
             try:
                 find_pyfile = text_file.find(".py")
                 find_comma = re.search('(.+?),', text_file)
@@ -73,67 +82,65 @@ class HighScraper:
                     new_dir_files.append(str(find_dir_file.group(1)))
                 if find_folder is not None and one_dir_check is 0:
                     folder_name = str(find_folder.group(1))
-                    os.mkdir(folder_name)
+                    self.root.mkdir(folder_name)
                     one_dir_check += 1
 
                 # Handling multiple files
                 if "," in text_file:
                     create_name = str(find_comma.group(1))
-                    make_comma = open(create_name, "w+")
-                    make_comma.close()
+                    with self.root.open(create_name, "w+"):
+                        pass
                 elif "." not in text_file and one_dir_check is not 1:
-                    os.mkdir(text_file)
+                    self.root.mkdir(text_file)
                 else:
-                    w_file_name = open(text_file, "w+")
-                    if ".py" in text_file:
-                        self.py_flag = 1
-                        w_file_name.write("#!/usr/bin/python3\n")
-                    elif ".sh" in text_file:
-                        w_file_name.write("#!/bin/bash\n")
-                    elif ".js" in text_file:
-                        self.js_flag = 1
-                        w_file_name.write("#!/usr/bin/node\n")
-                    else:
-                        pass
-                    # Creating prototypes in parallel with files
-                    if find_pyfile != -1:
-                        w_file_name.write(self.prototypes_list[file_idx])
-                        file_idx += 1
-                    else:
-                        pass
-                    w_file_name.close()
+                    # Closed (and written) even if there is no prototype
+                    with self.root.open(text_file, "w+") as w_file_name:
+                        if ".py" in text_file:
+                            self.py_flag = 1
+                            w_file_name.write("#!/usr/bin/python3\n")
+                        elif ".sh" in text_file:
+                            w_file_name.write("#!/bin/bash\n")
+                        elif ".js" in text_file:
+                            self.js_flag = 1
+                            w_file_name.write("#!/usr/bin/node\n")
+                        else:
+                            pass
+                        # Creating prototypes in parallel with files
+                        if find_pyfile != -1:
+                            w_file_name.write(self.prototypes_list[file_idx])
+                            file_idx += 1
+                        else:
+                            pass
             except AttributeError:
-                print("     [ERROR] Failed to create task file {}".format(
-                    text_file
-                ))
+                LOGGER.error("     [ERROR] Failed to create task file %s",
+                             text_file)
                 continue
             except IOError:
-                print("     [ERROR] Failed to create task file {}".format(
-                    text_file
-                ))
+                LOGGER.error("     [ERROR] Failed to create task file %s",
+                             text_file)
                 pass
             except IndexError:
                 pass
 
         # Check if new dir created, insert files if there is
         if folder_name is not None and one_dir_check is 1:
-            os.chdir(folder_name)
             for item in new_dir_files:
                 if "," in item:
                     item_obj = re.search('/(.+?)$', text_file)
                     item = str(item_obj.group(1))
-                dir_file = open(item, "w+")
-                dir_file.close()
-            os.chdir("..")
-        print("     Done.")
+                with self.root.sub(folder_name).open(item, "w+"):
+                    pass
+        LOGGER.debug("     Done.")
 
+    @metrics.timed()
     def write_checker(self):
-        with open("check.sh", "w") as f:
+        with self.root.open("check.sh", "w") as f:
             f.write("#!/usr/bin/env bash\n")
             if self.js_flag == 1:
-                f.write("semistandard --fix ")
+                f.write(linter_for(".js").script + " ")
             if self.py_flag == 1:
-                f.write("pep8 ")
+                f.write(linter_for(".py").script + " ")
             if self.file_names:
                 for i in self.file_names:
-                    f.write('"%s" ' % i.next_sibling.text)
+                    if i is not None:
+                        f.write('"%s" ' % i)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Module for the linter of each language"""
+import collections
+import os
+
+Linter = collections.namedtuple('Linter', [
+    'name', 'commands', 'extensions', 'script'
+])
+Linter.__doc__ = """Linter of the files of one language.
+
+Attributes:
+    name (str): name of the linter
+    commands (tuple): commands (argument lists) that run it, in order of
+        preference; the first installed one is used
+    extensions (tuple): extensions of the files it checks
+    script (str): command check.sh runs it with
+"""
+
+LINTERS = (
+    Linter('betty', (('betty',),), ('.c', '.h'), 'betty'),
+    Linter('pep8', (('pycodestyle',), ('pep8',)), ('.py',), 'pep8'),
+    Linter('semistandard', (('semistandard',),), ('.js',),
+           'semistandard --fix'),
+)
+
+
+def linter_for(ext, linters=LINTERS):
+    """Get the linter of the files with an extension (e.g. ".c"), or None."""
+    for linter in linters:
+        if ext in linter.extensions:
+            return linter
+    return None
+
+
+def find_linter(path, linters=LINTERS):
+    """Get the linter of a file by its extension, or None."""
+    return linter_for(os.path.splitext(path)[1], linters)
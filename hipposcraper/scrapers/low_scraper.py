@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Module for LowScraper"""
 import json
-import os
-import re
 import sys
 
+from .. import LOGGER, metrics
+from . linters import linter_for
+from . model import as_project
+from . output_dir import OutputDir
+
 _PUTCHAR = """#include <unistd.h>
 
 /**
@@ -26,60 +29,59 @@ class LowScraper:
     Low-Level_Programming project scraper.
 
     Args:
-        soup (obj): BeautifulSoup obj containing parsed link
+        project (obj): ProjectModel of the project page (or its parse tree)
+        root (obj): OutputDir (or path) to create files in
+        index (obj): PageIndex of a parse tree, built if not given
 
     Attributes:
         header_check (int): if 0, there is header. if 1, there is no header
     """
     header_check = 0
 
-    def __init__(self, soup):
+    def __init__(self, project, root='.', index=None):
         """Instantiation of LowScraper"""
-        self.soup = soup
+        self.project = as_project(project, index)
+        self.root = root if isinstance(root, OutputDir) else OutputDir(root)
         self.putchar_check = self.find_putchar()
         self.prototypes_list = self.find_prototypes()
         self.header_name = self.find_header()
         self.file_names = self.find_files()
 
+    @metrics.timed()
     def find_putchar(self):
         """Method to check for holberton's `_putchar`"""
-        match = self.soup.find(string=re.compile("You are allowed to use"))
-        try:
-            if len(match) == 23:
-                return match.next_sibling.text
-        except TypeError:
-            return None
+        return self.project.putchar
 
+    @metrics.timed()
     def write_putchar(self):
         """Method to create Holberton's `_putchar` if required"""
         if self.putchar_check == "_putchar":
-            print("  -> Creating _putchar.c ...")
+            LOGGER.debug("  -> Creating _putchar.c ...")
             try:
-                with open("_putchar.c", "w") as ostream:
+                with self.root.open("_putchar.c", "w") as ostream:
                     print(_PUTCHAR, file=ostream)
             except OSError:
-                print("     [ERROR] Failed to write _putchar")
+                LOGGER.error("     [ERROR] Failed to write _putchar")
             else:
-                print("     Done.")
+                LOGGER.debug("     Done.")
 
+    @metrics.timed()
     def find_prototypes(self):
         """Method to scrape for C prototypes"""
         temp = []
-        find_protos = self.soup.find_all(string=re.compile("Prototype: "))
-        for item in find_protos:
-            temp.append(item.next_sibling.text.replace(";", ""))
+        for item in self.project.prototypes:
+            temp.append(item.replace(";", ""))
         return temp
 
+    @metrics.timed()
     def find_header(self):
         """Method to scrape for C header file name"""
-        try:
-            finder = "forget to push your header file"
-            header_text = self.soup.find(string=re.compile(finder)).previous_element
-            return header_text.previous_element.previous_element
-        except AttributeError:
+        if self.project.header is None:
             self.header_check = 1
             return ""
+        return self.project.header
 
+    @metrics.timed()
     def write_header(self):
         """Method to write/create C header file if required"""
         if self.header_check == 0:
@@ -88,13 +90,13 @@ class LowScraper:
             include_guard = include_guard.replace('.', '_', 1)
             include_guard = include_guard.upper()
 
-            print("  -> Creating header file...")
+            LOGGER.debug("  -> Creating header file...")
             try:
                 find_slash = self.header_name.rfind("/")
                 if find_slash != -1:
                     header_dir = self.header_name[:find_slash]
-                    os.makedirs(header_dir, mode=0o755, exist_ok=True)
-                with open(self.header_name, "w+") as w_header:
+                    self.root.mkdir(header_dir)
+                with self.root.open(self.header_name, "w+") as w_header:
                     w_header.write('#ifndef %s\n' % include_guard)
                     w_header.write('#define %s\n' % include_guard)
                     w_header.write("\n")
@@ -118,14 +120,16 @@ class LowScraper:
                     w_header.write("\n")
                     w_header.write('#endif /* %s */' % include_guard)
                     w_header.close()
-                print("     Done.")
+                LOGGER.debug("     Done.")
             except AttributeError:
-                print("     [ERROR] Failed to create header file.")
+                LOGGER.error("     [ERROR] Failed to create header file.")
 
+    @metrics.timed()
     def find_files(self):
         """Method to scrape for C file names"""
-        return self.soup.find_all(string=re.compile("File: "))
+        return self.project.files
 
+    @metrics.timed()
     def write_files(self):
         """Method to write/create C files
 
@@ -134,9 +138,9 @@ class LowScraper:
         self.write_putchar()
         self.write_header()
         i = 0
-        print("  -> Creating task files...")
+        LOGGER.debug("  -> Creating task files...")
         for item in self.file_names:
-            file_text = item.next_sibling.text
+            file_text = item
             # Breaks incase more function names over file names
             if self.prototypes_list != 0:
                 if (i == len(self.prototypes_list)):
@@ -159,8 +163,8 @@ class LowScraper:
                 find_slash = file_text.rfind("/")
                 if find_slash != -1:
                     file_dir = file_text[:find_slash]
-                    os.makedirs(file_dir, mode=0o755, exist_ok=True)
-                with open(file_text, "w+") as w_file_name:
+                    self.root.mkdir(file_dir)
+                with self.root.open(file_text, "w+") as w_file_name:
                     if self.header_check != 1:
                         w_file_name.write('#include "%s"\n\n' % self.header_name)
                         w_file_name.write("/**\n")
@@ -175,18 +179,19 @@ class LowScraper:
                         w_file_name.close()
                 i += 1
             except (AttributeError, IndexError):
-                print("     [ERROR] Failed to create task file {}".format(
-                    file_text
-                ))
+                LOGGER.error("     [ERROR] Failed to create task file %s",
+                             file_text)
                 continue
-        print("     Done.")
+        LOGGER.debug("     Done.")
 
+    @metrics.timed()
     def write_checker(self):
-        with open("check.sh", "w") as f:
+        with self.root.open("check.sh", "w") as f:
             f.write("#!/usr/bin/env bash\n")
-            f.write("betty ")
+            f.write(linter_for(".c").script + " ")
             if self.header_name:
                 f.write('"%s" ' % self.header_name)
             if self.file_names:
                 for i in self.file_names:
-                    f.write('"%s" ' % i.next_sibling.text)
+                    if i is not None:
+                        f.write('"%s" ' % i)
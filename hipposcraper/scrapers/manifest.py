@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Module for Manifest"""
+import hashlib
+import json
+import os
+
+import hipposcraper
+from .. import LOGGER
+from . output_dir import OutputDir
+
+
+def digest(data):
+    """Get the hash of some content (str or bytes)."""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class Manifest:
+    """Manifest class
+
+    Record of what the Hipposcraper generated in a project directory.
+
+    The manifest keeps the hash of the project page each step (e.g. the
+    skeleton or the README) was generated from, and the hash of each file
+    it wrote. A step is up to date while its page and the Hipposcraper
+    version are unchanged and every recorded file still exists. A file whose
+    content does not match its recorded hash (or that has none, e.g. in a
+    directory created before manifests were kept) counts as edited by the
+    user and is not overwritten unless `force` is set.
+
+    Args:
+        path (str): path of the project directory
+        force (bool): regenerate every step and overwrite edited files
+
+    Attributes:
+        path (str): path of the project directory
+        force (bool): regenerate every step and overwrite edited files
+        version (str): Hipposcraper version the outputs were generated by
+        pages (dict): hash of the project page, per step
+        files (dict): hash of each generated file, by relative path
+        tests (list): relative paths of the generated test files of
+            examples (see `TestFileScraper`)
+        skipped (list): relative paths of edited files left alone
+    """
+    basename = '.hipposcraper.json'
+
+    def __init__(self, path, force=False):
+        self.path = os.fspath(path)
+        self.force = force
+        self.version = None
+        self.pages = {}
+        self.files = {}
+        self.tests = []
+        self.skipped = []
+        self.load()
+
+    def load(self):
+        """Load the manifest, if the project directory has one."""
+        try:
+            with open(os.path.join(self.path, self.basename), 'r') as istream:
+                data = json.load(istream)
+            self.version = data['version']
+            self.pages = dict(data['pages'])
+            self.files = dict(data['files'])
+            # Manifests written before test files were recorded have none
+            self.tests = list(data.get('tests', ()))
+        except (OSError, ValueError, KeyError, TypeError):
+            self.version, self.pages, self.files = None, {}, {}
+            self.tests = []
+
+    def save(self):
+        """Save the manifest in the project directory and return the path."""
+        data = {
+            'version': hipposcraper.__version__,
+            'pages': self.pages,
+            'files': self.files,
+            'tests': sorted(self.tests),
+        }
+        text = json.dumps(data, indent=2, sort_keys=True) + '\n'
+        return OutputDir(self.path).write(self.basename, text)
+
+    @property
+    def tasks(self):
+        """Get the generated files that are not test files, in order."""
+        tests = set(self.tests)
+        return sorted(name for name in self.files if name not in tests)
+
+    def is_current(self, step, page_hash):
+        """Check whether a step is up to date for a project page.
+
+        A step is up to date if it was generated from the same page by the
+        same Hipposcraper version and none of the recorded files has been
+        deleted since. Files are only checked to exist, not hashed.
+        Nothing is up to date when `force` is set.
+        """
+        if (self.force or self.version != hipposcraper.__version__ or
+                self.pages.get(step) != page_hash):
+            return False
+        return all(os.path.exists(os.path.join(self.path, name))
+                   for name in self.files)
+
+    def update(self, step, page_hash):
+        """Record the project page a step was generated from."""
+        self.pages[step] = page_hash
+
+    def add_test(self, path):
+        """Record that a file is the test file of an example."""
+        name = os.path.relpath(path, self.path)
+        if name not in self.tests:
+            self.tests.append(name)
+
+    def claim(self, path, data):
+        """Decide whether to write a file and record its hash.
+
+        Args:
+            path (str): path of the file
+            data (str): content to write
+
+        Returns:
+            write (bool): False if the file already holds `data`, or if the
+                user has edited it since it was generated (unless `force`
+                is set)
+        """
+        name = os.path.relpath(path, self.path)
+        if name == os.pardir or name.startswith(os.pardir + os.sep):
+            return True
+        new = digest(data)
+        try:
+            with open(path, 'rb') as istream:
+                old = digest(istream.read())
+        except FileNotFoundError:
+            old = None
+        if (old is not None and old != new and
+                old != self.files.get(name) and not self.force):
+            LOGGER.warning("     [SKIP] %s has been edited; not overwriting.",
+                           name)
+            self.skipped.append(name)
+            return False
+        self.files[name] = new
+        return old != new
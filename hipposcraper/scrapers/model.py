@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Module for the project model
+
+Everything the scrapers use from a project page, extracted into immutable
+records of plain strings. Nothing in a model refers back to the parse tree,
+so the tree can be freed as soon as the page has been extracted.
+
+A value the page does not hold (or holds in an unexpected shape) is None.
+
+Models may outlive the code that extracted them (see `ModelCache`): bump
+`VERSION` whenever a change to the extraction changes what a model holds.
+"""
+import collections
+
+from bs4 import Tag
+
+from . page_index import PageIndex
+
+VERSION = 1
+
+Resource = collections.namedtuple('Resource', ['name', 'url'])
+Resource.__doc__ = """Link listed under the Resources of a project page."""
+
+ProjectModel = collections.namedtuple('ProjectModel', [
+    'title',
+    'project_type',
+    'directory',
+    'readme_dir',
+    'objectives',
+    'task_titles',
+    'task_bodies',
+    'files',
+    'prototypes',
+    'examples',
+    'resources',
+    'putchar',
+    'header',
+    'ruby',
+])
+ProjectModel.__doc__ = """Everything the scrapers use from a project page.
+
+Attributes:
+    title (str): title of the project
+    project_type (str): name of the project's GitHub repository
+    directory (str): name of the project directory
+    readme_dir (str): directory named after the repository, for README.md
+    objectives (tuple): lines of the learning objectives
+    task_titles (tuple): title of each task
+    task_bodies (tuple): description of each task
+    files (tuple): text after each "File: " of the page
+    prototypes (tuple): text after each "Prototype: " of the page
+    examples (tuple): text of each example (`pre` tag) of the page
+    resources (tuple): Resource of each link under the Resources heading
+    putchar (str): function named as allowed to use, such as "_putchar"
+    header (str): name of the C header file to push
+    ruby (bool): whether the project asks for ruby scripts
+"""
+
+
+def from_dict(fields):
+    """Rebuild a ProjectModel from the dict of its fields.
+
+    This undoes `ProjectModel._asdict` once it went through JSON, which
+    turns tuples into lists.
+
+    Raises:
+        ValueError: if the fields are not those of a ProjectModel
+    """
+    if not isinstance(fields, dict) or set(fields) != set(
+            ProjectModel._fields):
+        raise ValueError('not the fields of a ProjectModel')
+    values = {name: as_tuple(value) for name, value in fields.items()}
+    if values['resources'] is not None:
+        values['resources'] = tuple(
+            Resource(*item) for item in values['resources']
+        )
+    return ProjectModel(**values)
+
+
+def as_tuple(value):
+    """Turn lists into tuples, however deeply nested."""
+    if isinstance(value, list):
+        return tuple(as_tuple(item) for item in value)
+    return value
+
+
+def text(node):
+    """Get the text of a node as a plain string, or None."""
+    if node is None:
+        return None
+    return str(node.text)
+
+
+def attempt(func):
+    """Call a function, getting None if it trips over a missing node."""
+    try:
+        return func()
+    except AttributeError:
+        return None
+
+
+def next_text(node):
+    """Get the text of the sibling after a string, or None."""
+    return attempt(lambda: text(node.next_sibling))
+
+
+def tag_text(node):
+    """Get the text of a node if it is a Tag, else None."""
+    if isinstance(node, Tag):
+        return str(node.text)
+    return None
+
+
+def find_readme_dir(index):
+    """Get the text of the list item after the GitHub repository."""
+    return attempt(lambda: text(
+        index.repo.next_element.find_next("li").next_element.next_element
+    ))
+
+
+def find_objectives(index):
+    """Get the lines of the learning objectives."""
+    def find():
+        h2 = index.heading("Learning Objectives")
+        return tuple(text(
+            h2.find_next("h3").next_element.next_element.next_element
+        ).splitlines())
+    return attempt(find)
+
+
+def find_resources(index):
+    """Get the links listed under the Resources heading."""
+    def find():
+        ul = index.heading("Resources").find_next("p").find_next('ul')
+        return tuple(
+            Resource(str(item.text), str(item['href']))
+            for item in ul.find_all("a", href=True)
+        )
+    return attempt(find)
+
+
+def find_putchar(index):
+    """Get the function named after "You are allowed to use", if any."""
+    match = index.putchar
+    if match is not None and len(match) == 23:
+        return next_text(match)
+    return None
+
+
+def find_header(index):
+    """Get the name of the C header file to push, if any."""
+    return attempt(lambda: str(
+        index.header.previous_element.previous_element.previous_element
+    ))
+
+
+def extract_project(soup, index=None):
+    """Extract everything the scrapers use from a parsed project page.
+
+    Args:
+        soup (obj): BeautifulSoup obj containing parsed link
+        index (obj): PageIndex of `soup`, built if not given
+
+    Returns:
+        project (obj): ProjectModel of the page
+    """
+    if index is None:
+        index = PageIndex(soup)
+    return ProjectModel(
+        title=text(index.title),
+        project_type=attempt(lambda: tag_text(index.repo.next_sibling)),
+        directory=attempt(lambda: tag_text(index.directory.next_element)),
+        readme_dir=find_readme_dir(index),
+        objectives=find_objectives(index),
+        task_titles=tuple(
+            attempt(lambda: str(tag.next_element.strip("\n").strip()))
+            for tag in index.task_titles
+        ),
+        task_bodies=tuple(text(body) for body in index.task_bodies),
+        files=tuple(next_text(item) for item in index.files),
+        prototypes=tuple(next_text(item) for item in index.prototypes),
+        examples=tuple(text(item) for item in index.examples),
+        resources=find_resources(index),
+        putchar=find_putchar(index),
+        header=find_header(index),
+        ruby=index.ruby,
+    )
+
+
+def as_project(page, index=None):
+    """Get the ProjectModel of a page, extracting it from a parse tree."""
+    if isinstance(page, ProjectModel):
+        return page
+    return extract_project(page, index)
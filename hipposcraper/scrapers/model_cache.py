@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Module for ModelCache"""
+import json
+import os
+
+import hipposcraper
+from . import model
+from . output_dir import write_cache
+
+
+class ModelCache:
+    """ModelCache class
+
+    On-disk cache of project models, keyed by the hash of the page they
+    were extracted from.
+
+    A cached model is only used while the Hipposcraper version and the
+    version of the extraction (`model.VERSION`) it was stored with are
+    unchanged, so a page is parsed again once the code extracting it
+    changes. A page whose hash is cached is never parsed at all.
+
+    Args:
+        dirname (str): directory to keep cached models in
+
+    Attributes:
+        dirname (str): directory to keep cached models in
+        version (str): versions the cached models must have been stored with
+    """
+    version = '{}+{}'.format(hipposcraper.__version__, model.VERSION)
+
+    def __init__(self, dirname=None):
+        if dirname is None:
+            dirname = os.path.join(hipposcraper.CACHE_HOME, 'models')
+        self.dirname = dirname
+
+    def path(self, page_hash):
+        """Get the path of the cache file for a page."""
+        return os.path.join(self.dirname, page_hash + '.json')
+
+    def load(self, page_hash):
+        """Load the model of a page.
+
+        Returns:
+            project (obj): ProjectModel of the page, or None if not cached
+        """
+        try:
+            with open(self.path(page_hash), 'r') as istream:
+                data = json.load(istream)
+            if data['version'] != self.version:
+                return None
+            return model.from_dict(data['project'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, page_hash, project):
+        """Cache the model of a page (see `write_cache`)."""
+        data = {'version': self.version, 'project': project._asdict()}
+        write_cache(self.path(page_hash),
+                    json.dumps(data, separators=(',', ':')))
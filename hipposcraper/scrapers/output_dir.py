@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Module for OutputDir"""
+import io
+import os
+import secrets
+import time
+
+from .. import LOGGER, metrics
+
+
+def atomic_write(path, data):
+    """Write a file all at once.
+
+    The data (str or bytes) is written to a temporary file that is then
+    renamed over the target, so readers never see a half-written file and a
+    failed write leaves any previous file untouched. The permissions of the
+    file being replaced are kept.
+    """
+    head, tail = os.path.split(path)
+    tmp = os.path.join(head, '.{}.{}.tmp'.format(tail, secrets.token_hex(4)))
+    mode = 'xb' if isinstance(data, bytes) else 'x'
+    try:
+        with open(tmp, mode) as ostream:
+            ostream.write(data)
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def write_cache(path, data):
+    """Write a cache file all at once (see `atomic_write`).
+
+    Caches only save work, so a file that cannot be written (e.g. to a
+    read-only or full disk) is logged and left out.
+
+    Returns:
+        written (bool): whether the file was written
+    """
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        atomic_write(path, data)
+    except OSError as error:
+        LOGGER.warning("     [WARN] Failed to cache %s: %s", path, error)
+        return False
+    return True
+
+
+class PendingFile(io.StringIO):
+    """PendingFile class
+
+    File opened for writing under an OutputDir with a manifest. What is
+    written is kept in memory and handed to `OutputDir.write` on close.
+
+    Args:
+        folder (obj): OutputDir the file belongs to
+        name (str): name of the file under `folder`
+    """
+
+    def __init__(self, folder, name):
+        super().__init__()
+        self.__folder = folder
+        self.__name = name
+
+    def close(self):
+        """Write the file, unless it is unchanged or was edited."""
+        if not self.closed:
+            data = self.getvalue()
+            super().close()
+            self.__folder.write(self.__name, data)
+
+
+class OutputDir:
+    """OutputDir class
+
+    Directory that scrapers create files in.
+
+    Every path given to its methods is relative to `path`, so nothing
+    depends on (or changes) the working directory of the process, and
+    several projects can be written at once.
+
+    With a manifest (see `manifest.Manifest`), files are only written if
+    their content changed, and files the user has edited are left alone.
+
+    Args:
+        path (str): path of the directory
+        manifest (obj): Manifest guarding writes to the project directory
+
+    Attributes:
+        path (str): path of the directory
+        manifest (obj): Manifest guarding writes to the project directory
+    """
+
+    def __init__(self, path='.', manifest=None):
+        self.path = os.fspath(path)
+        self.manifest = manifest
+
+    def __fspath__(self):
+        return self.path
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.path)
+
+    def join(self, *names):
+        """Get the path of a file under the directory."""
+        return os.path.join(self.path, *names)
+
+    def sub(self, name):
+        """Get the OutputDir of a subdirectory."""
+        return type(self)(self.join(name), self.manifest)
+
+    def exists(self, name=''):
+        """Check whether a file exists under the directory."""
+        return os.path.exists(self.join(name))
+
+    def mkdir(self, name='', mode=0o755, exist_ok=True):
+        """Create a directory (and its parents) under the directory."""
+        os.makedirs(self.join(name), mode=mode, exist_ok=exist_ok)
+
+    def open(self, name, mode='r'):
+        """Open a file under the directory.
+
+        With a manifest, a file opened for writing is written on close.
+        """
+        if self.manifest is not None and 'w' in mode and 'b' not in mode:
+            head = os.path.dirname(self.join(name))
+            if not os.path.isdir(head or os.curdir):
+                raise FileNotFoundError('No such directory: {}'.format(head))
+            return PendingFile(self, name)
+        return open(self.join(name), mode)
+
+    def write(self, name, data):
+        """Write a file under the directory all at once (see `atomic_write`).
+
+        Returns:
+            path (str): path of the file written
+        """
+        path = self.join(name)
+        start = time.perf_counter()
+        if self.manifest is not None and not self.manifest.claim(path, data):
+            self.__record(path, data, start, False)
+            return path
+        atomic_write(path, data)
+        self.__record(path, data, start, True)
+        return path
+
+    @staticmethod
+    def __record(path, data, start, written):
+        """Record a write (or a skipped write) while metrics are enabled."""
+        record = metrics.active()
+        if record is not None:
+            record.write(path, time.perf_counter() - start, len(data), written)
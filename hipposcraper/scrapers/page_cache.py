@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Module for PageCache"""
+import hashlib
+import json
+import os
+
+import hipposcraper
+from . output_dir import write_cache
+
+
+class PageCache:
+    """PageCache class
+
+    On-disk cache of project pages, keyed by URL.
+
+    Each page is stored with the validators (ETag and Last-Modified) it was
+    served with, so it can be revalidated with a conditional request.
+
+    Args:
+        dirname (str): directory to keep cached pages in
+
+    Attributes:
+        dirname (str): directory to keep cached pages in
+    """
+
+    def __init__(self, dirname=None):
+        if dirname is None:
+            dirname = os.path.join(hipposcraper.CACHE_HOME, 'pages')
+        self.dirname = dirname
+
+    def path(self, url, ext):
+        """Get the path of a cache file for a URL."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.dirname, key + ext)
+
+    def load(self, url):
+        """Load a cached page.
+
+        Returns:
+            entry (tuple): page content and validators, or None if not cached
+        """
+        try:
+            with open(self.path(url, '.json'), 'r') as istream:
+                validators = json.load(istream)
+            with open(self.path(url, '.html'), 'rb') as istream:
+                content = istream.read()
+        except (OSError, ValueError):
+            return None
+        return content, validators
+
+    @staticmethod
+    def headers(validators):
+        """Get the headers that revalidate a cached page."""
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def save(self, url, resp):
+        """Cache the page held by a response (see `write_cache`)."""
+        validators = {
+            'url': url,
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+        }
+        # The validators must not outlive the page they were served with
+        if write_cache(self.path(url, '.html'), resp.content):
+            write_cache(self.path(url, '.json'), json.dumps(validators))
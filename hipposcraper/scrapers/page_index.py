@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Module for PageIndex"""
+from bs4 import Comment, NavigableString, Tag
+
+
+class PageIndex:
+    """PageIndex class
+
+    Index of a parsed project page, built in a single walk of the tree.
+
+    Each scraper looks up what it needs here instead of searching the whole
+    tree again. Strings are indexed in document order, as `find_all` would
+    return them.
+
+    Args:
+        soup (obj): BeautifulSoup obj containing parsed link
+
+    Attributes:
+        title (obj): first `h1` Tag of the page
+        headings (list): `h2` Tags of the page
+        task_titles (list): `h4.task` Tags of the page
+        task_bodies (list): Tags following each " Task Body " comment
+        examples (list): `pre` Tags of the page
+        files (list): "File: " strings of the page
+        prototypes (list): "Prototype: " strings of the page
+        repo (obj): first "GitHub repository: " string of the page
+        directory (obj): first "Directory: " string of the page
+        putchar (obj): first "You are allowed to use" string of the page
+        header (obj): first "forget to push your header file" string
+        ruby (bool): whether "env ruby" appears on the page
+    """
+
+    def __init__(self, soup):
+        self.title = None
+        self.headings = []
+        self.task_titles = []
+        self.task_bodies = []
+        self.examples = []
+        self.files = []
+        self.prototypes = []
+        self.repo = None
+        self.directory = None
+        self.putchar = None
+        self.header = None
+        self.ruby = False
+        self.index(soup)
+
+    def index(self, soup):
+        """Walk the tree once and record everything the scrapers need."""
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                if node.name == 'pre':
+                    self.examples.append(node)
+                elif node.name == 'h4' and 'task' in node.get('class', ()):
+                    self.task_titles.append(node)
+                elif node.name == 'h2':
+                    self.headings.append(node)
+                elif node.name == 'h1' and self.title is None:
+                    self.title = node
+                continue
+            if not isinstance(node, NavigableString):
+                continue
+            if isinstance(node, Comment) and node == " Task Body ":
+                self.task_bodies.append(
+                    getattr(node.next_element, 'next_element', None)
+                )
+            if "File: " in node:
+                self.files.append(node)
+            if "Prototype: " in node:
+                self.prototypes.append(node)
+            if self.repo is None and "GitHub repository: " in node:
+                self.repo = node
+            if self.directory is None and "Directory: " in node:
+                self.directory = node
+            if self.putchar is None and "You are allowed to use" in node:
+                self.putchar = node
+            if (self.header is None and
+                    "forget to push your header file" in node):
+                self.header = node
+            if not self.ruby and "env ruby" in node:
+                self.ruby = True
+
+    def heading(self, text):
+        """Get the first `h2` Tag whose string contains `text`."""
+        for tag in self.headings:
+            if tag.string is not None and text in tag.string:
+                return tag
+        return None
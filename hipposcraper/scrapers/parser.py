@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Module for choosing the HTML parser backend"""
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+# Parser backends in order of preference (fastest first)
+PARSERS = ('lxml', 'html.parser')
+
+
+def find_parser(name=None):
+    """Get the name of the HTML parser backend to use.
+
+    The backend is, in order: `name`, the HIPPOSCRAPER_PARSER environment
+    variable, or the first backend in `PARSERS` that is installed.
+
+    Args:
+        name (str): name of a BeautifulSoup tree builder, e.g. "lxml"
+
+    Raises:
+        ValueError: if the requested backend is not installed
+    """
+    name = name or os.getenv('HIPPOSCRAPER_PARSER')
+    if name:
+        if builder_registry.lookup(name) is None:
+            raise ValueError('Parser is not available: {}'.format(name))
+        return name
+    for name in PARSERS:
+        if builder_registry.lookup(name) is not None:
+            return name
+    return 'html.parser'
+
+
+def make_soup(markup, parser=None, **kwgs):
+    """Parse markup with the chosen parser backend (see `find_parser`)."""
+    return BeautifulSoup(markup, features=find_parser(parser), **kwgs)
+
+
+def parse_only(markup, name=None, attrs=None, parser=None):
+    """Parse only the elements of markup that match `name` and `attrs`.
+
+    Everything else is skipped while parsing, so picking a few elements out
+    of a large page costs little time or memory.
+
+    Args:
+        markup (str): markup to parse
+        name (str): tag name (or list of names) to keep
+        attrs (dict): attribute values (or lists of values) to match
+        parser (str): HTML parser backend (see `find_parser`)
+    """
+    strainer = SoupStrainer(name, attrs or {})
+    return make_soup(markup, parser, parse_only=strainer)
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Module for ReadScraper"""
+import io
 import json
-import re
 import sys
 
-from bs4 import Comment
+import hipposcraper
+from .. import LOGGER, metrics
+from . errors import ParseError
+from . model import as_project
+from . output_dir import OutputDir
 
 
 class ReadScraper:
@@ -13,7 +17,10 @@ class ReadScraper:
     README.md scraper
 
     Args:
-        soup (obj): BeautifulSoup obj containing parsed link
+        project (obj): ProjectModel of the project page (or its parse tree)
+        root (obj): OutputDir (or path) holding the project directory
+        index (obj): PageIndex of a parse tree, built if not given
+        base_url (str): intranet URL (default: `hipposcraper.BASE_URL`)
 
     Attributes:
         title (str):
@@ -24,8 +31,10 @@ class ReadScraper:
     task_info = []
     readme = None
 
-    def __init__(self, soup):
-        self.soup = soup
+    def __init__(self, project, root='.', index=None, base_url=None):
+        self.project = as_project(project, index)
+        self.base_url = base_url or hipposcraper.BASE_URL
+        self.root = root if isinstance(root, OutputDir) else OutputDir(root)
         self.title = self.find_title()
         self.repo_name = self.find_repo_name()
         self.dir_name = self.check_big_project()
@@ -35,195 +44,179 @@ class ReadScraper:
         self.task_info = self.find_task_de()
         self.prj_rsc = self.find_resources()
 
+    @metrics.timed()
     def find_title(self):
         """Method that finds title of project"""
-        prj_title = self.soup.find("h1")
-        return prj_title.text
+        if self.project.title is None:
+            raise ParseError('Failed to find project title.')
+        return self.project.title
 
+    @metrics.timed()
     def find_repo_name(self):
         """Method that finds the repository name"""
-        r_name = self.soup.find(string=re.compile("GitHub repository: "))
-        return r_name.next_element
+        return self.project.project_type
 
+    @metrics.timed()
     def check_big_project(self):
         """Method that checks if project is a big one"""
-        try:
-            tmp = self.repo_name.find_next("li").next_element.next_element.text
-            if "-" not in tmp:
-                raise AttributeError
-            return tmp
-        except AttributeError:
-            print("     [ERROR] Failed to find directory name.")
+        tmp = self.project.readme_dir
+        if tmp is None or "-" not in tmp:
+            LOGGER.error("     [ERROR] Failed to find directory name.")
             self.big_project_type = 1
             return ""
+        return tmp
 
+    @metrics.timed()
     def find_learning(self):
         """Method that finds the learning objectives"""
-        try:
-            h2 = self.soup.find("h2", string=re.compile("Learning Objectives"))
-            lu = h2.find_next("h3").next_element.next_element.next_element
-            txt = lu.text
-            return txt.splitlines()
-        except AttributeError:
-            print("     [ERROR] Failed to scrape learning objectives.")
+        if self.project.objectives is None:
+            LOGGER.error("     [ERROR] Failed to scrape learning objectives.")
             return ""
+        return list(self.project.objectives)
 
+    @metrics.timed()
     def find_files(self):
         """Method that finds file names"""
         temp = []
-        try:
-            file_list = self.soup.find_all(string=re.compile("File: "))
-            for idx in file_list:
-                file_text = idx.next_sibling.text
-                # Finding comma index for multiple files listed
-                find_comma = file_text.find(",")
-                if find_comma != -1:
-                    temp.append(file_text[:find_comma])
-                else:
-                    temp.append(file_text)
-            return temp
-        except (IndexError, AttributeError):
-            print("     [ERROR] Failed to extract file names.")
-            return None
-
+        for file_text in self.project.files:
+            if file_text is None:
+                LOGGER.error("     [ERROR] Failed to extract file names.")
+                return None
+            # Finding comma index for multiple files listed
+            find_comma = file_text.find(",")
+            if find_comma != -1:
+                temp.append(file_text[:find_comma])
+            else:
+                temp.append(file_text)
+        return temp
+
+    @metrics.timed()
     def find_tasks(self):
         """Method that finds task names"""
-        temp = []
-        try:
-            task_list = self.soup.find_all("h4", class_="task")
-            for idx in task_list:
-                item = idx.next_element.strip("\n").strip()
-                temp.append(item)
-            return temp
-        except (IndexError, AttributeError):
-            print("     [ERROR] Failed to extract task names.")
+        if None in self.project.task_titles:
+            LOGGER.error("     [ERROR] Failed to extract task names.")
             return None
+        return list(self.project.task_titles)
 
+    @metrics.timed()
     def find_task_de(self):
         """Method that finds the task descriptions"""
-        temp = []
-        try:
-            info_list = self.soup.find_all(string=lambda text: isinstance
-                                           (text, Comment))
-            for comments in info_list:
-                if comments == " Task Body ":
-                    info_text = comments.next_element.next_element.text
-                    temp.append(info_text)
-            return temp
-        except (IndexError, AttributeError):
-            print("     [ERROR] Failed to extract task descriptions.")
-            return None
+        return list(self.project.task_bodies)
 
+    @metrics.timed()
     def find_resources(self):
         """Method that finds the resources"""
-        try:
-
-            h2 = self.soup.find("h2", string=re.compile("Resources"))
-            p = h2.find_next("p")
-            ul = p.findNext('ul')
-            urls = []
-            names = []
-            for item in ul.find_all("a", href=True):
-                url = item['href']
-                name = item.text
-                if (url.startswith('/rltoken/')):
-                    url = 'https://intranet.hbtn.io' + url
-                urls.append(url)
-                names.append(name)
-            links = [names, urls]
-            return links
-        except AttributeError:
-            print("     [ERROR] Failed to extract resource list.")
+        if self.project.resources is None:
+            LOGGER.error("     [ERROR] Failed to extract resource list.")
             return ""
+        urls = []
+        names = []
+        for name, url in self.project.resources:
+            if (url.startswith('/rltoken/')):
+                url = self.base_url + url
+            urls.append(url)
+            names.append(name)
+        links = [names, urls]
+        return links
 
     def open_readme(self):
-        """Method that opens the README.md file"""
-        try:
-            if self.big_project_type == 1:
-                raise IOError
-            filename = self.dir_name + "/README.md"
-            self.readme = open(filename, "w+")
-        except IOError:
-            self.readme = open("README.md", "w")
-
+        """Method that starts README.md in memory
+
+        Nothing is written to disk until `save_readme` is called.
+        """
+        self.readme = io.StringIO()
+
+    @metrics.timed()
+    def save_readme(self):
+        """Method that saves README.md in a single write
+
+        README.md is created in the project directory if there is one, else
+        in `root`. It replaces any previous README.md all at once, so a
+        failed run never leaves it half-written.
+
+        Returns:
+            path (str): path of README.md
+        """
+        folder = self.root
+        if self.big_project_type != 1 and self.root.exists(self.dir_name):
+            folder = self.root.sub(self.dir_name)
+        text = self.readme.getvalue()
+        self.readme.close()
+        return folder.write("README.md", text)
+
+    @metrics.timed()
     def write_title(self):
         """Method that writes the title to README.md"""
-        print("  -> Writing project title...")
-        self.readme.write("# {}\n".format(self.title))
-        self.readme.write("\n")
-        print("     Done.")
+        LOGGER.debug("  -> Writing project title...")
+        self.readme.write("# {}\n\n".format(self.title))
+        LOGGER.debug("     Done.")
 
+    @metrics.timed()
     def write_info(self):
         """Method that writes project info to README.md"""
-        print("  -> Writing learning objectives...")
-        self.readme.write("## Learning Objectives:bulb:\n")
-        self.readme.write("What you should learn from this project:\n")
+        LOGGER.debug("  -> Writing learning objectives...")
+        lines = [
+            "## Learning Objectives:bulb:\n",
+            "What you should learn from this project:\n",
+        ]
         try:
             for item in self.prj_info:
                 if len(item) == 0:
-                    self.readme.write("{}\n".format(item))
+                    lines.append("{}\n".format(item))
                     continue
-                self.readme.write("* {}\n".format(item))
-            print("     Done.")
+                lines.append("* {}\n".format(item))
+            LOGGER.debug("     Done.")
         except (AttributeError, IndexError):
-            print("     [ERROR] Failed to write learning objectives.")
+            LOGGER.error("     [ERROR] Failed to write learning objectives.")
             pass
-        self.readme.write("\n")
-        self.readme.write("---\n")
+        lines.append("\n---\n")
+        self.readme.write("".join(lines))
 
+    @metrics.timed()
     def write_tasks(self):
         """Method that writes the entire tasks to README.md"""
         if not (self.task_names is None or
                 self.file_names is None or
                 self.task_info is None):
-            print("  -> Writing task information...")
-            count = 0
-            while count < len(self.task_names):
+            LOGGER.debug("  -> Writing task information...")
+            lines = []
+            for count, task_name in enumerate(self.task_names):
+                lines.append("\n")
                 try:
-                    self.readme.write("\n")
-                    self.readme.write("### [{}](./{})\n".format(
-                        self.task_names[count], self.file_names[count]))
-                    self.readme.write("* {}\n".format(
-                        self.task_info[count]))
-                    self.readme.write("\n")
-                    count += 1
+                    lines.append("### [{}](./{})\n".format(
+                        task_name, self.file_names[count]))
+                    lines.append("* {}\n\n".format(self.task_info[count]))
                 except IndexError:
-                    print("     [ERROR] Failed to write task {}".format(
-                        self.task_names[count]
+                    LOGGER.error("     [ERROR] Failed to write task {}".format(
+                        task_name
                     ))
-                    count += 1
-                    continue
-            print("     Done.")
+            self.readme.write("".join(lines))
+            LOGGER.debug("     Done.")
 
+    @metrics.timed()
     def write_footer(self, author, user, git_link):
         """Method that writes the footer to README.md"""
-        print("  -> Writing author information...")
-        self.readme.write("---\n")
-        self.readme.write("\n")
-        self.readme.write("## Author\n")
-        self.readme.write("* **{}** - ".format(author))
-        self.readme.write("[{}]".format(user))
-        self.readme.write("({})".format(git_link))
-        print("     Done.")
+        LOGGER.debug("  -> Writing author information...")
+        self.readme.write("---\n\n## Author\n* **{}** - [{}]({})".format(
+            author, user, git_link))
+        LOGGER.debug("     Done.")
 
+    @metrics.timed()
     def write_rsc(self):
         """Method that writes project info to README.md"""
-        print("  -> Writing resources...")
-        self.readme.write("## Resources:books:\n")
-        self.readme.write("Read or watch:\n")
+        LOGGER.debug("  -> Writing resources...")
+        lines = ["## Resources:books:\n", "Read or watch:\n"]
         try:
             res = self.prj_rsc
             for idx in range(len(res[0])):
                 if len(res[0][idx]) == 0:
-                    self.readme.write("{}".format(res[0][idx]))
-                    self.readme.write("{}\n".format(res[1][idx]))
+                    lines.append("{}{}\n".format(res[0][idx], res[1][idx]))
                     continue
-                self.readme.write("* [{}]".format(res[0][idx]))
-                self.readme.write("({})\n".format(res[1][idx]))
+                lines.append("* [{}]({})\n".format(res[0][idx], res[1][idx]))
 
-            print("     Done.")
+            LOGGER.debug("     Done.")
         except (AttributeError, IndexError):
-            print("     [ERROR] Failed to write resources.")
+            LOGGER.error("     [ERROR] Failed to write resources.")
             pass
-        self.readme.write("\n")
-        self.readme.write("---\n")
+        lines.append("\n---\n")
+        self.readme.write("".join(lines))
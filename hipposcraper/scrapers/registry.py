@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Module for the registry of scrapers by project type
+
+A project's type is the name of its repository, such as
+"holbertonschool-low_level_programming". Each curriculum registers the
+suffix of its repository name with the scraper class that creates its task
+files. A scraper may be given as a class or as a "module:Class" string, in
+which case its module is only imported once a project needs it.
+
+Other packages can add curricula without touching this one by declaring
+entry points in the "hipposcraper.scrapers" group, named by the suffix:
+
+    entry_points={
+        "hipposcraper.scrapers": [
+            "blockchain = my_package.scrapers:BlockchainScraper",
+        ],
+    }
+
+Entry points are read the first time a project type is looked up, and
+their modules are imported only when a project of that type is scraped.
+"""
+import importlib
+import threading
+
+from . errors import ParseError
+
+ENTRY_POINT_GROUP = 'hipposcraper.scrapers'
+
+BUILTIN_SCRAPERS = {
+    'low_level_programming': '.low_scraper:LowScraper',
+    'higher_level_programming': '.high_scraper:HighScraper',
+    'system_engineering-devops': '.sys_scraper:SysScraper',
+    'system_linux': '.low_scraper:LowScraper',
+    'system_algorithms': '.low_scraper:LowScraper',
+    'machine_learning': '.high_scraper:HighScraper',
+    'web_front_end': '.high_scraper:HighScraper',
+    'webstack': '.high_scraper:HighScraper',
+    'interview': '.high_scraper:HighScraper',
+}
+
+
+def entry_points(group):
+    """Get the entry points installed in a group."""
+    try:
+        from importlib import metadata
+    except ImportError:
+        return []
+    found = metadata.entry_points()
+    if hasattr(found, 'select'):
+        return list(found.select(group=group))
+    return list(found.get(group, ()))
+
+
+def load(spec):
+    """Get a scraper class from a class, an entry point or "module:Class".
+
+    Modules named relative to this package (".low_scraper") are resolved
+    against it.
+    """
+    if isinstance(spec, str):
+        module, _, name = spec.partition(':')
+        return getattr(importlib.import_module(module, __package__), name)
+    if hasattr(spec, 'load') and not isinstance(spec, type):
+        return spec.load()
+    return spec
+
+
+class ScraperRegistry:
+    """ScraperRegistry class
+
+    Map suffixes of repository names to scrapers.
+
+    Finding a scraper takes one dictionary lookup per distinct suffix
+    length, longest first, however many curricula are registered.
+
+    Args:
+        scrapers (dict): scrapers to register, by suffix
+        group (str): entry point group to load more scrapers from (None to
+            load none)
+    """
+
+    def __init__(self, scrapers=None, group=None):
+        self.__table = {}
+        self.__lengths = ()
+        self.__group = group
+        self.__lock = threading.RLock()
+        for suffix, scraper in (scrapers or {}).items():
+            self.register(suffix, scraper)
+
+    def __contains__(self, suffix):
+        self.load_plugins()
+        return suffix in self.__table
+
+    def suffixes(self):
+        """List the registered suffixes."""
+        self.load_plugins()
+        return sorted(self.__table)
+
+    def register(self, suffix, scraper=None):
+        """Register a scraper for repositories ending in `suffix`.
+
+        A suffix registered again is taken over by the new scraper. Without
+        a scraper, return a decorator registering the class it decorates.
+
+        Args:
+            suffix (str): end of the repository name
+            scraper (obj): scraper class, or "module:Class"
+        """
+        if scraper is None:
+            def decorate(cls):
+                self.register(suffix, cls)
+                return cls
+            return decorate
+        if not suffix:
+            raise ValueError('suffix must not be empty')
+        with self.__lock:
+            self.__table[suffix] = scraper
+            self.__lengths = tuple(sorted(
+                {len(key) for key in self.__table}, reverse=True
+            ))
+        return scraper
+
+    def load_plugins(self):
+        """Register the scrapers declared as entry points, once."""
+        if self.__group is None:
+            return
+        with self.__lock:
+            if self.__group is None:
+                return
+            for entry_point in entry_points(self.__group):
+                self.register(entry_point.name, entry_point)
+            self.__group = None
+
+    def lookup(self, project_type):
+        """Find the scraper for a project type, if there is one.
+
+        Returns:
+            scraper (obj): scraper class, or None
+        """
+        if not project_type:
+            return None
+        self.load_plugins()
+        table = self.__table
+        for length in self.__lengths:
+            suffix = project_type[-length:]
+            spec = table.get(suffix)
+            if spec is not None:
+                break
+        else:
+            return None
+        scraper = load(spec)
+        if scraper is not spec:
+            # Keep the class, so its module is resolved only once
+            with self.__lock:
+                if table.get(suffix) is spec:
+                    table[suffix] = scraper
+        return scraper
+
+    def find(self, project_type):
+        """Find the scraper for a project type.
+
+        Raises:
+            ParseError: if no scraper handles the project type
+        """
+        scraper = self.lookup(project_type)
+        if scraper is None:
+            raise ParseError('Failed to determine project type.')
+        return scraper
+
+
+REGISTRY = ScraperRegistry(BUILTIN_SCRAPERS, group=ENTRY_POINT_GROUP)
+
+find_scraper = REGISTRY.find
+register_scraper = REGISTRY.register
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Module for IntranetSession"""
+import email.utils
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import hipposcraper
+from .. import LOGGER, metrics
+from .. config import Credentials
+from . errors import AuthError, FetchError
+from . parser import parse_only
+
+
+class IntranetSession(requests.Session):
+    """IntranetSession class
+
+    Authenticated intranet session shared by every project of a run.
+
+    Connections are pooled and kept alive between requests, and the sign-in
+    flow only runs when the intranet redirects a request to the sign-in page.
+    The session may be shared between threads; at most `max_requests`
+    requests are in flight at any time. Pages are revalidated against
+    `cache` when one is given, and only served from it when `offline`.
+    Cookies are loaded from `cookie_store` when one is given, and saved back
+    to it after signing in and when the session is closed.
+
+    Every request times out after `timeout` seconds (connecting, reading).
+    Requests that fail to connect or time out, and responses with a status
+    in `RETRY_STATUSES`, are retried up to `retries` times. Retries wait as
+    long as the Retry-After header asks, or else back off exponentially
+    from `backoff` seconds with random jitter, up to `max_backoff` seconds.
+
+    Args:
+        credentials (dict): user credentials (see `config.Credentials`)
+        pool_size (int): number of connections to keep alive per host
+        max_requests (int): maximum number of concurrent requests
+        cache (obj): PageCache to keep fetched pages in
+        offline (bool): whether to serve pages only from `cache`
+        cookie_store (obj): config.Cookies store to persist cookies in
+        base_url (str): intranet URL (default: `hipposcraper.BASE_URL`)
+        timeout (tuple): connect and read timeouts, in seconds
+        retries (int): number of times to retry a failed request
+        backoff (float): seconds to wait before the first retry
+
+    Attributes:
+        user_data (dict): read json data from credentials.json
+        base_url (str): intranet URL
+        logins (int): number of times the session has signed in
+        cache (obj): PageCache to keep fetched pages in
+        offline (bool): whether to serve pages only from `cache`
+        cookie_store (obj): config.Cookies store to persist cookies in
+    """
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+    max_requests = 4
+    timeout = (5.0, 30.0)
+    retries = 3
+    backoff = 0.5
+    max_backoff = 60.0
+
+    def __init__(self, credentials=None, pool_size=10, max_requests=None,
+                 cache=None, offline=False, cookie_store=None,
+                 base_url=None, timeout=None, retries=None, backoff=None):
+        super().__init__()
+        if timeout is not None:
+            self.timeout = timeout
+        if retries is not None:
+            self.retries = retries
+        if backoff is not None:
+            self.backoff = backoff
+        self.user_data = credentials or Credentials(load=True)
+        self.base_url = (base_url or hipposcraper.BASE_URL).rstrip('/')
+        self.logins = 0
+        self.cache = cache
+        self.offline = offline
+        self.cookie_store = cookie_store
+        if cookie_store is not None:
+            cookie_store.load(self.cookies,
+                              ignore_errors=(OSError, TypeError, ValueError))
+        if max_requests is not None:
+            self.max_requests = max_requests
+        self.__requests = threading.BoundedSemaphore(self.max_requests)
+        self.__login_lock = threading.Lock()
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    @property
+    def auth_url(self):
+        """Get the URL of the sign-in page."""
+        return self.base_url + '/auth/sign_in'
+
+    def close(self):
+        """Save cookies and close the session."""
+        if self.cookie_store is not None and not self.offline:
+            self.cookie_store.save(self.cookies, ignore_errors=(OSError,))
+        super().close()
+
+    def request(self, method, url, *args, **kwgs):
+        """Send a request once fewer than `max_requests` are in flight.
+
+        Failed requests are retried (see the class description); no slot is
+        held while waiting to retry.
+
+        Raises:
+            FetchError: if the request cannot be sent, or still fails to
+                connect or times out after every retry
+        """
+        kwgs.setdefault('timeout', self.timeout)
+        attempt = 0
+        while True:
+            try:
+                with self.__requests:
+                    resp = super().request(method, url, *args, **kwgs)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                if attempt >= self.retries:
+                    raise FetchError('Request failed - {}: {}'.format(
+                        url, type(err).__name__
+                    ))
+                reason = type(err).__name__
+                delay = self.backoff_delay(attempt)
+            except requests.RequestException as err:
+                raise FetchError('Request failed - {}: {}'.format(url, err))
+            else:
+                if (resp.status_code not in self.RETRY_STATUSES or
+                        attempt >= self.retries):
+                    return resp
+                reason = 'HTTP {}'.format(resp.status_code)
+                delay = self.retry_after(resp)
+                if delay is None:
+                    delay = self.backoff_delay(attempt)
+                resp.close()
+            attempt += 1
+            LOGGER.warning("     [RETRY] %s (%s); retry %d of %d in %.1fs",
+                           url, reason, attempt, self.retries, delay)
+            time.sleep(delay)
+
+    def backoff_delay(self, attempt):
+        """Get how long to wait before a retry, with random jitter."""
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(delay / 2, delay)
+
+    def retry_after(self, resp):
+        """Get how long a response asks to wait before a retry, if at all.
+
+        Returns:
+            delay (float): seconds to wait (at most `max_backoff`), or None
+        """
+        value = resp.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                date = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            delay = date.timestamp() - time.time()
+        return min(self.max_backoff, max(0.0, delay))
+
+    def is_sign_in(self, resp):
+        """Check whether a response is, or redirects to, the sign-in page."""
+        url = resp.url
+        if resp.is_redirect:
+            url = requests.compat.urljoin(url, resp.headers['location'])
+        return url.partition('?')[0].rstrip('/') == self.auth_url
+
+    def login(self, resp=None):
+        """Sign in to the intranet.
+
+        Args:
+            resp (obj): response holding the sign-in form, if already fetched
+
+        Raises:
+            AuthError: if the sign-in form is missing or the intranet
+                rejects the credentials
+        """
+        with metrics.stage('login') as stage:
+            self.__login(resp, stage)
+
+    def __login(self, resp, stage):
+        """Sign in, adding the bytes received to a metrics stage."""
+        if resp is None or resp.is_redirect or not self.is_sign_in(resp):
+            resp = self.get(self.auth_url)
+        stage.bytes = len(resp.content)
+        if not resp.ok:
+            raise AuthError('Login failed - HTTP {} from {}'.format(
+                resp.status_code, self.auth_url
+            ))
+        # Only the hidden inputs of the sign-in form are needed
+        soup = parse_only(resp.content, 'input',
+                          {'name': ['authenticity_token', 'commit']})
+        try:
+            credentials = {
+                'user[login]': self.user_data.get('holberton_username'),
+                'user[password]': self.user_data.get('holberton_password'),
+                'authenticity_token': soup.find(
+                    'input', {'name': 'authenticity_token'}
+                ).get('value'),
+                'commit': soup.find(
+                    'input', {'name': 'commit'}
+                ).get('value'),
+            }
+        except AttributeError:
+            raise AuthError('Login failed - sign-in form not found.')
+        LOGGER.debug("  -> Logging in...")
+        resp = self.post(self.auth_url, data=credentials,
+                         allow_redirects=False)
+        stage.bytes += len(resp.content)
+        if not resp.is_redirect or self.is_sign_in(resp):
+            raise AuthError('Login failed - check your credentials.')
+        self.logins += 1
+        if self.cookie_store is not None:
+            self.cookie_store.save(self.cookies, ignore_errors=(OSError,))
+        LOGGER.debug("     Done.")
+
+    def fetch(self, url):
+        """Get a page, signing in again only if the intranet asks for it.
+
+        A cached copy of the page is revalidated with a conditional request
+        and reused if the page has not changed.
+
+        Args:
+            url (str): url of the page to fetch
+
+        Returns:
+            content (bytes): content of the requested page
+
+        Raises:
+            AuthError: if signing in fails
+            FetchError: if the page cannot be fetched, or if offline and
+                the page is not cached
+        """
+        with metrics.stage('fetch') as stage:
+            content = self.__fetch(url)
+            stage.bytes = len(content)
+        return content
+
+    def __fetch(self, url):
+        """Get a page (see `fetch`)."""
+        entry = None if self.cache is None else self.cache.load(url)
+        if self.offline:
+            if entry is None:
+                raise FetchError('Page is not cached: {}'.format(url))
+            return entry[0]
+        headers = {} if entry is None else self.cache.headers(entry[1])
+        logins = self.logins
+        # Stop at a redirect to the sign-in page rather than fetch the form:
+        # every fetch of the form resets the CSRF cookie shared by all
+        # threads, which would break a login running in another thread
+        resp = self.get(url, headers=headers, allow_redirects=False)
+        if self.is_sign_in(resp):
+            with self.__login_lock:
+                # Another thread may have signed in while this one waited
+                if self.logins == logins:
+                    self.login()
+            resp = self.get(url, headers=headers)
+        elif resp.is_redirect:
+            resp = self.get(url, headers=headers)
+        # Never take (or cache) the sign-in form for the page
+        if self.is_sign_in(resp):
+            raise AuthError('Login failed - still asked to sign in for '
+                            '{}'.format(url))
+        if resp.status_code == 304 and entry is not None:
+            return entry[0]
+        if not resp.ok:
+            raise FetchError('Failed to fetch page - HTTP {}: {}'.format(
+                resp.status_code, url
+            ))
+        if self.cache is not None:
+            self.cache.save(url, resp)
+        return resp.content
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Module for SysScraper"""
-import re
 import sys
 
+from .. import LOGGER, metrics
+from . model import as_project
+from . output_dir import OutputDir
+
 
 class SysScraper:
     """SysScraper class
@@ -10,49 +13,52 @@ class SysScraper:
     System-Engineering_Devops project scraper.
 
     Args:
-        soup (obj): BeautifulSoup obj containing parsed link
+        project (obj): ProjectModel of the project page (or its parse tree)
+        root (obj): OutputDir (or path) to create files in
+        index (obj): PageIndex of a parse tree, built if not given
 
     Attributes:
         ruby_check (str): if ruby exists, assign to 0. Else scrape empty list
         file_names (list): scraped file names from find_files()
     """
 
-    def __init__(self, soup):
-        self.soup = soup
+    def __init__(self, project, root='.', index=None):
+        self.project = as_project(project, index)
+        self.root = root if isinstance(root, OutputDir) else OutputDir(root)
         self.file_names = self.find_files()
         self.ruby_check = self.ruby_checker()
 
+    @metrics.timed()
     def ruby_checker(self):
         """Method that checks for ruby files in project
         """
-        temp = self.soup.find_all(string=re.compile("env ruby"))
-        if temp != []:
+        if self.project.ruby:
             return 0
-        return temp
+        return []
 
+    @metrics.timed()
     def find_files(self):
         """Method that scrapes bash or ruby for file names"""
-        return self.soup.find_all(string=re.compile("File: "))
+        return self.project.files
 
+    @metrics.timed()
     def write_files(self):
         """Method that writes/creates bash or ruby files"""
-        print("  -> Creating task files...")
+        LOGGER.debug("  -> Creating task files...")
         for item in self.file_names:
+            if item is None:
+                LOGGER.error("     [ERROR] Failed to create task files.")
+                continue
             try:
-                w_file_name = open(item.next_sibling.text, "w")
-                if self.ruby_check == 0:
-                    w_file_name.write("#!/usr/bin/env ruby\n")
-                elif ".py" in item.next_sibling.text:
-                    w_file_name.write("#!/usr/bin/python3\n")
-                else:
-                    w_file_name.write("#!/usr/bin/env bash\n")
-                w_file_name.close()
+                with self.root.open(item, "w") as w_file_name:
+                    if self.ruby_check == 0:
+                        w_file_name.write("#!/usr/bin/env ruby\n")
+                    elif ".py" in item:
+                        w_file_name.write("#!/usr/bin/python3\n")
+                    else:
+                        w_file_name.write("#!/usr/bin/env bash\n")
             except (AttributeError, IndexError):
-                try:
-                    print("     [ERROR] Failed to create task file {}".format(
-                        item.next_sibling.text
-                    ))
-                except AttributeError:
-                    print("     [ERROR] Failed to create task files.")
+                LOGGER.error("     [ERROR] Failed to create task file %s",
+                             item)
                 continue
-        print("     Done.")
+        LOGGER.debug("     Done.")
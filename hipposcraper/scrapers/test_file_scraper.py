@@ -1,9 +1,182 @@
 #!/usr/bin/env python3
 """Module for TestFileScraper"""
+import collections
 import json
-import re
 import sys
 
+from .. import LOGGER, metrics
+from . model import as_project
+from . output_dir import OutputDir
+
+Language = collections.namedtuple('Language', ['marker', 'extension'])
+Language.__doc__ = """Language of the test files shown in examples.
+
+An example mentioning `marker` shows a test file named up to the first
+`extension` after "cat ".
+"""
+
+PYTHON = Language('.py', '.py')
+
+# Languages in order of precedence: the first whose marker an example
+# mentions names its test file. Add a row to handle another language.
+LANGUAGES = (
+    Language('main.c', '.c'),
+    Language('.sql', '.sql'),
+    Language('.js', '.js'),
+    PYTHON,
+)
+
+# Test files of examples mentioning HTML are HTML pages, whatever else the
+# example mentions
+HTML = Language('.html', '.html')
+
+Step = collections.namedtuple('Step', ['command', 'output'])
+Step.__doc__ = """Command typed in an example, and the output shown for it."""
+
+Example = collections.namedtuple('Example', ['name', 'text', 'steps'])
+Example.__doc__ = """Test file shown in an example, and the steps using it.
+
+Attributes:
+    name (str): name of the test file
+    text (str): content of the test file
+    steps (tuple): Step of each command typed after showing the test file
+"""
+
+
+def find_test_file(example):
+    """Find the test file an example shows with `cat`.
+
+    The example is searched once per marker, then the name and content of
+    the test file are cut out of it by offset, so only they are copied.
+
+    Args:
+        example (str): text of an example (`pre` tag)
+
+    Returns:
+        test_file (tuple): name and content of the test file, or None if
+            the example shows none
+
+    Raises:
+        ValueError: if the example shows a test file that cannot be cut out
+    """
+    if "cat" not in example:
+        return None
+    html = HTML.marker in example
+    for language in LANGUAGES:
+        if language.marker in example:
+            break
+    else:
+        if not html:
+            return None
+        language = PYTHON
+    start = example.find("cat ")
+    dollar = example.find("$")
+    if start == -1 or dollar == 0:
+        raise ValueError('example shows no test file')
+    start += len("cat ")
+    # The prompt marks the end of the test file
+    prompt = example if dollar == -1 else example[:dollar]
+
+    end = example.find(language.extension, start)
+    if end == -1:
+        end = len(example)
+    name = example[start:end] + language.extension
+    if html:
+        # A name holding ".html" ends there; any other name gets ".html"
+        # added, so "cat 1-index.py.html" names "1-index.py.html"
+        cut = example.find(HTML.extension, start, end)
+        if cut != -1:
+            name = example[start:cut]
+        name += HTML.extension
+
+    if html:
+        # The page lies between the first two mentions of ".html"
+        begin = example.find(HTML.marker) + len(HTML.marker)
+        stop = example.find(HTML.marker, begin)
+        if stop == -1:
+            stop = len(example)
+        found = example.find(prompt, begin, stop)
+        if found != -1:
+            stop = found
+        newline = example.find("\n", begin, stop)
+        if newline == -1:
+            raise ValueError('example shows no test file')
+        # Everything but the last character
+        return name, example[newline + 1:stop - 1]
+
+    begin = example.find(name)
+    if begin == -1:
+        raise ValueError('example shows no test file')
+    newline = example.find("\n", begin + len(name))
+    if newline == -1:
+        raise ValueError('example shows no test file')
+    stop = example.find(prompt, newline + 1)
+    if stop == -1:
+        stop = len(example)
+    # Every complete line
+    stop = example.rfind("\n", newline + 1, stop) + 1
+    return name, example[newline + 1:stop] if stop else ""
+
+
+def find_prompt(example):
+    """Get the shell prompt of an example (up to its "$"), or None."""
+    line = example[:example.find("\n")]
+    end = line.find("$ ")
+    if end == -1:
+        return None
+    return line[:end + 1]
+
+
+def find_steps(example):
+    """Split an example into the commands typed at its prompt.
+
+    The output of a command is everything up to the next prompt.
+
+    Returns:
+        steps (tuple): Step of each command
+    """
+    prompt = find_prompt(example)
+    if prompt is None:
+        return ()
+    steps = []
+    for part in example.split(prompt)[1:]:
+        command, _, output = part.partition("\n")
+        command = command.strip()
+        if command:
+            steps.append(Step(command, output))
+    return tuple(steps)
+
+
+def find_example(example):
+    """Find the test file an example shows, and what it expects of it.
+
+    Returns:
+        example (obj): Example, or None if the example shows no test file
+            or runs nothing after showing it
+
+    Raises:
+        ValueError: if the example shows a test file that cannot be cut out
+    """
+    test_file = find_test_file(example)
+    if test_file is None:
+        return None
+    name, text = test_file
+    shown = "cat " + name
+    steps = tuple(step for step in find_steps(example)
+                  if step.command != shown)
+    if not steps:
+        return None
+    return Example(name, text, steps)
+
+
+def describe(example):
+    """Name an example in an error message."""
+    first = example.find("\n")
+    second = example.find("\n", first + 1) if first != -1 else -1
+    if second != -1 and second + 1 < len(example):
+        return "[Not a test file]"
+    return example
+
 
 class TestFileScraper:
     """TestFileScraper class
@@ -11,71 +184,59 @@ class TestFileScraper:
     Scrapes test files from any projects.
 
     Args:
-        soup (obj): BeautifulSoup obj containing parsed link
+        project (obj): ProjectModel of the project page (or its parse tree)
+        root (obj): OutputDir (or path) to create files in
+        index (obj): PageIndex of a parse tree, built if not given
     """
-    def __init__(self, soup):
-        self.soup = soup
+    def __init__(self, project, root='.', index=None):
+        self.project = as_project(project, index)
+        self.root = root if isinstance(root, OutputDir) else OutputDir(root)
         self.pre = self.find_test_files()
 
+    @metrics.timed()
     def find_test_files(self):
-        return self.soup.select("pre")
+        return self.project.examples
+
+    @metrics.timed()
+    def find_examples(self):
+        """Find the examples that run a test file, with their output.
+
+        Returns:
+            examples (list): Example of each example running a test file
+        """
+        examples = []
+        for item in self.pre:
+            try:
+                example = find_example(item)
+            except ValueError:
+                LOGGER.error("     [ERROR] Failed to read example {}".format(
+                    describe(item)
+                ))
+                continue
+            if example is not None:
+                examples.append(example)
+        return examples
 
+    @metrics.timed()
     def write_test_files(self):
-        print("  -> Creating test files...")
+        LOGGER.debug("  -> Creating test files...")
         for item in self.pre:
-            find_test = item.text.find("cat")
-            find_c = item.text.find("main.c")
-            find_py = item.text.find(".py")
-            find_sql = item.text.find(".sql")
-            find_js = item.text.find(".js")
-            find_html = item.text.find(".html")
-
-            # find_main checks if there are main files on project page
-            if find_test != -1 and (find_c != -1 or find_py != -1 or find_sql != -1 or find_js != -1 or find_html != -1):
-                try:
-                    name = item.text.split("cat ", 1)[1]
-                    user = item.text.split("$", 1)[0]
-                    if find_c != -1:
-                        name = name.split(".c", 1)[0] + ".c"
-                    elif find_sql != -1:
-                        name = name.split(".sql", 1)[0] + ".sql"
-                    elif find_js != -1:
-                        name = name.split(".js", 1)[0] + ".js"
-                    else:
-                        name = name.split(".py", 1)[0] + ".py"
-                    # html edge case test text creation
-                    if find_html != -1:
-                        text = item.text.split(".html")[1]
-                        text = str(text.split(user, 1)[0])
-                        text = text.split("\n", 1)[1]
-                        name = name.split(".html", 1)[0] + ".html"
-                    else:
-                        text = item.text.split(name, 1)[1]
-                        text = text.split("\n", 1)[1]
-                        text = text.split(user, 1)[0]
-                        text = text.split("\n")
-                    w_test_file = open(name, "w+")
-                    for i in range(len(text) - 1):
-                        if find_html != -1:
-                            w_test_file.write(text[i])
-                        else:
-                            w_test_file.write(text[i] + '\n')
-                    w_test_file.close()
-                except (AttributeError, IndexError):
-                    name = item.text
-                    newlines = 0
-                    # Checks if test file's name has more than 1 newline
-                    for i in name:
-                        if newlines > 1:
-                            name = "[Not a test file]"
-                            break
-                        if i == "\n":
-                            newlines += 1
-                    print("     [ERROR] Failed to create file {}".format(name))
-                    continue
-                except IOError:
-                    print("     [ERROR] Failed to create file {}".format(name))
-                    continue
-            else:
-                pass
-        print("     Done.")
+            try:
+                test_file = find_test_file(item)
+            except ValueError:
+                LOGGER.error("     [ERROR] Failed to create file {}".format(
+                    describe(item)
+                ))
+                continue
+            if test_file is None:
+                continue
+            name, text = test_file
+            if self.root.manifest is not None:
+                self.root.manifest.add_test(self.root.join(name))
+            try:
+                self.root.write(name, text)
+            except IOError:
+                LOGGER.error("     [ERROR] Failed to create file {}".format(
+                    name
+                ))
+        LOGGER.debug("     Done.")
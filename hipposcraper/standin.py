@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Serve saved project pages from a local stand-in for the intranet.
+
+usage: python3 -m hipposcraper.standin [OPTIONS...] DIR
+
+The stand-in serves the sign-in form with a CSRF token, signs users in with
+a session cookie and serves each page DIR/NAME.html at /projects/NAME to
+signed-in users. /projects/NAME/N serves copy N of the page, with its
+project directory renamed to keep copies apart. Latency, server errors and
+rate limits can be injected to load-test the Hipposcraper without touching
+the real intranet. Point the Hipposcraper at it with HIPPOSCRAPER_BASE_URL.
+"""
+import argparse
+import collections
+import hashlib
+import html
+import http.server
+import json
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+import urllib.parse
+
+SIGN_IN = """<!DOCTYPE html>
+<html>
+<head><title>Sign in | Intranet</title></head>
+<body>
+<h1>Sign in</h1>
+<form class="new_user" id="new_user" action="/auth/sign_in" method="post">
+<input type="hidden" name="authenticity_token" value="{token}" />
+<input type="email" name="user[login]" id="user_login" />
+<input type="password" name="user[password]" id="user_password" />
+<input type="submit" name="commit" value="Log in" />
+</form>
+</body>
+</html>
+"""
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Handle requests to the stand-in intranet."""
+
+    def log_message(self, fmt, *args):
+        """Log requests only when the server is verbose."""
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def cookies(self):
+        """Get the cookies sent with the request."""
+        cookies = {}
+        for item in self.headers.get('Cookie', '').split(';'):
+            name, sep, value = item.strip().partition('=')
+            if sep:
+                cookies[name] = value
+        return cookies
+
+    def respond(self, status, body=b'', headers=()):
+        """Count a response and send it."""
+        self.server.count(self.command, self.path, status)
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def redirect(self, location, headers=()):
+        """Redirect to another path."""
+        self.respond(302, headers=[('Location', location)] + list(headers))
+
+    def inject(self):
+        """Apply injected latency, errors and rate limits.
+
+        Returns:
+            handled (bool): whether a response has already been sent
+        """
+        server = self.server
+        if server.latency:
+            time.sleep(random.uniform(0.5, 1.5) * server.latency)
+        retry_after = server.throttle()
+        if retry_after is not None:
+            self.respond(429, b'Too Many Requests',
+                         [('Retry-After', str(retry_after))])
+            return True
+        if server.error_rate and random.random() < server.error_rate:
+            self.respond(random.choice((500, 502, 503)), b'Server Error')
+            return True
+        return False
+
+    def do_GET(self):
+        """Serve the sign-in form, a project page or server statistics."""
+        path = urllib.parse.urlsplit(self.path).path
+        if path == '/_stats':
+            body = json.dumps(self.server.stats()).encode()
+            self.respond(200, body, [('Content-Type', 'application/json')])
+            return
+        if self.inject():
+            return
+        if path == '/auth/sign_in':
+            self.sign_in_form()
+        elif path.startswith('/projects/'):
+            self.project(path[len('/projects/'):])
+        elif path == '/':
+            self.respond(200, b'<html><h1>Intranet</h1></html>')
+        else:
+            self.respond(404, b'Not Found')
+
+    def do_POST(self):
+        """Sign a user in."""
+        if self.inject():
+            return
+        path = urllib.parse.urlsplit(self.path).path
+        if path != '/auth/sign_in':
+            self.respond(404, b'Not Found')
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode())
+        field = {key: values[0] for key, values in form.items()}
+        csrf = self.cookies().get('csrf')
+        server = self.server
+        if (csrf is None or
+                field.get('authenticity_token') != server.csrf.get(csrf) or
+                field.get('user[login]') != server.username or
+                field.get('user[password]') != server.password):
+            self.sign_in_form()
+            return
+        session = secrets.token_hex(16)
+        with server.lock:
+            server.sessions.add(session)
+            server.logins += 1
+        self.redirect('/', [(
+            'Set-Cookie', '_intranet_session={}; Path=/; HttpOnly'.format(
+                session
+            )
+        )])
+
+    def sign_in_form(self):
+        """Serve the sign-in form with a fresh CSRF token."""
+        csrf, token = secrets.token_hex(16), secrets.token_urlsafe(32)
+        with self.server.lock:
+            self.server.csrf[csrf] = token
+        body = SIGN_IN.format(token=html.escape(token)).encode()
+        self.respond(200, body, [
+            ('Content-Type', 'text/html; charset=utf-8'),
+            ('Set-Cookie', 'csrf={}; Path=/; HttpOnly'.format(csrf)),
+        ])
+
+    def project(self, name):
+        """Serve a project page to a signed-in user."""
+        if self.cookies().get('_intranet_session') not in self.server.sessions:
+            self.redirect('/auth/sign_in')
+            return
+        name, _, copy = name.partition('/')
+        content = self.server.page(name, copy)
+        if content is None:
+            self.respond(404, b'Not Found')
+            return
+        etag = '"{}"'.format(hashlib.sha1(content).hexdigest())
+        if self.headers.get('If-None-Match') == etag:
+            self.respond(304, headers=[('ETag', etag)])
+            return
+        self.respond(200, content, [
+            ('Content-Type', 'text/html; charset=utf-8'),
+            ('ETag', etag),
+        ])
+
+
+class StandIn(http.server.ThreadingHTTPServer):
+    """
+    Stand-in for the intranet, serving saved project pages.
+
+    Args:
+        dirname (str): directory of saved pages (NAME.html)
+        address (tuple): host and port to listen on (port 0 picks a free one)
+        username (str): login accepted by the sign-in form
+        password (str): password accepted by the sign-in form
+        latency (float): average seconds to wait before each response
+        error_rate (float): fraction of requests answered with a 5xx error
+        rate_limit (float): requests per second allowed before answering 429
+        verbose (bool): whether to log each request
+    """
+    daemon_threads = True
+
+    def __init__(self, dirname, address=('127.0.0.1', 0), username='betty',
+                 password='hunter2', latency=0.0, error_rate=0.0,
+                 rate_limit=None, verbose=False):
+        super().__init__(address, StandInHandler)
+        self.dirname = dirname
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.csrf = {}
+        self.sessions = set()
+        self.logins = 0
+        self.requests = collections.Counter()
+        self.__bucket = (rate_limit or 0.0, time.monotonic())
+        self.__thread = None
+
+    @property
+    def base_url(self):
+        """Get the URL to point the Hipposcraper at."""
+        host, port = self.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def url(self, name, copy=None):
+        """Get the URL of a saved project page (or of a copy of it)."""
+        if copy is None:
+            return '{}/projects/{}'.format(self.base_url, name)
+        return '{}/projects/{}/{}'.format(self.base_url, name, copy)
+
+    def page(self, name, copy=''):
+        """Read a saved project page, renaming the directory of a copy."""
+        if not re.fullmatch(r'[\w.-]+', name):
+            return None
+        try:
+            with open(os.path.join(self.dirname, name + '.html'), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        if copy:
+            content = re.sub(rb'(Directory: <code>)([^<]*)',
+                             rb'\1\2-' + copy.encode(), content)
+        return content
+
+    def throttle(self):
+        """Take a token from the rate-limit bucket.
+
+        Returns:
+            retry_after (int): seconds to wait if rate-limited, else None
+        """
+        if not self.rate_limit:
+            return None
+        with self.lock:
+            tokens, last = self.__bucket
+            now = time.monotonic()
+            tokens = min(self.rate_limit, tokens + (now - last) *
+                         self.rate_limit)
+            if tokens < 1:
+                self.__bucket = (tokens, now)
+                return max(1, int((1 - tokens) / self.rate_limit + 0.5))
+            self.__bucket = (tokens - 1, now)
+        return None
+
+    def handle_error(self, request, client_address):
+        """Report errors, except for clients hanging up (e.g. timeouts)."""
+        if self.verbose or not isinstance(sys.exc_info()[1],
+                                          ConnectionError):
+            super().handle_error(request, client_address)
+
+    def count(self, method, path, status):
+        """Count a response."""
+        path = urllib.parse.urlsplit(path).path
+        if path.startswith('/projects/'):
+            path = '/projects/*'
+        with self.lock:
+            self.requests['{} {} {}'.format(method, path, status)] += 1
+
+    def stats(self):
+        """Get counts of logins and of responses by request and status."""
+        with self.lock:
+            return {'logins': self.logins, 'requests': dict(self.requests)}
+
+    def start(self):
+        """Serve requests in a background thread."""
+        self.__thread = threading.Thread(target=self.serve_forever,
+                                         daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests."""
+        self.shutdown()
+        self.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Serve saved project pages from a stand-in intranet.'
+    )
+    parser.add_argument('dirname', metavar='DIR',
+                        help='directory of saved project pages (NAME.html)')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='address to listen on')
+    parser.add_argument('--port', type=int, default=8000,
+                        help='port to listen on')
+    parser.add_argument('--username', default='betty',
+                        help='login accepted by the sign-in form')
+    parser.add_argument('--password', default='hunter2',
+                        help='password accepted by the sign-in form')
+    parser.add_argument('--latency', metavar='SECONDS', type=float,
+                        default=0.0, help='average latency to inject')
+    parser.add_argument('--error-rate', metavar='FRACTION', type=float,
+                        default=0.0,
+                        help='fraction of requests to fail with a 5xx error')
+    parser.add_argument('--rate-limit', metavar='RPS', type=float,
+                        default=None,
+                        help='requests per second before answering 429')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='log each request')
+    return parser.parse_args()
+
+
+def main():
+    """Run the stand-in until interrupted."""
+    args = parse_args()
+    server = StandIn(args.dirname, (args.host, args.port),
+                     username=args.username, password=args.password,
+                     latency=args.latency, error_rate=args.error_rate,
+                     rate_limit=args.rate_limit, verbose=args.verbose)
+    print('Serving {} at {}'.format(args.dirname, server.base_url))
+    print('export HIPPOSCRAPER_BASE_URL={}'.format(server.base_url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Test it.
+
+usage: hippotest.py URL ...
+"""
+import sys
+
+import hipposcraper
+
+
+if __name__ == '__main__':
+    sys.exit(hipposcraper.hippotest())
@@ -34,6 +34,8 @@ setuptools.setup(
             "hipposcraper=hipposcraper:hipposcraper",
             "hippodoc=hipposcraper:hippodoc",
             "hippodir=hipposcraper:hippodir",
+            "hippotest=hipposcraper:hippotest",
+            "hippocheck=hipposcraper:hippocheck",
             "hippoconfig=hipposcraper:hippoconfig",
         ],
     },
@@ -41,5 +43,8 @@ setuptools.setup(
         "beautifulsoup4 >=4.8.2",
         "requests >=2.24",
     ],
-    python_requires=">=3.4",
+    extras_require={
+        "lxml": ["lxml"],
+    },
+    python_requires=">=3.7",
 )
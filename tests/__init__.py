@@ -1,4 +1,41 @@
 #!/usr/bin/env python3
 """Test hipposcraper."""
+import os
 
 URL = "https://intranet.hbtn.io/projects/232"
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'fixtures')
+
+
+def fixture_names():
+    """Get the names of the saved project pages."""
+    return sorted(
+        name[:-len('.html')] for name in os.listdir(FIXTURES)
+        if name.endswith('.html')
+    )
+
+
+def fixture_url(name):
+    """Get a project URL that FixtureSession serves a saved page for."""
+    return '{}/{}'.format(URL.rpartition('/')[0], name)
+
+
+class FixtureSession:
+    """Serve saved project pages in place of the intranet."""
+
+    def __init__(self):
+        self.user_data = {
+            'author': 'Betty Holberton',
+            'github_username': 'bettyholberton',
+            'holberton_username': 'betty',
+            'holberton_password': 'hunter2',
+        }
+        self.fetched = []
+
+    def fetch(self, url):
+        """Get the saved page named by the last part of a project URL."""
+        self.fetched.append(url)
+        name = url.rpartition('/')[2]
+        with open(os.path.join(FIXTURES, name + '.html'), 'rb') as istream:
+            return istream.read()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Provide tests for BaseParse"""
+import contextlib
+import io
+import os
+import tempfile
 import unittest
 
-from . import URL
+from . import FixtureSession, fixture_url
 from hipposcraper import scrapers
 
 
@@ -10,22 +14,59 @@ class TestBaseParse(unittest.TestCase):
     """Test BaseParse"""
 
     def setUp(self):
-        self.parse = scrapers.BaseParse(URL)
-        self.parse.get_json()
+        self.session = FixtureSession()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.parse = scrapers.BaseParse(
+                fixture_url('low_level_programming'), session=self.session
+            )
 
     def tearDown(self):
         del self.parse
 
     def test_base_object(self):
         self.assertIsNotNone(self.parse)
-        self.assertIsInstance(self.parse, object)
-        self.assertIn("scrapers.BaseParse", str(self.parse))
+        self.assertIsInstance(self.parse, scrapers.BaseParse)
 
     def test_json_data(self):
         self.assertIsInstance(self.parse.user_data, dict)
+        self.assertIs(self.parse.user_data, self.session.user_data)
 
     def test_get_soup(self):
-        self.parse.get_soup()
-        self.assertIsNotNone(self.parse.soup)
-        self.assertIsInstance(self.parse.soup, object)
-        self.assertIn("bs4.BeautifulSoup", str(self.parse.soup.__class__))
+        with contextlib.redirect_stdout(io.StringIO()):
+            soup = self.parse.get_soup()
+        self.assertIsNotNone(soup)
+        self.assertIn("bs4.BeautifulSoup", str(soup.__class__))
+        self.assertEqual(len(self.session.fetched), 2)
+
+    def test_hbtn_link(self):
+        self.assertTrue(self.parse.hbtn_link.startswith('https://'))
+        with self.assertRaises(scrapers.FetchError):
+            self.parse.hbtn_link = 'https://example.com/projects/232'
+
+    def test_find_directory(self):
+        self.assertEqual(self.parse.dir_name,
+                         '0x04-more_functions_nested_loops')
+
+    def test_project_type_check(self):
+        self.assertEqual(self.parse.project_type_check(),
+                         'holbertonschool-low_level_programming')
+
+    def test_create_directory(self):
+        with tempfile.TemporaryDirectory() as root:
+            with contextlib.redirect_stdout(io.StringIO()):
+                project_dir = self.parse.create_directory(root)
+            self.assertIsInstance(project_dir, scrapers.OutputDir)
+            self.assertTrue(os.path.isdir(project_dir.path))
+            self.assertEqual(project_dir.path,
+                             os.path.join(root, self.parse.dir_name))
+
+    def test_create_directory_errors(self):
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, self.parse.dir_name), 'w'):
+                pass
+            with contextlib.redirect_stdout(io.StringIO()):
+                with self.assertRaises(scrapers.WriteError):
+                    self.parse.create_directory(root)
+                self.parse.dir_name = None
+                with self.assertRaises(scrapers.ParseError):
+                    self.parse.create_directory(root)
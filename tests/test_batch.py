@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Provide tests for reading project lists and running them"""
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from hipposcraper import batch, runner, scrapers
+from hipposcraper.batch import Project
+
+URL = 'https://intranet.hbtn.io/projects/{}'
+
+
+class TestBatch(unittest.TestCase):
+    """Test reading project lists"""
+
+    def read(self, text, fmt):
+        return list(batch.read_projects(io.StringIO(text), fmt))
+
+    def test_text(self):
+        text = '# cohort 10\n\n{}\n  {}  out dir \n'.format(
+            URL.format(1), URL.format(2)
+        )
+        self.assertEqual(self.read(text, 'text'), [
+            Project(URL.format(1), '.'),
+            Project(URL.format(2), 'out dir'),
+        ])
+
+    def test_csv(self):
+        text = 'dir,url\na,{}\n,{}\n'.format(URL.format(1), URL.format(2))
+        self.assertEqual(self.read(text, 'csv'), [
+            Project(URL.format(1), 'a'),
+            Project(URL.format(2), '.'),
+        ])
+        with self.assertRaises(ValueError):
+            self.read('link\n{}\n'.format(URL.format(1)), 'csv')
+
+    def test_json(self):
+        expected = [Project(URL.format(1), 'a'), Project(URL.format(2), '.')]
+        lines = '{{"url": "{}", "dir": "a"}}\n"{}"\n'.format(
+            URL.format(1), URL.format(2)
+        )
+        array = '[\n{{"url": "{}", "dir": "a"}},\n{{"url": "{}"}}\n]\n'.format(
+            URL.format(1), URL.format(2)
+        )
+        self.assertEqual(self.read(lines, 'json'), expected)
+        self.assertEqual(self.read(array, 'json'), expected)
+        with self.assertRaises(ValueError):
+            self.read('{"dir": "a"}\n', 'json')
+
+    def test_projects(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'projects.csv')
+            with open(path, 'w') as ostream:
+                ostream.write('url,dir\n{},a\n'.format(URL.format(2)))
+            projects = list(batch.projects([URL.format(1)], path))
+        self.assertEqual(projects, [
+            Project(URL.format(1), '.'),
+            Project(URL.format(2), 'a'),
+        ])
+
+    def test_projects_error(self):
+        with self.assertLogs('hipposcraper', 'ERROR') as logs:
+            projects = list(batch.projects([URL.format(1)], '/nonexistent'))
+        self.assertEqual(projects, [Project(URL.format(1), '.')])
+        self.assertIn('[ERROR]', logs.output[0])
+
+    def test_result(self):
+        result = batch.Result(Project(URL.format(1), '.'))
+        with self.assertLogs('hipposcraper', 'ERROR') as logs:
+            with result.step():
+                pass
+            self.assertTrue(result.ok)
+            with result.step():
+                raise scrapers.FetchError('Failed to fetch page - HTTP 404')
+            with result.step():
+                raise PermissionError(13, 'Permission denied')
+            with result.step():
+                raise KeyError('author')
+        self.assertFalse(result.ok)
+        self.assertEqual(result.kinds, ['fetch', 'write', 'error'])
+        self.assertIn('fetch: Failed to fetch page - HTTP 404', result.message)
+        self.assertEqual(len(logs.records), 3)
+        self.assertIsNone(logs.records[0].exc_info)
+        self.assertIsNotNone(logs.records[2].exc_info)
+
+    def test_report(self):
+        done = batch.Result(Project(URL.format(1), 'a'))
+        failed = batch.Result(Project(URL.format(2), 'b c'))
+        failed.errors.append(scrapers.ParseError('Failed to determine '
+                                                 'project type.'))
+        stdout = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'failed.txt')
+            with contextlib.redirect_stdout(stdout):
+                self.assertEqual(batch.report([done]), 0)
+                self.assertEqual(batch.report([done], [ValueError()]), 1)
+                self.assertEqual(batch.report([done, failed], failed=path), 1)
+            with open(path, 'r') as istream:
+                retry = list(batch.read_projects(istream))
+        self.assertEqual(retry, [failed.project])
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(lines[0], 'Summary: 2 projects, 1 done, 1 failed')
+        self.assertIn('[DONE]', lines[1])
+        self.assertIn('[FAILED]', lines[2])
+        self.assertIn('parse: Failed to determine project type.', lines[2])
+
+
+class TestRunner(unittest.TestCase):
+    """Test running work for each project"""
+
+    def test_order(self):
+        for jobs in (1, 4):
+            with self.subTest(jobs=jobs):
+                results = runner.run(lambda item: item * 2, range(20), jobs)
+                self.assertEqual(results, [(n, n * 2) for n in range(20)])
+
+    def test_streaming(self):
+        started = threading.Event()
+
+        def items():
+            yield 'first'
+            # The first item is worked on before the next one is read
+            self.assertTrue(started.wait(5))
+            yield 'second'
+
+        def work(item):
+            started.set()
+            print(item)
+            return item
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            results = runner.run(work, items(), jobs=2)
+        self.assertEqual(results, [('first', 'first'), ('second', 'second')])
+        self.assertEqual(sorted(stdout.getvalue().split()),
+                         ['first', 'second'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Provide tests for console output"""
+import contextlib
+import io
+import logging
+import unittest
+
+from hipposcraper import LOGGER, batch, console, runner
+from hipposcraper.batch import Project
+
+URL = 'https://intranet.hbtn.io/projects/{}'
+
+
+class TestConsole(unittest.TestCase):
+    """Test logging levels and the progress line"""
+
+    def setUp(self):
+        self.state = (LOGGER.level, LOGGER.propagate, list(LOGGER.handlers))
+
+    def tearDown(self):
+        LOGGER.setLevel(self.state[0])
+        LOGGER.propagate = self.state[1]
+        LOGGER.handlers[:] = self.state[2]
+
+    def test_levels(self):
+        for verbosity, level in ((-2, logging.WARNING), (-1, logging.WARNING),
+                                 (0, logging.INFO), (1, logging.DEBUG),
+                                 (3, logging.DEBUG)):
+            with self.subTest(verbosity=verbosity):
+                self.assertEqual(console.configure(verbosity), level)
+                self.assertEqual(LOGGER.level, level)
+        handlers = [handler for handler in LOGGER.handlers
+                    if isinstance(handler, console.ConsoleHandler)]
+        self.assertEqual(len(handlers), 1)
+
+    def test_follows_stderr(self):
+        console.configure(0)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            LOGGER.debug('  -> hidden')
+            LOGGER.info('shown')
+        self.assertEqual(stderr.getvalue(), 'shown\n')
+
+    def test_progress(self):
+        stream = io.StringIO()
+        bar = console.Progress(stream)
+        results = [batch.Result(Project(URL.format(n), '.'))
+                   for n in range(3)]
+        results[1].errors.append(ValueError())
+        bar.update(results[0].project, results[0])
+        bar.write('line\n')
+        bar.update(results[1].project, results[1])
+        bar.update(results[2].project, None)
+        bar.close()
+        self.assertEqual((bar.done, bar.failed), (1, 2))
+        self.assertEqual(stream.getvalue(), ''.join([
+            '[1 done, 0 failed] {}'.format(URL.format(0)), '\r\033[K',
+            'line\n',
+            '[1 done, 0 failed] {}'.format(URL.format(0)), '\r\033[K',
+            '[1 done, 1 failed] {}'.format(URL.format(1)), '\r\033[K',
+            '[1 done, 2 failed] {}'.format(URL.format(2)), '\r\033[K',
+        ]))
+
+    def test_progress_disabled(self):
+        with console.progress(False) as bar:
+            self.assertIsNone(bar)
+        with contextlib.redirect_stderr(io.StringIO()):
+            with console.progress() as bar:
+                self.assertIsNone(bar)
+
+    def test_runner(self):
+        for jobs in (1, 4):
+            with self.subTest(jobs=jobs):
+                bar = console.Progress(io.StringIO())
+                projects = [Project(URL.format(n), '.') for n in range(10)]
+                runner.run(batch.Result, projects, jobs, progress=bar)
+                self.assertEqual((bar.done, bar.failed), (10, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
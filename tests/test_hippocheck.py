@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Provide tests for checking the style of task files"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from hipposcraper import scrapers
+from hipposcraper.hippocheck import CheckCache, check, find_files, report
+from hipposcraper.scrapers.linters import Linter
+
+# Stands in for a linter: fails on files holding "bad", and counts runs
+LINTER = """
+import os, sys
+with open(os.environ['LINT_RUNS'], 'a') as ostream:
+    ostream.write(sys.argv[1] + '\\n')
+with open(sys.argv[1]) as istream:
+    if 'bad' in istream.read():
+        print('{}:1: bad style'.format(sys.argv[1]))
+        sys.exit(1)
+"""
+
+
+class TestHippocheck(unittest.TestCase):
+    """Test checking the style of task files"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.project = os.path.join(self.tmp, '0x00-c')
+        os.makedirs(os.path.join(self.project, '.git'))
+        script = os.path.join(self.tmp, 'lint.py')
+        with open(script, 'w') as ostream:
+            ostream.write(LINTER)
+        self.runs = os.path.join(self.tmp, 'runs')
+        self.environ = os.environ.get('LINT_RUNS')
+        os.environ['LINT_RUNS'] = self.runs
+        self.linters = (
+            Linter('fake', (('no-such-linter',), (sys.executable, script)),
+                   ('.c', '.h'), 'fake'),
+            Linter('missing', (('no-such-linter',),), ('.py',), 'missing'),
+        )
+        self.cache = CheckCache(os.path.join(self.tmp, 'cache'))
+        for name, text in (('0-good.c', 'good\n'), ('1-bad.c', 'bad\n'),
+                           ('main.h', 'good\n'), ('2-task.py', 'bad\n'),
+                           ('README.md', 'bad\n'),
+                           (os.path.join('.git', 'hook.c'), 'bad\n')):
+            self.write(name, text)
+
+    def tearDown(self):
+        if self.environ is None:
+            del os.environ['LINT_RUNS']
+        else:
+            os.environ['LINT_RUNS'] = self.environ
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, text):
+        """Write a file in the project directory."""
+        with open(os.path.join(self.project, name), 'w') as ostream:
+            ostream.write(text)
+
+    def check(self, jobs=1):
+        """Check the project, getting the checks and the files linted."""
+        if os.path.exists(self.runs):
+            os.remove(self.runs)
+        paths = find_files(self.project, self.linters)
+        with self.assertLogs('hipposcraper', 'WARNING'):
+            checks = check(paths, self.linters, self.cache, jobs=jobs)
+        linted = []
+        if os.path.exists(self.runs):
+            with open(self.runs) as istream:
+                linted = sorted(istream.read().split())
+        return checks, linted
+
+    def test_find_files(self):
+        self.assertEqual(find_files(self.project, self.linters), [
+            os.path.join(self.project, name)
+            for name in ('0-good.c', '1-bad.c', '2-task.py', 'main.h')
+        ])
+
+    def test_find_task_files(self):
+        manifest = scrapers.Manifest(self.project)
+        for name in ('0-good.c', '1-bad.c', '0-main.c', 'README.md'):
+            self.write(name, 'good\n')
+            manifest.claim(os.path.join(self.project, name), 'good\n')
+        manifest.add_test(os.path.join(self.project, '0-main.c'))
+        manifest.save()
+        self.assertEqual(find_files(self.project, self.linters), [
+            os.path.join(self.project, name)
+            for name in ('0-good.c', '1-bad.c')
+        ])
+
+    def test_check(self):
+        checks, linted = self.check(jobs=2)
+        self.assertEqual(linted, ['0-good.c', '1-bad.c', 'main.h'])
+        self.assertEqual(
+            [(os.path.basename(item.path), item.status, item.cached)
+             for item in checks],
+            [('0-good.c', 'ok', False), ('1-bad.c', 'fail', False),
+             ('main.h', 'ok', False)],
+        )
+        stream = io.StringIO()
+        self.assertEqual(report(checks, stream), 1)
+        self.assertIn('    {}:1: bad style\n'.format(
+            os.path.join(self.project, '1-bad.c')
+        ), stream.getvalue())
+
+        # Only the file that changed is linted again
+        self.write('1-bad.c', 'fixed\n')
+        checks, linted = self.check()
+        self.assertEqual(linted, ['1-bad.c'])
+        self.assertEqual([(item.status, item.cached) for item in checks],
+                         [('ok', True), ('ok', False), ('ok', True)])
+        self.assertEqual(report(checks, io.StringIO()), 0)
+
+    def test_unwritable_cache(self):
+        path = os.path.join(self.tmp, 'file')
+        open(path, 'w').close()
+        self.cache = CheckCache(os.path.join(path, 'cache'))
+        checks, linted = self.check()
+        self.assertEqual(linted, ['0-good.c', '1-bad.c', 'main.h'])
+        self.assertEqual([item.status for item in checks],
+                         ['ok', 'fail', 'ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Provide tests for running the examples of a project"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from hipposcraper.hippotest import run_example, run_examples
+from hipposcraper.scrapers.test_file_scraper import (
+    Step, find_example, find_steps
+)
+
+PROMPT = 'bob@ubuntu:~/0x00-python$ '
+
+EXAMPLE = """{0}cat 0-main.py
+#!/usr/bin/env python3
+add = __import__('0-add').add
+print(add(1, 2))
+{0}./0-main.py
+3
+{0}./0-main.py | wc -l
+1
+{0}
+""".format(PROMPT)
+
+
+class TestHippotest(unittest.TestCase):
+    """Test running the examples of a project"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.project = os.path.join(self.tmp, '0x00-python')
+        os.mkdir(self.project)
+        self.write('0-add.py', 'def add(a, b):\n    return a + b\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, text):
+        """Write a task file in the project directory."""
+        with open(os.path.join(self.project, name), 'w') as ostream:
+            ostream.write(text)
+
+    def run_example(self, example=EXAMPLE, timeout=10):
+        """Run an example against the project directory."""
+        return run_example(self.project, find_example(example), timeout)
+
+    def test_find_steps(self):
+        self.assertEqual(find_steps(EXAMPLE)[1:], (
+            Step('./0-main.py', '3\n'),
+            Step('./0-main.py | wc -l', '1\n'),
+        ))
+        example = find_example(EXAMPLE)
+        self.assertEqual(example.name, '0-main.py')
+        self.assertEqual([step.command for step in example.steps],
+                         ['./0-main.py', './0-main.py | wc -l'])
+        self.assertEqual(find_steps('no prompt here\n'), ())
+
+    def test_pass(self):
+        outcome = self.run_example()
+        self.assertEqual(outcome.status, 'pass', outcome.diff)
+        self.assertEqual(outcome.name, '0-main.py')
+        # The project directory is left alone
+        self.assertEqual(os.listdir(self.project), ['0-add.py'])
+
+    def test_fail(self):
+        self.write('0-add.py', 'def add(a, b):\n    return a - b\n')
+        outcome = self.run_example()
+        self.assertEqual(outcome.status, 'fail')
+        self.assertEqual(outcome.command, './0-main.py')
+        self.assertIn('-3\n+-1', outcome.diff)
+
+    def test_timeout(self):
+        self.write('0-add.py', 'import time\ndef add(a, b):\n'
+                               '    time.sleep(60)\n')
+        outcome = self.run_example(timeout=0.5)
+        self.assertEqual(outcome.status, 'timeout')
+        self.assertLess(outcome.seconds, 30)
+
+    def test_pool(self):
+        example = find_example(EXAMPLE)
+        failing = example._replace(
+            text=example.text.replace('(1, 2)', '(2, 2)')
+        )
+        outcomes = run_examples(
+            [(self.project, example), (self.project, failing)] * 2, jobs=2
+        )
+        self.assertEqual([outcome.status for outcome in outcomes],
+                         ['pass', 'fail', 'pass', 'fail'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Provide tests for per-stage metrics"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from . import FIXTURES, FixtureSession, fixture_url
+import hipposcraper
+from hipposcraper import LOGGER, batch, metrics, scrapers
+from hipposcraper.hippodir import create_dir, scrape
+from hipposcraper.hippodoc import create_doc
+from hipposcraper.standin import StandIn
+
+
+class TestMetrics(unittest.TestCase):
+    """Test recording the time and bytes of each stage"""
+
+    def test_collect(self):
+        url = fixture_url('low_level_programming')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'metrics.json')
+            root = os.path.join(tmp, 'out')
+            os.mkdir(root)
+            with contextlib.redirect_stdout(io.StringIO()):
+                with metrics.collect(path):
+                    with metrics.project(url):
+                        project_data = scrapers.BaseParse(
+                            url, session=FixtureSession()
+                        )
+                        create_dir(url, project_data=project_data,
+                                   root=root)
+                        create_doc(url, project_data=project_data,
+                                   root=root)
+            self.assertIsNone(metrics.active())
+            with open(path, 'r') as istream:
+                data = json.load(istream)
+        project, = data['projects']
+        self.assertEqual(project['url'], url)
+        stages = project['stages']
+        for name in ('parse', 'index', 'skeleton', 'readme', 'write',
+                     'LowScraper.find_files', 'ReadScraper.write_tasks'):
+            self.assertIn(name, stages)
+        self.assertGreater(stages['parse']['bytes'], 0)
+        self.assertEqual(stages['skeleton']['calls'], 1)
+        paths = [os.path.basename(write['path'])
+                 for write in project['writes']]
+        self.assertIn('README.md', paths)
+        self.assertIn(scrapers.Manifest.basename, paths)
+        self.assertEqual(
+            stages['write']['bytes'],
+            sum(write['bytes'] for write in project['writes'])
+        )
+        self.assertEqual(data['totals']['parse'], stages['parse'])
+
+    def test_disabled(self):
+        self.assertIsNone(metrics.active())
+        with metrics.stage('fetch') as stage:
+            stage.bytes += 10
+        with metrics.project('url') as record:
+            self.assertIs(record, metrics.NULL_STAGE)
+        with metrics.collect() as collected:
+            self.assertIsNone(collected)
+
+    def test_stdout(self):
+        state = (LOGGER.level, LOGGER.propagate, list(LOGGER.handlers))
+        with tempfile.TemporaryDirectory() as tmp, StandIn(FIXTURES) as server:
+            with open(os.path.join(tmp, 'credentials.json'),
+                      'w') as ostream:
+                json.dump(FixtureSession().user_data, ostream)
+            projects = os.path.join(tmp, 'projects.txt')
+            with open(projects, 'w') as ostream:
+                for name in ('interview', 'webstack'):
+                    print(server.url(name), tmp, file=ostream)
+            parser = argparse.ArgumentParser()
+            batch.add_arguments(parser)
+            args = parser.parse_args(['-q', '--from-file', projects,
+                                      '--metrics-json', '-'])
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with mock.patch.object(hipposcraper, 'BASE_URL',
+                                   server.base_url), \
+                    mock.patch.object(hipposcraper, 'CONFIG_HOME', tmp), \
+                    mock.patch.object(hipposcraper, 'CACHE_HOME', tmp), \
+                    contextlib.redirect_stdout(stdout), \
+                    contextlib.redirect_stderr(stderr):
+                try:
+                    self.assertEqual(batch.main(args, scrape), 0)
+                finally:
+                    LOGGER.setLevel(state[0])
+                    LOGGER.propagate = state[1]
+                    LOGGER.handlers[:] = state[2]
+        data = json.loads(stdout.getvalue())
+        self.assertEqual(len(data['projects']), 2)
+        self.assertIn('Summary: 2 projects, 2 done, 0 failed',
+                      stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
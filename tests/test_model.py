@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Provide tests for the project model of a page"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from . import FixtureSession, fixture_names, fixture_url
+from hipposcraper import scrapers
+from hipposcraper.scrapers import base_parse
+
+
+def values(item):
+    """Yield every value held in a model, however deeply nested."""
+    if isinstance(item, tuple):
+        for value in item:
+            yield from values(value)
+    else:
+        yield item
+
+
+class TestModel(unittest.TestCase):
+    """Test the project model extracted from a page"""
+
+    def test_plain_data(self):
+        for name in fixture_names():
+            with self.subTest(page=name):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    project_data = scrapers.BaseParse(
+                        fixture_url(name), session=FixtureSession()
+                    )
+                project = project_data.project
+                self.assertIsInstance(project, scrapers.ProjectModel)
+                self.assertFalse(hasattr(project_data, 'soup'))
+                self.assertFalse(hasattr(project_data, 'index'))
+                for value in values(project):
+                    self.assertIn(type(value), (str, bool, type(None)))
+                self.assertIsNotNone(project.title)
+                self.assertTrue(project.project_type.endswith(name))
+
+    def test_missing_nodes(self):
+        soup = scrapers.make_soup(b'<html><body><h1>Empty</h1></body></html>',
+                                  'html.parser')
+        project = scrapers.extract_project(soup)
+        self.assertEqual(project.title, 'Empty')
+        self.assertIsNone(project.project_type)
+        self.assertIsNone(project.directory)
+        self.assertIsNone(project.objectives)
+        self.assertIsNone(project.resources)
+        self.assertEqual(project.files, ())
+
+
+class TestModelCache(unittest.TestCase):
+    """Test the on-disk cache of project models"""
+
+    def parse(self, name, models):
+        """Get the BaseParse of a saved project page."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            return scrapers.BaseParse(fixture_url(name),
+                                      session=FixtureSession(), models=models)
+
+    def test_reuse(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            models = scrapers.ModelCache(dirname)
+            for name in fixture_names():
+                with self.subTest(page=name):
+                    project = self.parse(name, models).project
+                    with mock.patch.object(base_parse, 'make_soup') as parse:
+                        project_data = self.parse(name, models)
+                    parse.assert_not_called()
+                    self.assertEqual(project_data.project, project)
+                    self.assertEqual(
+                        models.load(project_data.page_hash), project
+                    )
+
+    def test_stale(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            models = scrapers.ModelCache(dirname)
+            project_data = self.parse('webstack', models)
+            path = models.path(project_data.page_hash)
+            with open(path, 'r') as istream:
+                data = json.load(istream)
+            for version, project in ((data['version'] + '.old',
+                                      data['project']),
+                                     (data['version'], {'title': 'Old'})):
+                with open(path, 'w') as ostream:
+                    json.dump({'version': version, 'project': project},
+                              ostream)
+                self.assertIsNone(models.load(project_data.page_hash))
+                self.assertEqual(self.parse('webstack', models).project,
+                                 project_data.project)
+            with open(path, 'w') as ostream:
+                ostream.write('{')
+            self.assertIsNone(models.load(project_data.page_hash))
+            os.remove(path)
+            self.assertIsNone(models.load(project_data.page_hash))
+
+    def test_unwritable(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            path = os.path.join(dirname, 'file')
+            open(path, 'w').close()
+            models = scrapers.ModelCache(os.path.join(path, 'models'))
+            with self.assertLogs('hipposcraper', 'WARNING'):
+                project_data = self.parse('webstack', models)
+            self.assertEqual(project_data.project.title,
+                             self.parse('webstack', None).project.title)
+
+
+if __name__ == '__main__':
+    unittest.main()
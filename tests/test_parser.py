@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Provide tests for the HTML parser backends"""
+import contextlib
+import glob
+import io
+import os
+import unittest
+
+from bs4.builder import builder_registry
+
+from . import FIXTURES
+from hipposcraper import scrapers
+
+
+def extract(soup):
+    """Get everything the scrapers extract from a page as plain data."""
+    project = scrapers.extract_project(soup)
+    with contextlib.redirect_stdout(io.StringIO()):
+        low = scrapers.LowScraper(project)
+        high = scrapers.HighScraper(project)
+        read = scrapers.ReadScraper(project)
+        test = scrapers.TestFileScraper(project)
+    return {
+        'putchar': low.putchar_check,
+        'header': str(low.header_name),
+        'c_prototypes': low.prototypes_list,
+        'py_prototypes': high.prototypes_list,
+        'files': list(project.files),
+        'ruby': project.ruby,
+        'title': read.title,
+        'dir_name': read.dir_name,
+        'learning': read.prj_info,
+        'tasks': read.task_names,
+        'task_info': read.task_info,
+        'resources': read.prj_rsc,
+        'examples': list(test.pre),
+    }
+
+
+class TestParser(unittest.TestCase):
+    """Test the HTML parser backends"""
+
+    def test_find_parser(self):
+        self.assertEqual(scrapers.find_parser('html.parser'), 'html.parser')
+        self.assertIn(scrapers.find_parser(), scrapers.parser.PARSERS)
+
+    def test_find_parser_unavailable(self):
+        with self.assertRaises(ValueError):
+            scrapers.find_parser('no-such-parser')
+
+    def test_parse_only(self):
+        markup = (
+            '<html><body><h1>Sign in</h1><form>'
+            '<input type="hidden" name="authenticity_token" value="tok">'
+            '<input type="text" name="user[login]">'
+            '<input type="submit" name="commit" value="Log in">'
+            '</form></body></html>'
+        )
+        for parser in scrapers.parser.PARSERS:
+            if builder_registry.lookup(parser) is None:
+                continue
+            with self.subTest(parser=parser):
+                soup = scrapers.parse_only(
+                    markup, 'input',
+                    {'name': ['authenticity_token', 'commit']},
+                    parser=parser,
+                )
+                self.assertIsNone(soup.find('h1'))
+                self.assertEqual(len(soup.find_all('input')), 2)
+                self.assertEqual(soup.find(
+                    'input', {'name': 'authenticity_token'}
+                ).get('value'), 'tok')
+
+    @unittest.skipIf(builder_registry.lookup('lxml') is None,
+                     'lxml is not installed')
+    def test_prefer_lxml(self):
+        environ = os.environ.pop('HIPPOSCRAPER_PARSER', None)
+        try:
+            self.assertEqual(scrapers.find_parser(), 'lxml')
+        finally:
+            if environ is not None:
+                os.environ['HIPPOSCRAPER_PARSER'] = environ
+
+    @unittest.skipIf(builder_registry.lookup('lxml') is None,
+                     'lxml is not installed')
+    def test_backends_agree(self):
+        for path in sorted(glob.glob(os.path.join(FIXTURES, '*.html'))):
+            with open(path, 'rb') as istream:
+                markup = istream.read()
+            with self.subTest(page=os.path.basename(path)):
+                self.assertEqual(
+                    extract(scrapers.make_soup(markup, 'html.parser')),
+                    extract(scrapers.make_soup(markup, 'lxml')),
+                )
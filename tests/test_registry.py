@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Provide tests for finding the scraper of a project type"""
+import collections
+import unittest
+from unittest import mock
+
+from hipposcraper import scrapers
+from hipposcraper.scrapers import registry
+
+EntryPoint = collections.namedtuple('EntryPoint', ['name', 'value', 'load'])
+
+
+class TestRegistry(unittest.TestCase):
+    """Test the registry of scrapers by repository suffix"""
+
+    def test_builtin(self):
+        expected = {
+            'low_level_programming': scrapers.LowScraper,
+            'higher_level_programming': scrapers.HighScraper,
+            'system_engineering-devops': scrapers.SysScraper,
+            'system_linux': scrapers.LowScraper,
+            'system_algorithms': scrapers.LowScraper,
+            'machine_learning': scrapers.HighScraper,
+            'web_front_end': scrapers.HighScraper,
+            'webstack': scrapers.HighScraper,
+            'interview': scrapers.HighScraper,
+        }
+        for suffix, scraper in expected.items():
+            with self.subTest(suffix=suffix):
+                self.assertIs(scrapers.find_scraper(suffix), scraper)
+                self.assertIs(
+                    scrapers.find_scraper('holbertonschool-' + suffix),
+                    scraper
+                )
+
+    def test_unknown(self):
+        for project_type in (None, '', 'holbertonschool-blockchain',
+                             'webstack-old'):
+            with self.subTest(project_type=project_type):
+                with self.assertRaises(scrapers.ParseError):
+                    scrapers.find_scraper(project_type)
+
+    def test_register(self):
+        reg = scrapers.ScraperRegistry({
+            'linux': scrapers.LowScraper,
+            'system_linux': 'hipposcraper.scrapers.sys_scraper:SysScraper',
+        })
+
+        @reg.register('blockchain')
+        class BlockchainScraper:
+            pass
+
+        self.assertIs(reg.find('a-blockchain'), BlockchainScraper)
+        # The longest matching suffix wins
+        self.assertIs(reg.find('a-system_linux'), scrapers.SysScraper)
+        self.assertIs(reg.find('a-linux'), scrapers.LowScraper)
+        reg.register('linux', scrapers.HighScraper)
+        self.assertIs(reg.find('a-linux'), scrapers.HighScraper)
+        self.assertEqual(reg.suffixes(),
+                         ['blockchain', 'linux', 'system_linux'])
+        with self.assertRaises(ValueError):
+            reg.register('', scrapers.HighScraper)
+
+    def test_plugins(self):
+        loaded = []
+
+        def load():
+            loaded.append('blockchain')
+            return scrapers.SysScraper
+
+        found = [EntryPoint('blockchain', 'plugin:Scraper', load)]
+        with mock.patch.object(registry, 'entry_points',
+                               return_value=found) as entry_points:
+            reg = scrapers.ScraperRegistry(registry.BUILTIN_SCRAPERS,
+                                           group='test.scrapers')
+            entry_points.assert_not_called()
+            self.assertIs(reg.find('a-webstack'), scrapers.HighScraper)
+            entry_points.assert_called_once_with('test.scrapers')
+            self.assertEqual(loaded, [])
+            for _ in range(2):
+                self.assertIs(reg.find('a-blockchain'), scrapers.SysScraper)
+            self.assertEqual(loaded, ['blockchain'])
+            self.assertIn('blockchain', reg)
+            entry_points.assert_called_once_with('test.scrapers')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Provide tests for the scrapers against saved project pages"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from . import FIXTURES, FixtureSession, fixture_names, fixture_url
+from hipposcraper import scrapers
+from hipposcraper.hippodir import create_dir
+from hipposcraper.hippodoc import create_doc
+
+
+def snapshot(root):
+    """Map the path of each file under a directory to its content.
+
+    Manifests are left out: they only record hashes of the other files.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename == scrapers.Manifest.basename:
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, 'r') as istream:
+                files[os.path.relpath(path, root)] = istream.read()
+    return files
+
+
+def expected_path(name):
+    """Get the path of the expected output of a saved project page."""
+    return os.path.join(FIXTURES, name + '.json')
+
+
+class TestScrapers(unittest.TestCase):
+    """Test the scrapers against saved project pages
+
+    Set HIPPOSCRAPER_UPDATE_FIXTURES=1 to record the current output as the
+    expected output.
+    """
+
+    def scrape(self, name, root):
+        """Create the skeleton and README of a saved project page."""
+        session = FixtureSession()
+        url = fixture_url(name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            project_data = scrapers.BaseParse(url, session=session)
+            create_dir(url, project_data=project_data, root=root)
+            create_doc(url, project_data=project_data, root=root)
+        self.assertEqual(session.fetched, [url])
+
+    def test_fixtures(self):
+        for name in fixture_names():
+            with self.subTest(page=name):
+                with tempfile.TemporaryDirectory() as root:
+                    self.scrape(name, root)
+                    files = snapshot(root)
+                if os.getenv('HIPPOSCRAPER_UPDATE_FIXTURES'):
+                    with open(expected_path(name), 'w') as ostream:
+                        json.dump(files, ostream, indent=2, sort_keys=True)
+                        print(file=ostream)
+                with open(expected_path(name), 'r') as istream:
+                    self.assertEqual(files, json.load(istream))
+
+    def test_cwd_unchanged(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as root:
+            self.scrape('higher_level_programming', root)
+        self.assertEqual(os.getcwd(), cwd)
+
+    def test_readme_atomic(self):
+        url = fixture_url('interview')
+        with contextlib.redirect_stdout(io.StringIO()):
+            project_data = scrapers.BaseParse(url, session=FixtureSession())
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, 'README.md'), 'w') as ostream:
+                ostream.write('old')
+            del project_data.user_data['author']
+            with contextlib.redirect_stdout(io.StringIO()):
+                with self.assertRaises(KeyError):
+                    create_doc(url, project_data=project_data, root=root)
+            self.assertEqual(os.listdir(root), ['README.md'])
+            with open(os.path.join(root, 'README.md'), 'r') as istream:
+                self.assertEqual(istream.read(), 'old')
+
+    def test_rerun_unchanged(self):
+        with tempfile.TemporaryDirectory() as root:
+            self.scrape('low_level_programming', root)
+            before = {path: os.stat(os.path.join(root, path)).st_ino
+                      for path in snapshot(root)}
+            self.scrape('low_level_programming', root)
+            after = {path: os.stat(os.path.join(root, path)).st_ino
+                     for path in snapshot(root)}
+        self.assertEqual(before, after)
+
+    def test_edited_files_kept(self):
+        url = fixture_url('low_level_programming')
+        with tempfile.TemporaryDirectory() as root:
+            self.scrape('low_level_programming', root)
+            project = os.path.join(root, '0x04-more_functions_nested_loops')
+            expected = snapshot(root)
+            with open(os.path.join(project, 'README.md'), 'a') as ostream:
+                ostream.write('\nMy notes\n')
+            os.remove(os.path.join(project, '0-isupper.c'))
+            with contextlib.redirect_stdout(io.StringIO()):
+                project_data = scrapers.BaseParse(url,
+                                                  session=FixtureSession())
+                project_data.page_hash = 'changed'
+                create_dir(url, project_data=project_data, root=root)
+                create_doc(url, project_data=project_data, root=root)
+            files = snapshot(root)
+        readme = os.path.join('0x04-more_functions_nested_loops', 'README.md')
+        self.assertTrue(files.pop(readme).endswith('\nMy notes\n'))
+        expected.pop(readme)
+        self.assertEqual(files, expected)
+
+    def test_force(self):
+        url = fixture_url('low_level_programming')
+        with tempfile.TemporaryDirectory() as root:
+            self.scrape('low_level_programming', root)
+            project = os.path.join(root, '0x04-more_functions_nested_loops')
+            expected = snapshot(root)
+            with open(os.path.join(project, 'README.md'), 'a') as ostream:
+                ostream.write('\nMy notes\n')
+            with contextlib.redirect_stdout(io.StringIO()):
+                project_data = scrapers.BaseParse(url,
+                                                  session=FixtureSession())
+                project_data.page_hash = 'changed'
+                with self.assertLogs('hipposcraper', 'INFO') as logs:
+                    create_doc(url, project_data=project_data, root=root)
+                self.assertIn('Left the edited README alone', logs.output[-1])
+                create_doc(url, project_data=project_data, root=root,
+                           force=True)
+            self.assertEqual(snapshot(root), expected)
+
+    def test_missing_prototype(self):
+        url = fixture_url('higher_level_programming')
+        with contextlib.redirect_stdout(io.StringIO()):
+            project = scrapers.BaseParse(url, session=FixtureSession()).project
+        project = project._replace(files=('0-add.py', '1-sub.py'),
+                                   prototypes=('def add(a, b):',))
+        with tempfile.TemporaryDirectory() as root:
+            manifest = scrapers.Manifest(root)
+            scrapers.HighScraper(
+                project, root=scrapers.OutputDir(root, manifest)
+            ).write_files()
+            files = snapshot(root)
+        self.assertEqual(files, {
+            '0-add.py': '#!/usr/bin/python3\ndef add(a, b):',
+            '1-sub.py': '#!/usr/bin/python3\n',
+        })
+        self.assertEqual(sorted(manifest.files), sorted(files))
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Provide tests for IntranetSession against the stand-in intranet"""
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from . import FIXTURES, FixtureSession
+import hipposcraper
+from hipposcraper import scrapers
+from hipposcraper.config import Cookies
+from hipposcraper.standin import StandIn
+
+
+class TestIntranetSession(unittest.TestCase):
+    """Test IntranetSession"""
+
+    def setUp(self):
+        self.server = StandIn(FIXTURES).start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = scrapers.PageCache(self.tmp.name)
+        self.user_data = FixtureSession().user_data
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def session(self, **kwgs):
+        kwgs.setdefault('cache', self.cache)
+        return scrapers.IntranetSession(self.user_data,
+                                        base_url=self.server.base_url, **kwgs)
+
+    def fetch(self, session, url):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return session.fetch(url)
+
+    def test_login_once(self):
+        url = self.server.url('low_level_programming')
+        with open(os.path.join(FIXTURES, 'low_level_programming.html'),
+                  'rb') as istream:
+            expected = istream.read()
+        with self.session() as session:
+            self.assertEqual(self.fetch(session, url), expected)
+            self.assertEqual(self.fetch(session, url), expected)
+            self.assertEqual(session.logins, 1)
+        self.assertEqual(self.server.stats()['logins'], 1)
+
+    def test_login_once_concurrently(self):
+        urls = [self.server.url('interview', n) for n in range(16)]
+        with self.session(max_requests=8) as session:
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                pages = list(executor.map(
+                    lambda url: self.fetch(session, url), urls
+                ))
+        self.assertEqual(self.server.stats()['logins'], 1)
+        self.assertIn(b'0x00-lockboxes-15', pages[15])
+
+    def test_sign_in_again(self):
+        class Forget(set):
+            """Sessions the intranet forgets as soon as they start."""
+
+            def add(self, item):
+                pass
+
+        self.server.sessions = Forget()
+        url = self.server.url('interview')
+        with self.session() as session:
+            with self.assertRaises(scrapers.AuthError):
+                self.fetch(session, url)
+        self.assertIsNone(self.cache.load(url))
+
+    def test_bad_credentials(self):
+        self.user_data['holberton_password'] = 'wrong'
+        with self.session() as session:
+            with self.assertRaises(ValueError):
+                self.fetch(session, self.server.url('interview'))
+
+    def test_revalidate(self):
+        url = self.server.url('interview')
+        with self.session() as session:
+            first = self.fetch(session, url)
+            second = self.fetch(session, url)
+        self.assertEqual(first, second)
+        self.assertEqual(
+            self.server.stats()['requests'].get('GET /projects/* 304'), 1
+        )
+
+    def test_unwritable_cache(self):
+        path = os.path.join(self.tmp.name, 'file')
+        open(path, 'w').close()
+        url = self.server.url('interview')
+        with self.session(cache=scrapers.PageCache(path)) as session:
+            with self.assertLogs('hipposcraper', 'WARNING'):
+                self.assertIn(b'0x00-lockboxes', self.fetch(session, url))
+
+    def test_offline(self):
+        url = self.server.url('interview')
+        with self.session() as session:
+            content = self.fetch(session, url)
+        with self.session(offline=True) as session:
+            self.assertEqual(self.fetch(session, url), content)
+            with self.assertRaises(scrapers.FetchError):
+                self.fetch(session, self.server.url('webstack'))
+
+    def test_retry_errors(self):
+        self.server.error_rate = 0.5
+        urls = [self.server.url('interview', n) for n in range(8)]
+        with self.session(retries=30, backoff=0.001) as session:
+            for url in urls:
+                self.assertIn(b'0x00-lockboxes', self.fetch(session, url))
+        counts = self.server.stats()['requests']
+        self.assertTrue(any(key.endswith(('500', '502', '503'))
+                            for key in counts))
+
+    def test_timeout(self):
+        self.server.latency = 0.5
+        with self.session(timeout=(1.0, 0.05), retries=0) as session:
+            with self.assertRaises(ValueError):
+                self.fetch(session, self.server.url('interview'))
+
+    def test_not_found(self):
+        with self.session() as session:
+            with self.assertRaises(ValueError):
+                self.fetch(session, self.server.url('nonexistent'))
+
+    def test_retry_after(self):
+        resp = requests.Response()
+        with self.session() as session:
+            self.assertIsNone(session.retry_after(resp))
+            resp.headers['Retry-After'] = '2'
+            self.assertEqual(session.retry_after(resp), 2.0)
+            resp.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+            self.assertEqual(session.retry_after(resp), 0.0)
+            resp.headers['Retry-After'] = '3600'
+            self.assertEqual(session.retry_after(resp), session.max_backoff)
+            for attempt in range(10):
+                delay = session.backoff_delay(attempt)
+                self.assertLessEqual(delay, session.max_backoff)
+                self.assertGreaterEqual(
+                    delay, min(session.max_backoff,
+                               session.backoff * 2 ** attempt) / 2
+                )
+
+
+class TestCookies(unittest.TestCase):
+    """Test persisting session cookies between runs"""
+
+    def setUp(self):
+        self.server = StandIn(FIXTURES).start()
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(hipposcraper, 'CONFIG_HOME',
+                                    self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user_data = FixtureSession().user_data
+        self.url = self.server.url('interview')
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def fetch(self):
+        """Fetch a page in a new session persisting cookies."""
+        with scrapers.IntranetSession(self.user_data,
+                                      base_url=self.server.base_url,
+                                      cookie_store=Cookies()) as session:
+            with contextlib.redirect_stdout(io.StringIO()):
+                content = session.fetch(self.url)
+            return content, session.logins
+
+    def logins(self):
+        """Count the sign-in forms posted to the stand-in."""
+        return self.server.stats()['requests'].get('POST /auth/sign_in 302',
+                                                   0)
+
+    def test_reuse(self):
+        first, logins = self.fetch()
+        self.assertEqual(logins, 1)
+        self.assertTrue(os.path.isfile(Cookies().path))
+        second, logins = self.fetch()
+        self.assertEqual(logins, 0)
+        self.assertEqual(first, second)
+        self.assertEqual(self.logins(), 1)
+
+    def test_corrupt(self):
+        with open(Cookies().path, 'w') as ostream:
+            ostream.write('{not json')
+        content, logins = self.fetch()
+        self.assertIn(b'0x00-lockboxes', content)
+        self.assertEqual(logins, 1)
+        self.assertEqual(self.logins(), 1)
+
+    def test_expired(self):
+        self.fetch()
+        # The intranet forgets the session, as when it expires
+        self.server.sessions.clear()
+        content, logins = self.fetch()
+        self.assertIn(b'0x00-lockboxes', content)
+        self.assertEqual(logins, 1)
+        self.assertEqual(self.logins(), 2)
+
+    def test_expired_cookie(self):
+        self.fetch()
+        with open(Cookies().path, 'r') as istream:
+            cookies = json.load(istream)
+        for cookie in cookies:
+            cookie['expires'] = 1
+        with open(Cookies().path, 'w') as ostream:
+            json.dump(cookies, ostream)
+        content, logins = self.fetch()
+        self.assertIn(b'0x00-lockboxes', content)
+        self.assertEqual(logins, 1)
+        self.assertEqual(self.logins(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Provide tests for keeping startup light"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported only inside the functions that need them (see README.md)
+HEAVY = ('bs4', 'requests', 'urllib3', 'concurrent.futures', 'cProfile')
+
+CHECK = """
+import importlib, json, sys
+import hipposcraper
+for name in ('hippodir', 'hippodoc', 'hipposcraper', 'hippotest',
+             'hippocheck'):
+    sys.argv[1:] = ['--jobs', '4', 'https://intranet.hbtn.io/projects/1']
+    importlib.import_module('hipposcraper.' + name).parse_args()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+class TestStartup(unittest.TestCase):
+    """Test that heavy modules are imported only when needed"""
+
+    def loaded(self, code):
+        """Get the modules imported by code run in a fresh interpreter."""
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        out = subprocess.run([sys.executable, '-c', code], env=env,
+                             check=True, stdout=subprocess.PIPE).stdout
+        return set(json.loads(out))
+
+    def test_import(self):
+        loaded = self.loaded(CHECK)
+        for name in HEAVY:
+            with self.subTest(module=name):
+                self.assertNotIn(name, loaded)
+
+    def test_scrapers(self):
+        from hipposcraper import scrapers
+        self.assertIn('BaseParse', dir(scrapers))
+        self.assertIs(scrapers.OutputDir, scrapers.output_dir.OutputDir)
+        with self.assertRaises(AttributeError):
+            scrapers.NoSuchScraper
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Provide tests for cutting test files out of examples"""
+import unittest
+
+from hipposcraper.scrapers.test_file_scraper import find_test_file
+
+PROMPT = 'bob@ubuntu:~/0x00-project$ '
+
+
+class TestFindTestFile(unittest.TestCase):
+    """Test cutting test files out of examples"""
+
+    def test_languages(self):
+        expected = {
+            'main.c': ('0-main.c', '#include "main.h"\nint main(void)\n'),
+            'sql': ('0-main.sql', 'SELECT 1;\n'),
+            'js': ('0-main.js', 'console.log(1);\n'),
+            'py': ('0-main.py', '#!/usr/bin/python3\nprint(1)\n'),
+        }
+        for language, (name, text) in expected.items():
+            example = '{0}cat {1}\n{2}{0}./{1}\n1\n{0}\n'.format(
+                PROMPT, name, text
+            )
+            with self.subTest(language=language):
+                self.assertEqual(find_test_file(example), (name, text))
+
+    def test_precedence(self):
+        example = '{0}cat 0-main.c\nint main(void);\n{0}./a.py b.js\n'.format(
+            PROMPT
+        )
+        self.assertEqual(find_test_file(example),
+                         ('0-main.c', 'int main(void);\n'))
+
+    def test_html(self):
+        example = ('{0}cat 3-index.html\n<html>\n<script src="3-main.js">'
+                   '</script>\n</html>\n{0}\n').format(PROMPT)
+        self.assertEqual(find_test_file(example), (
+            '3-index.html',
+            '<html>\n<script src="3-main.js"></script>\n</html>',
+        ))
+
+    def test_html_name(self):
+        # A name holding another extension keeps it before ".html"
+        example = ('{0}cat 1-index.py.html\n<p>1</p>\n{0}cat 1-index.html\n'
+                   '{0}\n').format(PROMPT)
+        self.assertEqual(find_test_file(example),
+                         ('1-index.py.html', '<p>1</p>'))
+
+    def test_not_a_test_file(self):
+        for example in ('{0}./0-main.py\nok\n{0}\n'.format(PROMPT),
+                        '{0}cat notes.txt\nhello\n{0}\n'.format(PROMPT)):
+            with self.subTest(example=example):
+                self.assertIsNone(find_test_file(example))
+
+    def test_malformed(self):
+        for example in ('$ cat 0-main.py\nprint(1)\n$\n',
+                        '{0}catch 0-main.py'.format(PROMPT),
+                        '{0}cat 0-main.py'.format(PROMPT)):
+            with self.subTest(example=example):
+                with self.assertRaises(ValueError):
+                    find_test_file(example)
+
+
+if __name__ == '__main__':
+    unittest.main()